@@ -7,3 +7,8 @@ class ArticleConfig(AppConfig):
     def ready(self):
         # noinspection PyUnresolvedReferences
         from article.signals import generate_article_slug
+
+        from django.conf import settings
+        from clarent.clarent import Clarent
+
+        Clarent.use(settings.CLARENT_ENGINE)
@@ -0,0 +1,142 @@
+"""
+Batch creation of Articles for POST api/articles/bulk/ - every check the
+create view does one Article at a time (slug uniqueness, topic existence)
+is done for the whole batch with one query, the Articles are inserted
+with bulk_create, tagged with article.tagging and either given their
+cached objectivity or queued for scoring all at once.
+
+bulk_create doesn't send pre_save or post_save so everything the Article
+signals would have done is done here for the whole batch instead - and
+articles_created is sent for whatever else has to know about them. The
+Articles are tagged without sending m2m_changed once per Article too -
+the receivers of articles_created take care of their tags.
+"""
+import typing
+
+from django.db import transaction
+from django.utils.text import slugify
+
+from topic.models import Topic
+from article.models import Article
+from article.signals import articles_created
+from article.tagging import add_tags, parse_tags
+from article.scoring import cached_objectivities, enqueue_many, save_breakdowns
+
+MAX_BATCH_SIZE = 500
+
+REQUIRED_FIELDS = ('title', 'content', 'topic_id', 'tags', 'thumbnail_url')
+
+Result = typing.Dict[str, typing.Any]
+
+
+def error(status: int, detail: str) -> Result:
+    return {'status': status, 'detail': detail}
+
+
+def validate(item: typing.Any) -> typing.Union[Article, Result]:
+    """
+    Turns an item of the batch into an (unsaved) Article - or
+    into the error Result of whatever is wrong with it.
+    """
+    if not isinstance(item, dict):
+        return error(422, 'Expected an object.')
+
+    # Same rules as the create view's - only the
+    # title and thumbnail url can't be empty.
+    for field in REQUIRED_FIELDS:
+        if field not in item or (field in ('title', 'thumbnail_url') and not item[field]):
+            return error(422, f"Field '{field}' not provided.")
+
+    title, content, tags = item['title'], item['content'], item['tags']
+    if not isinstance(title, str) or not isinstance(content, str):
+        return error(422, 'Title and content have to be strings.')
+    if len(title) > Article._meta.get_field('title').max_length:
+        return error(422, 'Title is too long.')
+
+    if isinstance(tags, list) and all(isinstance(tag, str) for tag in tags):
+        tags = ','.join(tags)
+    if not isinstance(tags, str):
+        return error(422, 'Tags have to be a comma separated string or a list of strings.')
+
+    try:
+        topic_id = int(item['topic_id'])
+    except (TypeError, ValueError):
+        return error(422, 'Invalid value for topic_id provided.')
+
+    article = Article(
+        title=title,
+        content=content,
+        topic_id=topic_id,
+        slug=slugify(title),
+        draft=bool(item.get('draft')),
+        thumbnail_url=item['thumbnail_url'],
+    )
+    article.tag_names = parse_tags(tags)
+    return article
+
+
+def create_articles(items: typing.Sequence[typing.Any], author_id: int) -> typing.List[Result]:
+    """
+    Creates the valid Articles of a batch and returns a Result - with
+    the status the create view would have responded with - per item.
+    """
+    results: typing.List[typing.Optional[Result]] = [None] * len(items)
+    articles: typing.Dict[int, Article] = {}
+
+    for index, item in enumerate(items):
+        article = validate(item)
+        if isinstance(article, Article):
+            articles[index] = article
+        else:
+            results[index] = article
+
+    taken = set(Article.objects.filter(
+        slug__in={article.slug for article in articles.values()}
+    ).values_list('slug', flat=True))
+    topics = set(Topic.objects.filter(
+        pk__in={article.topic_id for article in articles.values()}
+    ).values_list('pk', flat=True))
+
+    for index, article in list(articles.items()):
+        if article.slug in taken:
+            results[index] = error(409, f"Article with title '{article.title}' exists.")
+        elif article.topic_id not in topics:
+            results[index] = error(404, 'Topic not found.')
+        else:
+            # Later items of the batch with the same
+            # title clash with the first one of them.
+            taken.add(article.slug)
+            continue
+        del articles[index]
+
+    new = list(articles.values())
+    scores = cached_objectivities([article.content for article in new])
+    for article, score in zip(new, scores):
+        article.author_id = author_id
+        article.objectivity = None if score is None else score[0]
+        article.summarize()
+
+    with transaction.atomic():
+        Article.objects.bulk_create(new)
+
+        # Not every database hands back the ids of
+        # bulk inserted rows - slugs are unique too.
+        ids = dict(Article.objects.filter(
+            slug__in=[article.slug for article in new]
+        ).values_list('slug', 'pk'))
+        for article in new:
+            article.pk = ids[article.slug]
+
+        add_tags(((article, article.tag_names) for article in new), signals=False)
+
+        save_breakdowns(
+            (article.pk, score[1]) for article, score in zip(new, scores) if score is not None
+        )
+        enqueue_many(article.pk for article in new if article.pending)
+
+        articles_created.send(sender=Article, articles=new)
+
+    for index, article in articles.items():
+        results[index] = {'status': 201, 'slug': article.slug}
+
+    return results
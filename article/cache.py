@@ -0,0 +1,103 @@
+"""
+Cache of rendered Articles - the detail view serves them straight from
+the cache (Redis in production) so hot Articles never touch the database.
+
+Entries are keyed by slug and VERSION and are deleted by the signals in
+article/signals.py whenever anything they were serialized from changes -
+the Article itself, its tags, its Author or its Topic - along with the
+RenderedArticles they were rendered from (read article.rendering) and the
+buffer of recent Articles they're in (read article.recent). Updates
+that don't send signals (QuerySet.update, bulk_update) have to call
+forget_articles.
+"""
+import typing
+import hashlib
+import threading
+import contextlib
+
+from django.conf import settings
+from django.db import transaction
+from django.core.cache import cache
+
+from article import recent
+from article.models import Article, RenderedArticle
+
+# Bump whenever the output of ArticleDetailSerializer
+# changes so that representations cached in the old
+# shape are never served again.
+VERSION = 3
+
+
+def detail_key(slug: str) -> str:
+    return f'article:detail:{VERSION}:{slug}'
+
+
+def cached_detail(slug: str) -> typing.Optional[typing.Tuple[str, str]]:
+    """
+    Returns the (version, json) of a cached Article - the version is a
+    digest of the JSON that the detail view builds its ETag from.
+    """
+    return cache.get(detail_key(slug))
+
+
+def cache_detail(slug: str, json: str) -> typing.Tuple[str, str]:
+    json = str(json)
+    version = hashlib.sha1(json.encode()).hexdigest()
+    cache.set(detail_key(slug), (version, json), timeout=settings.ARTICLE_CACHE_TTL)
+    return version, json
+
+
+# Slugs forgotten inside of a batch block.
+_batch = threading.local()
+
+
+@contextlib.contextmanager
+def batch():
+    """
+    Forgets all the Articles forget is called with inside of the block
+    at once when it's done - for code that changes lots of Articles one
+    signal at a time (like tagging Articles in bulk).
+    """
+    if getattr(_batch, 'slugs', None) is not None:
+        yield
+        return
+
+    _batch.slugs = set()
+    try:
+        yield
+    finally:
+        slugs, _batch.slugs = _batch.slugs, None
+        forget(slugs)
+
+
+def forget(slugs: typing.Iterable[str]) -> None:
+    """
+    Deletes the cached (and rendered) representations of some Articles -
+    right away and once more after the transaction commits, since a request
+    could have cached what it read before the changes were committed.
+    """
+    slugs = [slug for slug in set(slugs) if slug]
+    if not slugs:
+        return
+
+    if getattr(_batch, 'slugs', None) is not None:
+        _batch.slugs.update(slugs)
+        return
+
+    def delete():
+        cache.delete_many([detail_key(slug) for slug in slugs])
+        RenderedArticle.objects.filter(article__slug__in=slugs).delete()
+
+    delete()
+    transaction.on_commit(delete)
+
+    # The buffer of recent Articles is rendered again
+    # once the changes can be read (read article.recent).
+    transaction.on_commit(lambda: recent.refresh(slugs))
+
+
+def forget_articles(**lookups) -> None:
+    """
+    Forgets every Article that matches some lookups, like author_id=1.
+    """
+    forget(Article.objects.filter(**lookups).values_list('slug', flat=True))
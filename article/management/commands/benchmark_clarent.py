@@ -0,0 +1,88 @@
+"""
+Benchmarks Clarent's engines (read clarent/benchmark.py) on generated
+Articles from 1 KB to 1 MB - docs/sec, MB/sec, p50/p99 latency and
+peak memory for every engine and batch size. Nothing is read from or
+written to the database -
+
+    python manage.py benchmark_clarent
+    python manage.py benchmark_clarent --engine lexicon --size 1024 --size 1048576
+
+Save a run as the baseline with --save-baseline and later runs given the
+same --baseline file fail when the throughput of any benchmark regressed
+by more than --threshold percent. Baselines depend on the machine that
+ran them so they aren't committed anywhere.
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from clarent.clarent import ENGINES
+from clarent.benchmark import MB, SIZES, BATCH_SIZES, benchmark, regressions
+
+
+class Command(BaseCommand):
+
+    help = "Benchmarks Clarent's engines on generated Articles of growing sizes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--engine', action='append', choices=sorted(ENGINES),
+            help='Engine to benchmark (can be repeated). Defaults to all of them.'
+        )
+        parser.add_argument(
+            '--size', action='append', type=int,
+            help='Document size in bytes (can be repeated). Defaults to 1 KB to 1 MB.'
+        )
+        parser.add_argument(
+            '--batch-size', action='append', type=int,
+            help='Documents scored per call (can be repeated). Defaults to 1 and 16.'
+        )
+        parser.add_argument(
+            '--budget', type=int, default=2 * MB,
+            help='Bytes of text to score per benchmark.'
+        )
+        parser.add_argument(
+            '--processes', type=int, default=1,
+            help='Processes score_many may use.'
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Seed of the generated corpora.'
+        )
+        parser.add_argument(
+            '--baseline',
+            help='JSON file of a previous run to compare against.'
+        )
+        parser.add_argument(
+            '--save-baseline', action='store_true',
+            help='Write the results of this run to --baseline instead of comparing.'
+        )
+        parser.add_argument(
+            '--threshold', type=float, default=10.0,
+            help='Percentage of lost throughput that counts as a regression.'
+        )
+
+    def handle(self, *args, **options):
+        if options['save_baseline'] and not options['baseline']:
+            raise CommandError('--save-baseline needs a --baseline file to write to.')
+
+        results = benchmark(
+            options['engine'] or sorted(ENGINES), options['size'] or SIZES,
+            options['batch_size'] or BATCH_SIZES, options['budget'], options['processes'],
+            options['seed'], out=self.stdout
+        )
+
+        if not options['baseline']:
+            return
+
+        if options['save_baseline']:
+            with open(options['baseline'], 'w') as baseline:
+                json.dump(results, baseline, indent=2, sort_keys=True)
+            self.stdout.write(f'Saved baseline to {options["baseline"]}.')
+            return
+
+        with open(options['baseline']) as baseline:
+            failures = regressions(results, json.load(baseline), options['threshold'])
+
+        if failures:
+            raise CommandError('\n'.join(failures))
@@ -0,0 +1,150 @@
+"""
+Benchmarks the list serializers against their fast paths (read
+backend/fast.py) - rows/sec and the peak memory allocated while
+serializing and rendering every row of a list of Articles, Topics
+and Authors. The rows are generated inside of a transaction that's
+rolled back afterwards so the database is left as it was -
+
+    python manage.py benchmark_serializers
+    python manage.py benchmark_serializers --rows 1000 --repeat 5
+
+Both ways of serializing have to render the exact same bytes - the
+benchmark fails if they don't.
+"""
+import time
+import typing
+import statistics
+import tracemalloc
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+
+from taggit.models import Tag, TaggedItem
+from rest_framework.renderers import JSONRenderer
+
+from topic.models import Topic
+from author.models import Author
+from article.models import Article
+from backend.fast import FastSerializer
+from article.serializers import ArticleListSerializer, FastArticleListSerializer
+from topic.serializers import TopicListSerializer, FastTopicListSerializer
+from author.serializers import AuthorListSerializer, FastAuthorListSerializer
+
+MB = 1024 * 1024
+
+TAGS = 50
+TAGS_PER_ARTICLE = 3
+
+BENCHMARKS: typing.Dict[str, typing.Tuple[typing.Callable[[], QuerySet], type, typing.Type[FastSerializer]]] = {
+    'articles': (lambda: Article.objects.filter(draft=False).for_listing(),
+                 ArticleListSerializer, FastArticleListSerializer),
+    'topics': (lambda: Topic.objects.all(), TopicListSerializer, FastTopicListSerializer),
+    'authors': (lambda: Author.objects.order_by('pk'), AuthorListSerializer, FastAuthorListSerializer),
+}
+
+
+def generate(rows: int) -> None:
+    """
+    Bulk creates rows Authors, Topics and Articles (with
+    TAGS_PER_ARTICLE tags each) without sending any signals.
+    """
+    authors = Author.objects.bulk_create(
+        Author(username=f'benchmark-{number}', first_name=f'Benchmark {number}', email=f'{number}@benchmark.com')
+        for number in range(rows)
+    )
+    authors = list(Author.objects.filter(username__startswith='benchmark-').order_by('pk'))
+
+    Topic.objects.bulk_create(
+        Topic(name=f'Benchmark Topic {number}', slug=f'benchmark-topic-{number}',
+              description='Generated by benchmark_serializers.', author=authors[number])
+        for number in range(rows)
+    )
+    topics = list(Topic.objects.filter(slug__startswith='benchmark-topic-').order_by('pk'))
+
+    Article.objects.bulk_create(
+        Article(title=f'Benchmark Article {number}', slug=f'benchmark-article-{number}',
+                content='Generated by benchmark_serializers.', excerpt='Generated by benchmark_serializers.',
+                word_count=3, reading_time=1, topic=topics[number], author=authors[number], draft=False,
+                objectivity=None if number % 2 else 0.5)
+        for number in range(rows)
+    )
+    articles = Article.objects.filter(slug__startswith='benchmark-article-').values_list('pk', flat=True)
+
+    tags = Tag.objects.bulk_create(Tag(name=f'benchmark-{number}', slug=f'benchmark-{number}') for number in range(TAGS))
+    tags = list(Tag.objects.filter(slug__startswith='benchmark-').values_list('pk', flat=True))
+
+    content_type = ContentType.objects.get_for_model(Article)
+    TaggedItem.objects.bulk_create(
+        TaggedItem(content_type=content_type, object_id=pk, tag_id=tags[(pk + offset) % len(tags)])
+        for pk in articles for offset in range(TAGS_PER_ARTICLE)
+    )
+
+
+def serialize(queryset: typing.Callable[[], QuerySet], serializer_class: type) -> bytes:
+    return JSONRenderer().render(serializer_class(queryset(), many=True).data)
+
+
+def serialize_fast(queryset: typing.Callable[[], QuerySet], serializer_class: typing.Type[FastSerializer]) -> bytes:
+    serializer = serializer_class()
+    return JSONRenderer().render(serializer.data(serializer.values(queryset())))
+
+
+class Command(BaseCommand):
+
+    help = 'Times the list serializers against their values() driven fast paths.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, default=10000,
+            help='Number of Articles, Topics and Authors to generate.'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=3,
+            help='Number of times every list is serialized - the median is reported.'
+        )
+
+    def run(self, function: typing.Callable[[], bytes], repeat: int) -> typing.Tuple[float, float, bytes]:
+        """
+        Returns the median time of a function, the peak
+        memory it allocated (in MB) and what it returned.
+        """
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - started)
+
+        # Memory is measured in a run of its own
+        # since tracing slows everything down.
+        tracemalloc.start()
+        rendered = function()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return statistics.median(timings), peak / MB, rendered
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'{"benchmark":<20} {"rows":>8} {"rows/s":>12} {"peak MB":>10} {"speedup":>8}')
+
+        with transaction.atomic():
+            generate(options['rows'])
+
+            for name, (queryset, serializer_class, fast_serializer_class) in BENCHMARKS.items():
+                rows = queryset().count()
+                slow, slow_peak, expected = self.run(lambda: serialize(queryset, serializer_class), options['repeat'])
+                fast, fast_peak, rendered = self.run(
+                    lambda: serialize_fast(queryset, fast_serializer_class), options['repeat']
+                )
+
+                if rendered != expected:
+                    transaction.set_rollback(True)
+                    raise CommandError(f'{fast_serializer_class.__name__} rendered different JSON '
+                                       f'than {serializer_class.__name__}.')
+
+                self.stdout.write(f'{name + "/serializer":<20} {rows:>8} {rows / slow:>12.0f} {slow_peak:>10.2f}')
+                self.stdout.write(f'{name + "/fast":<20} {rows:>8} {rows / fast:>12.0f} '
+                                  f'{fast_peak:>10.2f} {slow / fast:>7.1f}x')
+
+            transaction.set_rollback(True)
@@ -0,0 +1,77 @@
+import time
+import typing
+import statistics
+
+from django.db.models import Count, QuerySet
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.contenttypes.models import ContentType
+
+from taggit.models import TaggedItem
+
+from article.models import Article
+
+
+def chained(tags: typing.List[str]) -> QuerySet:
+    """
+    The way ArticlesSortedByTagsAPIView used to filter by tags -
+    one join through TaggedItem (and a DISTINCT) per tag.
+    """
+    articles = Article.objects.filter(draft=False)
+    for tag in tags:
+        articles = articles.filter(tags__name__in=[tag]).distinct()
+    return articles
+
+
+STRATEGIES: typing.Dict[str, typing.Callable[[typing.List[str]], QuerySet]] = {
+    'chained': chained,
+    'all': lambda tags: Article.objects.filter(draft=False).tagged(tags, 'all'),
+    'any': lambda tags: Article.objects.filter(draft=False).tagged(tags, 'any'),
+}
+
+
+class Command(BaseCommand):
+
+    help = 'Times the Article tag filters against the current database for a growing number of tags.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-tags', type=int, default=6,
+            help='Benchmark from 1 up to this many tags (the most used ones).'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20,
+            help='Number of times every query is run - the median is reported.'
+        )
+        parser.add_argument(
+            '--page-size', type=int, default=10,
+            help='Number of Articles fetched per query, like a page of the tags endpoint.'
+        )
+
+    def time(self, queryset: QuerySet, repeat: int, page_size: int) -> float:
+        queryset = queryset.order_by('-created_on', '-pk').values_list('pk', flat=True)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(queryset[:page_size])
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings) * 1000
+
+    def handle(self, *args, **options):
+
+        tags: typing.List[str] = list(
+            TaggedItem.objects.filter(content_type=ContentType.objects.get_for_model(Article))
+            .values('tag__name').annotate(uses=Count('pk')).order_by('-uses', 'tag__name')
+            .values_list('tag__name', flat=True)[:options['max_tags']]
+        )
+
+        if not tags:
+            raise CommandError('No Article has been tagged yet.')
+
+        self.stdout.write(f'{"tags":>4} ' + ' '.join(f'{name + " ms":>12}' for name in STRATEGIES))
+
+        for count in range(1, len(tags) + 1):
+            timings = [
+                self.time(strategy(tags[:count]), options['repeat'], options['page_size'])
+                for strategy in STRATEGIES.values()
+            ]
+            self.stdout.write(f'{count:>4} ' + ' '.join(f'{timing:>12.3f}' for timing in timings))
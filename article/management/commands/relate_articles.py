@@ -0,0 +1,63 @@
+"""
+Computes the related Articles (read article.related) of every published
+Article from scratch - run it once to fill the table and whenever the
+lists drifted too far from what a fresh build would give. Only the
+article × feature matrix and one batch of similarities are ever in
+memory at a time. With --queue it drains the queue of Articles that were
+published, tagged or moved to another Topic instead, like score_articles -
+
+    python manage.py relate_articles
+    python manage.py relate_articles --batch-size 200
+    python manage.py relate_articles --queue
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from article.related import build, drain
+
+
+class Command(BaseCommand):
+
+    help = 'Precomputes the related Articles of every published Article.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int,
+            help='Number of Articles to compute and write the lists of at a time '
+                 '(500 for a build, 100 per transaction for the queue).'
+        )
+        parser.add_argument(
+            '--queue', action='store_true',
+            help='Drain the queue of Articles to relate instead of building every list.'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5.0,
+            help='Seconds to wait before polling an empty queue again.'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Exit as soon as the queue is empty instead of polling.'
+        )
+
+    def handle(self, *args, **options):
+        if options['queue']:
+            self.drain(options['batch_size'] or 100, options['interval'], options['once'])
+            return
+
+        started = time.perf_counter()
+
+        total = build(options['batch_size'] or 500, lambda done: self.stdout.write(f'Related {done} article(s).'))
+
+        self.stdout.write(f'Related {total} article(s) in {time.perf_counter() - started:.1f}s.')
+
+    def drain(self, batch_size: int, interval: float, once: bool) -> None:
+        while True:
+            related = drain(batch_size)
+
+            if related:
+                self.stdout.write(f'Related {related} queued article(s).')
+            elif once:
+                break
+            else:
+                time.sleep(interval)
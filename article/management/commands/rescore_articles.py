@@ -0,0 +1,103 @@
+import time
+import typing
+
+from django.db import transaction
+from django.utils import timezone
+from django.core.management.base import BaseCommand, CommandError
+
+from article.models import Article
+from article.cache import forget_articles
+from article.scoring import objectivities, save_breakdowns
+
+
+class Command(BaseCommand):
+
+    help = 'Recomputes the objectivity of every Article - run it whenever Clarent changes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Number of Articles to score and write back at a time.'
+        )
+        parser.add_argument(
+            '--processes', type=int, default=None,
+            help='Number of processes to score with (defaults to the number of CPUs).'
+        )
+        parser.add_argument(
+            '--start-after', type=int, default=0,
+            help='Only rescore Articles with a primary key greater than this one.'
+        )
+        parser.add_argument(
+            '--checkpoint', default=None,
+            help='File to resume from and to record the last rescored primary key in.'
+        )
+
+    @staticmethod
+    def read_checkpoint(path: str) -> int:
+        try:
+            with open(path) as checkpoint:
+                return int(checkpoint.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+        except ValueError:
+            raise CommandError(f"Checkpoint '{path}' is corrupted.")
+
+    @staticmethod
+    def write_checkpoint(path: str, pk: int) -> None:
+        with open(path, 'w') as checkpoint:
+            checkpoint.write(str(pk))
+
+    def handle(self, *args, **options):
+
+        batch_size = options['batch_size']
+        checkpoint = options['checkpoint']
+
+        last_pk = options['start_after']
+        if checkpoint:
+            last_pk = max(last_pk, self.read_checkpoint(checkpoint))
+
+        total = Article.objects.filter(pk__gt=last_pk).count()
+        self.stdout.write(f'Rescoring {total} article(s) after id {last_pk}.')
+
+        done, started = 0, time.monotonic()
+
+        while True:
+            # Walks the table by primary key, one batch at a time,
+            # rather than with QuerySet.iterator() since MySQL can't
+            # stream a result set - this way only batch_size rows of
+            # (id, content) are ever held in memory.
+            rows: typing.List[typing.Tuple[int, str]] = list(
+                Article.objects.filter(pk__gt=last_pk).order_by('pk').values_list(
+                    'pk', 'content'
+                )[:batch_size]
+            )
+
+            if not rows:
+                break
+
+            scores = objectivities([content for _, content in rows], options['processes'])
+
+            # bulk_update doesn't touch changed_on on its own - it's
+            # what the ETags of lists of Articles are built from.
+            now = timezone.now()
+            with transaction.atomic():
+                Article.objects.bulk_update(
+                    [Article(pk=pk, objectivity=objectivity, changed_on=now)
+                     for (pk, _), (objectivity, _) in zip(rows, scores)],
+                    ['objectivity', 'changed_on']
+                )
+                save_breakdowns((pk, breakdown) for (pk, _), (_, breakdown) in zip(rows, scores))
+                forget_articles(pk__in=[pk for pk, _ in rows])
+
+            last_pk = rows[-1][0]
+            done += len(rows)
+
+            if checkpoint:
+                self.write_checkpoint(checkpoint, last_pk)
+
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f'{done}/{total} article(s) rescored ({done / elapsed:.1f}/s) - last id {last_pk}.'
+            )
+
+        self.stdout.write(f'Done in {time.monotonic() - started:.1f}s.')
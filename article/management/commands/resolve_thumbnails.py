@@ -0,0 +1,48 @@
+"""
+Resolves the thumbnails (read backend/thumbnails.py) of every Article
+and Topic again and writes back the ones that changed in bulk - run it
+after changing the Cloudinary configuration or updating thumbnails
+without saving -
+
+    python manage.py resolve_thumbnails
+    python manage.py resolve_thumbnails --batch-size 5000
+"""
+from django.utils import timezone
+from django.core.management.base import BaseCommand
+
+from topic.models import Topic
+from article.models import Article
+from article.cache import forget_articles
+from backend.thumbnails import BATCH_SIZE, backfill
+
+
+class Command(BaseCommand):
+
+    help = 'Backfills the stored thumbnail URLs of every Article and Topic.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=BATCH_SIZE,
+            help='Number of rows to resolve and write back at a time.'
+        )
+
+    def handle(self, *args, **options):
+
+        for model in (Article, Topic):
+            changed = 0
+            for pks in backfill(model, options['batch_size']):
+                if not pks:
+                    continue
+                changed += len(pks)
+
+                # The ETags of whatever they're served in change
+                # too and rendered Articles are rendered again. It's
+                # changed_on for Articles since updated_on is the
+                # date they're published with - Topics never show
+                # theirs (read ArticleQuerySet.versions).
+                field = 'changed_on' if model is Article else 'updated_on'
+                model.objects.filter(pk__in=pks).update(**{field: timezone.now()})
+                if model is Article:
+                    forget_articles(pk__in=pks)
+
+            self.stdout.write(f'Resolved {changed} {model._meta.verbose_name_plural} again.')
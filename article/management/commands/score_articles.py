@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from article.scoring import drain
+
+
+class Command(BaseCommand):
+
+    help = 'Drains the Clarent objectivity scoring queue.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=50,
+            help='Number of queued Articles to score per transaction.'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5.0,
+            help='Seconds to wait before polling an empty queue again.'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Exit as soon as the queue is empty instead of polling.'
+        )
+
+    def handle(self, *args, **options):
+
+        while True:
+            scored = drain(options['batch_size'])
+
+            if scored:
+                self.stdout.write(f'Scored {scored} article(s).')
+            elif options['once']:
+                break
+            else:
+                time.sleep(options['interval'])
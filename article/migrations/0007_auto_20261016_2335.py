@@ -0,0 +1,31 @@
+# Generated by Django 3.2.25 on 2026-10-16 23:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0006_auto_20191204_0130'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='objectivity',
+            field=models.FloatField(blank=True, default=None, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='ObjectivityJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('queued_on', models.DateTimeField(default=django.utils.timezone.now)),
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='objectivity_job', to='article.article')),
+            ],
+            options={
+                'ordering': ('queued_on', 'pk'),
+            },
+        ),
+    ]
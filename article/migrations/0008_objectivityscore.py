@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-16 23:36
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0007_auto_20261016_2335'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ObjectivityScore',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('objectivity', models.FloatField()),
+                ('last_used', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
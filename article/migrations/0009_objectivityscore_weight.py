@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-16 23:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0008_objectivityscore'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='objectivityscore',
+            name='weight',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
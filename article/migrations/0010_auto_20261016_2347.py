@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-16 23:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0009_objectivityscore_weight'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='objectivityscore',
+            name='sentences',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.CreateModel(
+            name='ObjectivityBreakdown',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sentences', models.BinaryField(default=b'')),
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='objectivity_breakdown', to='article.article')),
+            ],
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 3.2.25 on 2026-10-16 23:48
+
+import math
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+def summarize_articles(apps, schema_editor):
+    """
+    Backfills the excerpt, word count and reading time of the existing
+    Articles the same way Article.summarize does, a batch at a time.
+    """
+    Article = apps.get_model('article', 'Article')
+
+    last_pk = 0
+    while True:
+        rows = list(
+            Article.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', 'content')[:500]
+        )
+        if not rows:
+            break
+
+        articles = []
+        for pk, content in rows:
+            word_count = len(content.split())
+            articles.append(Article(
+                pk=pk,
+                excerpt=Truncator(content).words(20, truncate=' …'),
+                word_count=word_count,
+                reading_time=math.ceil(word_count / 200),
+            ))
+        Article.objects.bulk_update(articles, ['excerpt', 'word_count', 'reading_time'])
+
+        last_pk = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0010_auto_20261016_2347'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='excerpt',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(summarize_articles, migrations.RunPython.noop),
+    ]
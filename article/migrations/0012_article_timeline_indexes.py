@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-16 23:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0011_article_summary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-created_on', '-id'], name='article_timeline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['topic', '-created_on', '-id'], name='article_topic_timeline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', '-created_on', '-id'], name='article_author_timeline_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-17 00:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0012_article_timeline_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RenderedArticle',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('form', models.CharField(choices=[('listing', 'Listing'), ('detail', 'Detail')], max_length=16)),
+                ('version', models.PositiveSmallIntegerField()),
+                ('json', models.TextField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renderings', to='article.article')),
+            ],
+            options={
+                'unique_together': {('article', 'form', 'version')},
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.2.25 on 2026-10-17 00:40
+
+import backend.thumbnails
+from django.db import migrations
+
+
+def resolve_thumbnails(apps, schema_editor):
+    """
+    Backfills the resolved thumbnails of the existing Articles the same
+    way ThumbnailURLField does (the URL of the Cloudinary thumbnail or
+    else the thumbnail_url), a batch at a time.
+    """
+    Article = apps.get_model('article', 'Article')
+
+    last_pk = 0
+    while True:
+        rows = list(
+            Article.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', 'thumbnail', 'thumbnail_url')[:500]
+        )
+        if not rows:
+            break
+
+        articles = [
+            Article(pk=pk, resolved_thumbnail=thumbnail.url if thumbnail else thumbnail_url)
+            for pk, thumbnail, thumbnail_url in rows
+        ]
+        Article.objects.bulk_update(articles, ['resolved_thumbnail'])
+
+        last_pk = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0014_relatedarticle'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='resolved_thumbnail',
+            field=backend.thumbnails.ThumbnailURLField(blank=True, editable=False, max_length=500, null=True),
+        ),
+        migrations.RunPython(resolve_thumbnails, migrations.RunPython.noop),
+    ]
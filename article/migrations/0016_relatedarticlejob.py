@@ -0,0 +1,26 @@
+# Generated by Django 3.2.25 on 2026-10-17 01:03
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0015_resolved_thumbnail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedArticleJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('queued_on', models.DateTimeField(default=django.utils.timezone.now)),
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='related_job', to='article.article')),
+            ],
+            options={
+                'ordering': ('queued_on', 'pk'),
+            },
+        ),
+    ]
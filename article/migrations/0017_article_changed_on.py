@@ -0,0 +1,26 @@
+# Generated by Django 3.2.25 on 2026-10-17 14:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def copy_updated_on(apps, schema_editor):
+    Article = apps.get_model('article', 'Article')
+    Article.objects.update(changed_on=models.F('updated_on'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0016_relatedarticlejob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='changed_on',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_updated_on, migrations.RunPython.noop),
+    ]
@@ -1,16 +1,22 @@
 """
 Article model definition.
 """
+import math
 import typing
 import logging
 
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from django.utils.text import Truncator
+from django.contrib.contenttypes.models import ContentType
 
 from topic.models import Topic
-from backend.utils import replace
+from backend.conditional import Fingerprint
+from backend.thumbnails import ThumbnailURLField, resolved_fields
+from article.tagging import add_tags, parse_tags
 
+from taggit.models import TaggedItem
 from taggit.managers import TaggableManager
 from cloudinary.models import CloudinaryField
 
@@ -18,7 +24,62 @@ from cloudinary.models import CloudinaryField
 logger = logging.getLogger(__name__)
 
 
-class ArticleManager(models.Manager):
+# Ways of matching Articles against a list of
+# tags - read ArticleQuerySet.tagged.
+TAG_MATCHES = ('all', 'any')
+
+
+class ArticleQuerySet(models.QuerySet):
+
+    def for_listing(self) -> 'ArticleQuerySet':
+        """
+        Everything ArticleListSerializer needs in a constant number of
+        queries - topics and authors are joined in, the names of the tags
+        of the whole page are prefetched in one more query and the content
+        (which lists only ever show the stored excerpt of) isn't loaded.
+        """
+        return self.defer('content').select_related('topic', 'author').prefetch_related('tags')
+
+    def tagged(self, tags: typing.Iterable[str], match: str = 'all') -> 'ArticleQuerySet':
+        """
+        Articles tagged with all (or with any, for match='any') of the
+        given tag names. It's a single semi-join on taggit's TaggedItem
+        table - for 'all' grouped by Article and kept only if every one of
+        the tags matched - instead of one join (and DISTINCT) per tag.
+        Names are matched case insensitively, like the tag index does.
+        """
+        tags = {tag.strip().lower() for tag in tags}
+        if match not in TAG_MATCHES:
+            raise ValueError(f"Unknown tag match '{match}'.")
+        if not tags:
+            return self.none()
+
+        names = models.Q()
+        for tag in tags:
+            names |= models.Q(tag__name__iexact=tag)
+        items = TaggedItem.objects.filter(
+            names, content_type=ContentType.objects.get_for_model(self.model)
+        ).values('object_id')
+
+        if match == 'all':
+            items = items.annotate(matches=models.Count('tag_id')).filter(matches=len(tags)).values('object_id')
+
+        return self.filter(pk__in=items)
+
+    def versions(self) -> typing.List[Fingerprint]:
+        """
+        Validators (read backend.conditional) of a page of Articles -
+        every Article's id and changed_on along with the updated_on of its
+        Author and Topic, in order. Meant for the page a paginator is about
+        to read (read KeysetPaginator.window) so that they cost as much as
+        the page itself no matter how many Articles there are in all.
+        """
+        return list(self.prefetch_related(None).values_list(
+            'pk', 'changed_on', 'author__updated_on', 'topic__updated_on'
+        ))
+
+
+class ArticleManager(models.Manager.from_queryset(ArticleQuerySet)):
     def all(self):
         """
         A custom logging warning is raised if ALL articles are
@@ -52,12 +113,29 @@ class Article(models.Model):
 
     objects = ArticleManager()
 
+    EXCERPT_LENGTH = 20
+
+    # An average adult reads about this
+    # many words of prose per minute.
+    WORDS_PER_MINUTE = 200
+
     tags = TaggableManager(blank=True)
 
     # Main body of an Article.
     # No text limit. Not yet.
     content = models.TextField()
 
+    # The first EXCERPT_LENGTH words of the
+    # content, its number of words and how
+    # long it takes to read it (in minutes).
+    # They're computed once whenever the
+    # content changes (read summarize) so
+    # that lists of Articles can be served
+    # without ever loading the full content.
+    excerpt = models.TextField(blank=True, default='', editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(default=0, editable=False)
+
     title = models.CharField(max_length=150)
 
     # An article by default is NOT
@@ -75,6 +153,15 @@ class Article(models.Model):
     # is added into the database for the first time.
     updated_on = models.DateTimeField(auto_now=True)
 
+    # Touched by every save too - and on its own by
+    # the writes that change how an Article is served
+    # without editing it: scores, tags and resolved
+    # thumbnails. It's never serialized, it's what
+    # the ETags of lists of Articles are built from
+    # (read ArticleQuerySet.versions) so that
+    # updated_on stays the date of the last edit.
+    changed_on = models.DateTimeField(auto_now=True, editable=False)
+
     # Read documentation for updated_at field
     created_on = models.DateTimeField(auto_now_add=True)
 
@@ -137,7 +224,12 @@ class Article(models.Model):
     # point value that will be determined
     # by the machine learning model. It will
     # almost always be leaning towards 0.
-    objectivity = models.FloatField(blank=True, default=0, editable=False)
+    # It's NULL while the Article is waiting
+    # in the scoring queue - Clarent runs
+    # in a background worker (read the docs
+    # for ObjectivityJob below) and writes the
+    # score back once it has been computed.
+    objectivity = models.FloatField(null=True, blank=True, default=None, editable=False)
 
     # In case Author does not want to upload a
     # file image him/herself.
@@ -145,23 +237,57 @@ class Article(models.Model):
         default='https://picsum.photos/1900/1080', null=True, blank=True
     )
 
+    # Whichever of the two above the thumbnail is -
+    # resolved once whenever the Article is saved
+    # so serializers don't build Cloudinary URLs
+    # row by row (read backend/thumbnails.py).
+    resolved_thumbnail = ThumbnailURLField()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the values an instance was loaded with so that signals
+        can tell which fields actually changed when it's saved again.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = resolved_fields(kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
+        self._loaded_values = {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def has_changed(self, field: str) -> bool:
+        """
+        Checks if a field differs from the value it was loaded with. New
+        instances have changed everything; deferred fields that were never
+        accessed can't have changed at all.
+        """
+        if self._state.adding:
+            return True
+        if field not in self.__dict__:
+            return False
+        loaded = getattr(self, '_loaded_values', {})
+        return field not in loaded or loaded[field] != self.__dict__[field]
+
     def get_thumbnail(self):
         """
-        Checks for existence of thumbnail fields - either as a Cloudinary
-        field or the thumbnail_url if the Author entered a URL instead
-        of a thumbnail file.
+        The thumbnail - either the Cloudinary field's URL or the
+        thumbnail_url if the Author entered a URL instead of a thumbnail
+        file - as it was resolved when the Article was last saved.
         """
-        if self.thumbnail:
-            # noinspection PyUnresolvedReferences
-            return self.thumbnail.url
-        else:
-            return self.thumbnail_url
+        return self.resolved_thumbnail
 
     @property
     def timestamp(self):
         return self.updated_on if self.updated_on else self.created_on
 
-    def get_truncated_content(self, length: int = 20) -> str:
+    def get_truncated_content(self, length: int = EXCERPT_LENGTH) -> str:
         try:
             length = int(length)
         except ValueError:
@@ -170,30 +296,46 @@ class Article(models.Model):
 
     @property
     def truncated_content(self) -> str:
-        return self.get_truncated_content()
+        return self.excerpt
+
+    def summarize(self) -> None:
+        """
+        Computes the excerpt, word count and reading time of the content.
+        Called by the pre_save signal whenever the content has changed.
+        """
+        self.excerpt = self.get_truncated_content()
+        self.word_count = len(str(self.content).split())
+        self.reading_time = math.ceil(self.word_count / self.WORDS_PER_MINUTE)
+
+    @property
+    def pending(self) -> bool:
+        """
+        Returns True while the Article is waiting to be scored.
+        """
+        return self.objectivity is None
 
     @property
     def objective(self) -> bool:
         """
         Returns a boolean value if the objectivity computed by the model
-        is more than 0.5.
+        is more than 0.5. Articles that haven't been scored yet aren't.
         """
-        return self.objectivity >= 0.5
+        return not self.pending and self.objectivity >= 0.5
 
     @property
-    def subjectivity(self) -> float:
+    def subjectivity(self) -> typing.Optional[float]:
         """
         Objectivity is calculated from a range of 0 to 1 thus subjectivity
         is simply 1 minus the objectivity.
         """
-        return 1 - self.objectivity
+        return None if self.pending else 1 - self.objectivity
 
     def set_tags_from_string(self, tags: str) -> None:
-
-        tags: typing.List[str] = replace(tags, ' "\'').split(',')
-
-        for tag in tags:
-            self.tags.add(tag)
+        """
+        Adds the tags of a comma separated string - in a
+        constant number of queries, read article.tagging.
+        """
+        add_tags([(self, parse_tags(tags))])
 
     def __str__(self) -> str:
         """
@@ -204,3 +346,187 @@ class Article(models.Model):
 
     class Meta:
         ordering = ('-created_on', '-updated_on', '-pk')
+
+        # Timelines are paginated by (created_on, id) -
+        # read article.paginators.ArticleTimelinePaginator.
+        indexes = (
+            models.Index(fields=('-created_on', '-id'), name='article_timeline_idx'),
+            models.Index(fields=('topic', '-created_on', '-id'), name='article_topic_timeline_idx'),
+            models.Index(fields=('author', '-created_on', '-id'), name='article_author_timeline_idx'),
+        )
+
+
+class ObjectivityJob(models.Model):
+    """
+    A row in the Clarent scoring queue. Running TextBlob over an entire
+    Article is far too slow to do inside of a request so saving an Article
+    with new content only sets its objectivity to NULL and queues one of
+    these. The score_articles management command drains the queue and
+    writes the scores back with a targeted update().
+
+    There's at most one job per Article - queueing it again just bumps
+    queued_on since the worker always reads the latest content anyway.
+    """
+
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, related_name='objectivity_job'
+    )
+
+    queued_on = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return f'{self.article_id} {self.queued_on}'
+
+    class Meta:
+        ordering = ('queued_on', 'pk')
+
+
+class ObjectivityScore(models.Model):
+    """
+    Persistent memo of Clarent scores keyed by a digest of the scored
+    paragraph (and the Clarent version that scored it) so that the same
+    text is never analyzed twice - be it an Article that's saved again
+    with only one of its paragraphs edited or the same syndicated Article
+    posted twice. An Article's objectivity is the combination of the
+    scores of its paragraphs weighted by their weight.
+
+    The table is bounded - the least recently used rows are evicted by
+    article.scoring.evict once it grows past settings.CLARENT_CACHE_SIZE.
+    """
+
+    digest = models.CharField(max_length=64, unique=True)
+
+    objectivity = models.FloatField()
+
+    # Number of words Clarent assessed in the paragraph.
+    weight = models.PositiveIntegerField(default=0)
+
+    last_used = models.DateTimeField(default=timezone.now, db_index=True)
+
+    # Sentence by sentence subjectivities of the
+    # paragraph - a clarent.clarent.Breakdown as bytes.
+    sentences = models.BinaryField(default=b'')
+
+    def __str__(self) -> str:
+        return self.digest
+
+
+class ObjectivityBreakdown(models.Model):
+    """
+    Sentence by sentence scores of an Article for highlighting its
+    subjective sentences. They're put together from the breakdowns of
+    its paragraphs whenever the Article is scored and are served as they
+    are by the api/articles/detail/<slug>/objectivity/ endpoint - nothing's
+    ever computed while serving them.
+
+    It's kept out of the Article table so that the (rather large) bytes
+    aren't loaded along with every Article that's queried.
+    """
+
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, related_name='objectivity_breakdown'
+    )
+
+    # A clarent.clarent.Breakdown as bytes - offsets
+    # and lengths of the sentences in the content
+    # and their subjectivities.
+    sentences = models.BinaryField(default=b'')
+
+    def __str__(self) -> str:
+        return str(self.article_id)
+
+
+class RenderedArticle(models.Model):
+    """
+    The JSON an Article renders to in one of its forms - the list form
+    (ArticleListSerializer) or the detail form (ArticleDetailSerializer).
+    Read article.rendering - it's rendered the first time it's needed and
+    spliced into responses as it is from then on, and it's deleted (along
+    with the cached Article, read article.cache) whenever anything it was
+    rendered from changes.
+    """
+
+    LISTING = 'listing'
+    DETAIL = 'detail'
+
+    FORMS = (
+        (LISTING, 'Listing'),
+        (DETAIL, 'Detail'),
+    )
+
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name='renderings'
+    )
+
+    form = models.CharField(max_length=16, choices=FORMS)
+
+    # article.rendering.VERSION of the serializers
+    # the JSON was rendered with - JSON rendered by
+    # older versions is never read (and deleted along
+    # with the rest once the Article changes).
+    version = models.PositiveSmallIntegerField()
+
+    json = models.TextField()
+
+    def __str__(self) -> str:
+        return f'{self.article_id} ({self.form})'
+
+    class Meta:
+        unique_together = ('article', 'form', 'version')
+
+
+class RelatedArticle(models.Model):
+    """
+    One of the (at most article.related.SIZE) Articles most similar to
+    an Article by their tags and Topic - "more like this". The lists are
+    precomputed (read article.related) by the relate_articles command
+    and kept current as Articles are published and tagged, so serving
+    them is a lookup by (article, rank).
+    """
+
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name='related'
+    )
+
+    neighbour = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name='neighbour_of'
+    )
+
+    # 0 is the most similar Article.
+    rank = models.PositiveSmallIntegerField()
+
+    # Cosine similarity of the two Articles' tags
+    # and Topics - between 0 (exclusive) and 1.
+    score = models.FloatField()
+
+    def __str__(self) -> str:
+        return f'{self.article_id} ~ {self.neighbour_id} ({self.rank})'
+
+    class Meta:
+        ordering = ('article', 'rank')
+        unique_together = ('article', 'rank')
+
+
+class RelatedArticleJob(models.Model):
+    """
+    A row in the queue of Articles to relate (read article.related).
+    Relating an Article rewrites its own list and the lists it's in -
+    too much to do inside of the request that published or tagged it -
+    so that only queues one of these and the relate_articles command
+    (with --queue) drains the queue, the same way ObjectivityJobs are.
+
+    There's at most one job per Article - the worker always reads
+    the latest tags and Topic of the Article anyway.
+    """
+
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, related_name='related_job'
+    )
+
+    queued_on = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return f'{self.article_id} {self.queued_on}'
+
+    class Meta:
+        ordering = ('queued_on', 'pk')
@@ -1,5 +1,211 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+import base64
+import bisect
+import typing
+import collections
+
+from django.db.models import Q, Field, QuerySet
+from django.core.exceptions import ValidationError
+
+from article.models import Article
+
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import replace_query_param, remove_query_param
+from rest_framework.pagination import BasePagination, PageNumberPagination
 
 
 class RecentArticleListAPIPaginator(PageNumberPagination):
     page_size = 12
+
+
+class KeysetPaginator(BasePagination):
+    """
+    Paginates by an opaque cursor that holds the values of the ordering
+    fields of the last (or first) row of a page - the next page is then
+    simply the rows that come after those values. Unlike page numbers
+    there's no COUNT(*) and no OFFSET that grows with every page so with
+    an index over the ordering every page costs as much as the first one.
+
+    The ordering has to be unique (end with the primary key) and only
+    plain fields of the model can be used in it. Responses look just like
+    the ones of DRF's CursorPagination - next, previous and results.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    ordering: typing.Tuple[str, ...] = ('-pk',)
+
+    def window(self, queryset: QuerySet, request) -> QuerySet:
+        """
+        The rows paginate_queryset reads for the page a request asks for
+        - ordered, after the cursor's position and with one extra row that
+        tells whether there's a page after this one. Views build their
+        ETags (read ArticleQuerySet.versions) from the same rows.
+        """
+        backwards, position = self.decode_cursor(request, queryset.model)
+
+        ordering = self.ordering
+        if backwards:
+            ordering = tuple(field[1:] if field.startswith('-') else f'-{field}' for field in ordering)
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after(ordering, position))
+
+        return queryset[:self.page_size + 1]
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> typing.List[typing.Any]:
+        self.base_url = request.build_absolute_uri()
+        backwards, position = self.decode_cursor(request, queryset.model)
+
+        page = list(self.window(queryset, request))
+        more = len(page) > self.page_size
+        self.page = page[:self.page_size]
+
+        if backwards:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, more
+        else:
+            self.has_next, self.has_previous = more, position is not None
+
+        return self.page
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(collections.OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_next_link(self) -> typing.Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(False, self.page[-1])
+
+    def get_previous_link(self) -> typing.Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(True, self.page[0])
+
+    @staticmethod
+    def after(ordering: typing.Sequence[str], position: typing.Sequence[typing.Any]) -> Q:
+        """
+        Builds the filter for the rows that come after a position in an
+        ordering - (a, b) < (x, y) is written as a <= x AND (a < x OR
+        (a = x AND b < y)) with the first bound there for the index.
+        """
+        condition, equal = Q(), Q()
+        for field, value in zip(ordering, position):
+            name, lookup = (field[1:], 'lt') if field.startswith('-') else (field, 'gt')
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+
+        first = ordering[0]
+        name, lookup = (first[1:], 'lte') if first.startswith('-') else (first, 'gte')
+        return Q(**{f'{name}__{lookup}': position[0]}) & condition
+
+    def fields(self, model) -> typing.List[Field]:
+        meta = model._meta
+        return [
+            meta.pk if name == 'pk' else meta.get_field(name)
+            for name in (field.lstrip('-') for field in self.ordering)
+        ]
+
+    def position(self, instance) -> typing.List[typing.Any]:
+        # value_to_string keeps every digit of the values - microseconds
+        # included - which matters since the cursor points at a row.
+        return [field.value_to_string(instance) for field in self.fields(type(instance))]
+
+    def parse_position(self, model, values: typing.Sequence[typing.Any]) -> typing.List[typing.Any]:
+        return [field.to_python(value) for field, value in zip(self.fields(model), values)]
+
+    def encode_cursor(self, backwards: bool, instance) -> str:
+        cursor = json.dumps([int(backwards), self.position(instance)], separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(cursor.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request, model) -> typing.Tuple[bool, typing.Optional[typing.List]]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return False, None
+
+        try:
+            backwards, values = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            if len(values) != len(self.ordering):
+                raise ValueError
+            position = self.parse_position(model, values)
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound('Invalid cursor.')
+
+        return bool(backwards), position
+
+
+class ArticleTimelinePaginator(KeysetPaginator):
+    """
+    Newest Articles first - backed by the (created_on, id)
+    indexes of the Article table.
+    """
+
+    ordering = ('-created_on', '-pk')
+
+
+class ArticleIdPaginator(KeysetPaginator):
+    """
+    Keyset pagination over a sorted sequence of Article ids (read
+    article.tag_index) instead of a QuerySet - newest (highest id) first.
+    The page is cut out of the ids by binary search and only the Articles
+    of that page are ever fetched from the database. A QuerySet (the tag
+    view's without the index) is paginated by primary key as usual - the
+    cursors are the same either way.
+    """
+
+    ordering = ('-pk',)
+
+    def paginate_queryset(self, ids: typing.Union[typing.Sequence[int], QuerySet], request, view=None) -> typing.List[Article]:
+        if isinstance(ids, QuerySet):
+            self.ids = None
+            return super().paginate_queryset(ids, request, view)
+
+        self.base_url = request.build_absolute_uri()
+        backwards, position = self.decode_cursor(request, Article)
+
+        if backwards:
+            start = bisect.bisect_right(ids, position[0])
+            end = min(len(ids), start + self.page_size)
+            self.has_next, self.has_previous = True, end < len(ids)
+        else:
+            end = len(ids) if position is None else bisect.bisect_left(ids, position[0])
+            start = max(0, end - self.page_size)
+            self.has_next, self.has_previous = start > 0, position is not None
+
+        self.ids = [int(pk) for pk in reversed(ids[start:end])]
+        articles = Article.objects.filter(pk__in=self.ids, draft=False).for_listing().order_by().in_bulk()
+
+        # Articles that were deleted (or turned into drafts, by
+        # another process whose changes the index of this one
+        # hasn't picked up yet) since the ids were looked up are
+        # left out - the page is short by as many Articles. The
+        # cursors still point at the ends of the page's ids so
+        # paging goes on even if none of its Articles are left.
+        self.page = [articles[pk] for pk in self.ids if pk in articles]
+        return self.page
+
+    def get_next_link(self) -> typing.Optional[str]:
+        if self.ids is None:
+            return super().get_next_link()
+        if not self.has_next or not self.ids:
+            return None
+        return self.encode_cursor(False, Article(pk=self.ids[-1]))
+
+    def get_previous_link(self) -> typing.Optional[str]:
+        if self.ids is None:
+            return super().get_previous_link()
+        if not self.has_previous:
+            return None
+        if not self.ids:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(True, Article(pk=self.ids[0]))
@@ -0,0 +1,132 @@
+"""
+The newest published Articles, rendered (read article.rendering) and
+kept in the cache in a bounded buffer so that the recent Articles view -
+the homepage - is sliced out of it without a single query.
+
+Published Articles are pushed into the buffer after they're committed
+(read article.signals) and the oldest one falls off the end once the
+buffer is full. Anything else that changes an Article in the buffer -
+edits, changes to its tags, Author or Topic - goes through forget in
+article.cache, which renders it again. Articles that were deleted or
+turned into drafts are taken out of the buffer - unless it's full, then
+it's dropped since another Article would have to take their place and
+it's built again from the database the next time it's read.
+
+Changes read, change and write the buffer back without a lock so two
+Articles published at the very same moment could lose one another's
+push - which lasts until the buffer is built again at the latest.
+"""
+import typing
+import hashlib
+import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+
+from backend.renderers import RawJSON
+from article.models import Article
+from article.rendering import rendered
+
+# As many Articles as the recent
+# Articles view can be asked for.
+SIZE = 19
+
+# Bump whenever the shape of the buffer changes.
+VERSION = 1
+
+KEY = f'article:recent:{VERSION}'
+
+
+class Entry(typing.NamedTuple):
+    pk: int
+    slug: str
+    created_on: datetime.datetime
+    updated_on: datetime.datetime
+    json: str
+
+    @property
+    def order(self) -> typing.Tuple[datetime.datetime, datetime.datetime, int]:
+        # Article's Meta.ordering - newest first.
+        return self.created_on, self.updated_on, self.pk
+
+
+class Recent(typing.NamedTuple):
+    # A digest of the entries the
+    # view builds its ETag from.
+    version: str
+
+    # Newest Articles first - every published Article
+    # there is unless there are more than SIZE of them.
+    entries: typing.Tuple[Entry, ...]
+
+    @property
+    def last_modified(self) -> typing.Optional[datetime.datetime]:
+        return max((entry.updated_on for entry in self.entries), default=None)
+
+
+def entries(articles: typing.Sequence[Article]) -> typing.List[Entry]:
+    return [
+        Entry(article.pk, article.slug, article.created_on, article.updated_on, str(json))
+        for article, json in zip(articles, rendered(articles))
+    ]
+
+
+def save(items: typing.Iterable[Entry]) -> Recent:
+    items = tuple(sorted(items, key=lambda entry: entry.order, reverse=True)[:SIZE])
+    version = hashlib.sha1(''.join(f'{entry.pk}:{entry.json}' for entry in items).encode()).hexdigest()
+    recent = Recent(version, items)
+    cache.set(KEY, recent, timeout=settings.ARTICLE_CACHE_TTL)
+    return recent
+
+
+def build() -> Recent:
+    return save(entries(list(Article.objects.filter(draft=False).for_listing()[:SIZE])))
+
+
+def recent_articles() -> Recent:
+    """
+    The buffer - built from the database if it isn't cached.
+    """
+    recent = cache.get(KEY)
+    return build() if recent is None else recent
+
+
+def replace(recent: Recent, article_ids: typing.Collection[int]) -> None:
+    """
+    Puts the Articles with the ids into the buffer in place of the
+    ones it has of them - or takes them out of it if they aren't
+    published (anymore) and the buffer isn't full.
+    """
+    articles = list(Article.objects.filter(pk__in=article_ids, draft=False).for_listing())
+    published = {article.pk for article in articles}
+    gone = any(entry.pk in article_ids and entry.pk not in published for entry in recent.entries)
+    if gone and len(recent.entries) == SIZE:
+        cache.delete(KEY)
+        return
+    save([entry for entry in recent.entries if entry.pk not in article_ids] + entries(articles))
+
+
+def push(article_ids: typing.Iterable[int]) -> None:
+    """
+    Puts newly published Articles into the buffer - if there is one.
+    """
+    recent = cache.get(KEY)
+    article_ids = set(article_ids)
+    if recent is not None and article_ids:
+        replace(recent, article_ids)
+
+
+def refresh(slugs: typing.Collection[str]) -> None:
+    """
+    Renders whichever of the Articles are in the buffer again.
+    """
+    recent = cache.get(KEY)
+    if recent is None:
+        return
+    article_ids = {entry.pk for entry in recent.entries if entry.slug in slugs}
+    if article_ids:
+        replace(recent, article_ids)
+
+
+def page(recent: Recent, n: int) -> typing.List[RawJSON]:
+    return [RawJSON(entry.json) for entry in recent.entries[:n]]
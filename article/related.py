@@ -0,0 +1,375 @@
+"""
+Related Articles - "more like this". Every published Article is a sparse
+vector of its tags and its Topic and the Articles most similar to it (by
+the cosine of their vectors) are precomputed and stored as RelatedArticles
+so that the related view only ever looks its SIZE of them up by rank.
+
+The article × feature matrix is kept as plain NumPy CSR arrays (the
+layout of scipy.sparse, along with its transpose - the postings of every
+feature) and the similarities of a batch of Articles are the dot products
+accumulated along the postings of their features. Features that are on
+more than MAX_POSTING Articles only relate an Article to the newest of
+them, which bounds the memory a batch takes no matter how many Articles
+there are - the matrix itself is only as large as the number of tags.
+
+build (the relate_articles command) computes every list from scratch.
+Publishing, tagging or moving an Article to another Topic queues it as a
+RelatedArticleJob (read article.signals) and drain (the relate_articles
+command with --queue) relates the queued Articles outside of requests -
+their own lists are computed and they're put into (or taken out of) the
+lists of the Articles they're similar to. Lists that lose an Article
+that way are a neighbour short until the next build.
+"""
+import typing
+import threading
+import contextlib
+
+import numpy as np
+
+from django.db import transaction
+from django.utils import timezone
+from django.db.models import Q, QuerySet, FilteredRelation
+from django.db.models.functions import Coalesce
+from django.contrib.contenttypes.models import ContentType
+
+from taggit.models import TaggedItem
+
+from backend.renderers import RawJSON
+from article.models import Article, RelatedArticle, RelatedArticleJob, RenderedArticle
+from article.rendering import VERSION, store
+
+# Related Articles stored per Article.
+SIZE = 10
+
+# How much a shared Topic counts
+# for compared to a shared tag.
+TOPIC_WEIGHT = 1.0
+
+# Articles of a feature every Article
+# with it is compared against at most.
+MAX_POSTING = 1000
+
+# Rows read per query while building.
+BATCH_SIZE = 5000
+
+
+class Matrix(typing.NamedTuple):
+    # Sorted primary keys of the Articles - row i is ids[i].
+    ids: np.ndarray
+
+    # CSR - the features of row i are
+    # indices[indptr[i]:indptr[i + 1]].
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    # The transpose - the rows with feature j (oldest
+    # first) are postings[offsets[j]:offsets[j + 1]].
+    offsets: np.ndarray
+    postings: np.ndarray
+
+    # Weight of every feature and norm of every row.
+    weights: np.ndarray
+    norms: np.ndarray
+
+
+class Similarities(typing.NamedTuple):
+    # Rows of the Articles and of their neighbours - sorted
+    # by Article, most similar neighbour (newest on ties) first.
+    rows: np.ndarray
+    neighbours: np.ndarray
+    scores: np.ndarray
+    ranks: np.ndarray
+
+
+def gather(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    The concatenated ranges [start, start + length) - without a Python loop.
+    """
+    total = int(lengths.sum())
+    if not total:
+        return np.empty(0, dtype=np.int64)
+    return np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+
+
+def matrix(ids: np.ndarray, topics: np.ndarray, item_ids: np.ndarray, tag_ids: np.ndarray) -> Matrix:
+    """
+    The matrix of Articles with some ids and Topics (0 for none) and
+    tagged items (Article ids and tag ids) - items of other Articles
+    are left out. Tags are the even features and Topics the odd ones.
+    """
+    order = np.argsort(ids)
+    ids, topics = ids[order], topics[order]
+
+    positions = np.searchsorted(ids, item_ids)
+    found = positions < len(ids)
+    found[found] = ids[positions[found]] == item_ids[found]
+
+    rows = np.concatenate([positions[found], np.flatnonzero(topics)])
+    keys = np.concatenate([tag_ids[found] * 2, topics[topics != 0] * 2 + 1])
+
+    features, columns = np.unique(keys, return_inverse=True)
+    pairs = np.unique(rows * len(features) + columns)
+    rows, columns = pairs // max(len(features), 1), pairs % max(len(features), 1)
+    weights = np.where(features % 2, TOPIC_WEIGHT, 1.0)
+
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=len(ids)))])
+    transpose = np.lexsort((rows, columns))
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(columns, minlength=len(features)))])
+    norms = np.sqrt(np.bincount(rows, weights=weights[columns] ** 2, minlength=len(ids)))
+
+    return Matrix(ids, indptr, columns, offsets, rows[transpose], weights, norms)
+
+
+def similarities(m: Matrix, rows: np.ndarray) -> Similarities:
+    """
+    Every Article some rows share a feature with and how similar they are.
+    """
+    counts = m.indptr[rows + 1] - m.indptr[rows]
+    sources = np.repeat(np.arange(len(rows)), counts)
+    columns = m.indices[gather(m.indptr[rows], counts)]
+
+    ends = m.offsets[columns + 1]
+    starts = np.maximum(m.offsets[columns], ends - MAX_POSTING)
+    lengths = ends - starts
+    neighbours = m.postings[gather(starts, lengths)]
+
+    keys, inverse = np.unique(np.repeat(sources, lengths) * len(m.ids) + neighbours, return_inverse=True)
+    dots = np.bincount(inverse, weights=np.repeat(m.weights[columns] ** 2, lengths))
+    sources, neighbours = rows[keys // len(m.ids)], keys % len(m.ids)
+
+    other = sources != neighbours
+    sources, neighbours, dots = sources[other], neighbours[other], dots[other]
+    scores = dots / (m.norms[sources] * m.norms[neighbours])
+
+    order = np.lexsort((-neighbours, -scores, sources))
+    sources, neighbours, scores = sources[order], neighbours[order], scores[order]
+    ranks = np.arange(len(sources)) - np.searchsorted(sources, sources)
+    return Similarities(sources, neighbours, scores, ranks)
+
+
+def related(m: Matrix, s: Similarities) -> typing.List[RelatedArticle]:
+    top = s.ranks < SIZE
+    return [
+        RelatedArticle(article_id=article_id, neighbour_id=neighbour_id, rank=rank, score=score)
+        for article_id, neighbour_id, rank, score in zip(
+            m.ids[s.rows[top]].tolist(), m.ids[s.neighbours[top]].tolist(),
+            s.ranks[top].tolist(), s.scores[top].tolist()
+        )
+    ]
+
+
+def save(article_ids: typing.Collection[int], lists: typing.List[RelatedArticle]) -> None:
+    """
+    Replaces the lists of some Articles.
+    """
+    with transaction.atomic():
+        RelatedArticle.objects.filter(article_id__in=article_ids).delete()
+        RelatedArticle.objects.bulk_create(lists)
+
+
+def tagged_items() -> QuerySet:
+    return TaggedItem.objects.filter(content_type=ContentType.objects.get_for_model(Article))
+
+
+def scan(queryset: QuerySet, *fields) -> typing.Tuple[np.ndarray, ...]:
+    """
+    The fields of every row of a QuerySet as arrays - read walking
+    it by primary key, one batch at a time, since MySQL can't stream.
+    """
+    chunks = []
+    last_pk = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last_pk).order_by('pk').values_list('pk', *fields)[:BATCH_SIZE])
+        if not rows:
+            break
+        chunks.append(np.array(rows, dtype=np.int64).reshape(-1, len(fields) + 1))
+        last_pk = rows[-1][0]
+    columns = np.concatenate(chunks) if chunks else np.empty((0, len(fields) + 1), dtype=np.int64)
+    return tuple(columns[:, index] for index in range(1, len(fields) + 1))
+
+
+def build(batch_size: int = 500, progress: typing.Callable[[int], None] = lambda done: None) -> int:
+    """
+    Computes the list of every published Article - batch_size Articles
+    at a time - and returns the number of Articles that were related.
+    Articles queued before the build started are taken off the queue.
+    """
+    started = timezone.now()
+    ids, topics = scan(Article.objects.filter(draft=False), 'pk', Coalesce('topic_id', 0))
+    item_ids, tag_ids = scan(tagged_items(), 'object_id', 'tag_id')
+    m = matrix(ids, topics, item_ids, tag_ids)
+    del item_ids, tag_ids
+
+    for start in range(0, len(m.ids), batch_size):
+        rows = np.arange(start, min(start + batch_size, len(m.ids)))
+        save(m.ids[rows].tolist(), related(m, similarities(m, rows)))
+        progress(int(rows[-1]) + 1)
+
+    # Drafts (and Articles without any tags
+    # or Topic) don't have lists anymore.
+    RelatedArticle.objects.exclude(article_id__in=Article.objects.filter(draft=False).values('pk')).delete()
+    RelatedArticleJob.objects.filter(queued_on__lt=started).delete()
+
+    return len(m.ids)
+
+
+def relate(article_ids: typing.Collection[int]) -> None:
+    """
+    Computes the lists of some Articles (or deletes them if they aren't
+    published) and puts them into the lists of the Articles they're now
+    similar to - in place of their old entries.
+    """
+    published = Article.objects.filter(draft=False)
+    sources = list(published.filter(pk__in=article_ids).values_list('pk', 'topic_id'))
+    RelatedArticle.objects.filter(article_id__in=set(article_ids) - {pk for pk, _ in sources}).delete()
+    if not sources:
+        return
+
+    tags = set(tagged_items().filter(object_id__in=[pk for pk, _ in sources]).values_list('tag_id', flat=True))
+    topics = {topic_id for _, topic_id in sources if topic_id}
+    candidates = set(
+        tagged_items().filter(tag_id__in=tags, object_id__in=published.values('pk'))
+        .order_by('-object_id').values_list('object_id', flat=True)[:MAX_POSTING * len(tags)]
+    ) if tags else set()
+    if topics:
+        candidates.update(
+            published.filter(topic_id__in=topics).order_by('-pk')
+            .values_list('pk', flat=True)[:MAX_POSTING * len(topics)]
+        )
+    candidates.update(pk for pk, _ in sources)
+
+    ids, topics = zip(*published.filter(pk__in=candidates).values_list('pk', 'topic_id'))
+    items = list(tagged_items().filter(object_id__in=ids).values_list('object_id', 'tag_id'))
+    item_ids, tag_ids = (np.array(column, dtype=np.int64) for column in zip(*items)) if items else (
+        np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    )
+    m = matrix(np.array(ids, dtype=np.int64), np.array([topic or 0 for topic in topics], dtype=np.int64),
+               item_ids, tag_ids)
+
+    rows = np.searchsorted(m.ids, [pk for pk, _ in sources])
+    s = similarities(m, rows)
+    source_ids = m.ids[rows].tolist()
+    sourced = set(source_ids)
+    lists = related(m, s)
+
+    # Every other list the Articles are in (or
+    # belong in now) is merged with their scores.
+    scores: typing.Dict[int, typing.Dict[int, float]] = {}
+    for source, neighbour, score in zip(m.ids[s.rows].tolist(), m.ids[s.neighbours].tolist(), s.scores.tolist()):
+        if neighbour not in sourced:
+            scores.setdefault(neighbour, {})[source] = score
+
+    current: typing.Dict[int, typing.Dict[int, float]] = {}
+    for article_id, neighbour_id, score in RelatedArticle.objects.filter(
+        Q(article_id__in=scores) | Q(neighbour_id__in=source_ids)
+    ).exclude(article_id__in=source_ids).values_list('article_id', 'neighbour_id', 'score'):
+        current.setdefault(article_id, {})[neighbour_id] = score
+
+    changed = []
+    for article_id in set(scores) | set(current):
+        merged = {
+            neighbour_id: score for neighbour_id, score in current.get(article_id, {}).items()
+            if neighbour_id not in sourced
+        }
+        merged.update(scores.get(article_id, {}))
+        top = sorted(merged.items(), key=lambda entry: (-entry[1], -entry[0]))[:SIZE]
+        if dict(top) != current.get(article_id, {}):
+            changed.append(article_id)
+            lists.extend(
+                RelatedArticle(article_id=article_id, neighbour_id=neighbour_id, rank=rank, score=score)
+                for rank, (neighbour_id, score) in enumerate(top)
+            )
+
+    save(source_ids + changed, lists)
+
+
+# Article ids queued inside of a batch block.
+_batch = threading.local()
+
+
+@contextlib.contextmanager
+def batch():
+    """
+    Queues all the Articles enqueue is called with inside of the block
+    at once when it's done - for code that changes lots of Articles one
+    signal at a time (like tagging Articles in bulk).
+    """
+    if getattr(_batch, 'ids', None) is not None:
+        yield
+        return
+
+    _batch.ids = set()
+    try:
+        yield
+        article_ids = _batch.ids
+    finally:
+        _batch.ids = None
+    enqueue(article_ids)
+
+
+def enqueue(article_ids: typing.Iterable[int]) -> None:
+    """
+    Queues some Articles to be related - Articles that are
+    already waiting in the queue are left where they are.
+    """
+    article_ids = set(article_ids)
+    if getattr(_batch, 'ids', None) is not None:
+        _batch.ids.update(article_ids)
+        return
+
+    now = timezone.now()
+    RelatedArticleJob.objects.bulk_create(
+        (RelatedArticleJob(article_id=article_id, queued_on=now) for article_id in article_ids),
+        ignore_conflicts=True
+    )
+
+
+def drain(batch_size: int = 100) -> int:
+    """
+    Relates (at most) batch_size of the oldest queued Articles at once
+    and removes their jobs. Returns the number of jobs that were
+    processed - 0 means the queue is empty.
+
+    Jobs are locked with SKIP LOCKED so any number of workers can drain
+    the queue at the same time without relating an Article twice.
+    """
+    with transaction.atomic():
+        jobs: typing.List[typing.Tuple[int, int]] = list(
+            RelatedArticleJob.objects.select_for_update(skip_locked=True)
+            .values_list('pk', 'article_id')[:batch_size]
+        )
+
+        if not jobs:
+            return 0
+
+        relate([article_id for _, article_id in jobs])
+
+        RelatedArticleJob.objects.filter(pk__in=[pk for pk, _ in jobs]).delete()
+
+    return len(jobs)
+
+
+def related_articles(slug: str) -> typing.Optional[typing.List[RawJSON]]:
+    """
+    The pre-rendered list form of the published Articles related to the
+    published Article with a slug (or None if there isn't one) - looked
+    up in one query by (article, rank) along with their stored JSON.
+    Articles that weren't rendered yet are rendered and stored.
+    """
+    rows = list(
+        Article.objects.filter(
+            draft=False, neighbour_of__article__slug=slug, neighbour_of__article__draft=False
+        ).annotate(listing=FilteredRelation('renderings', condition=Q(
+            renderings__form=RenderedArticle.LISTING, renderings__version=VERSION
+        ))).order_by('neighbour_of__rank').values_list('pk', 'listing__json')
+    )
+    if not rows and not Article.objects.filter(draft=False, slug=slug).exists():
+        return None
+
+    stored = dict(rows)
+    missing = [pk for pk, json in rows if json is None]
+    if missing:
+        articles = list(Article.objects.filter(pk__in=missing).for_listing())
+        stored.update(zip((article.pk for article in articles), store(articles, RenderedArticle.LISTING)))
+
+    return [RawJSON(stored[pk]) for pk, _ in rows if stored.get(pk) is not None]
@@ -0,0 +1,107 @@
+"""
+Pre-rendered Articles. Serializing an Article field by field is most of
+what a list (or the detail view) spends its time on, so every Article's
+list and detail forms are rendered to JSON once and stored in the
+RenderedArticle table - hot views splice the stored JSON into their
+responses (read backend.renderers) and only ever serialize the Articles
+that haven't been rendered yet.
+
+Rendered Articles are deleted by article.cache.forget - that is whenever
+the Article, its tags, its Author or its Topic change - and rendered
+again the next time they're needed.
+"""
+import typing
+
+from backend.renderers import RawJSON, ORJSONRenderer
+from article.models import Article, RenderedArticle
+from article.serializers import ArticleListSerializer, ArticleDetailSerializer
+
+from django.db.models import QuerySet
+from rest_framework.response import Response
+
+# Bump whenever the output of either
+# serializer changes so that Articles
+# rendered in the old shape are never
+# served again.
+VERSION = 1
+
+SERIALIZERS = {
+    RenderedArticle.LISTING: ArticleListSerializer,
+    RenderedArticle.DETAIL: ArticleDetailSerializer,
+}
+
+
+def render(articles: typing.Sequence[Article], form: str) -> typing.List[RawJSON]:
+    """
+    Serializes Articles (loaded with everything the serializer of
+    the form needs) to exactly the JSON the API renders them to.
+    """
+    renderer = ORJSONRenderer()
+    return [
+        RawJSON(renderer.render(data).decode())
+        for data in SERIALIZERS[form](articles, many=True).data
+    ]
+
+
+def store(articles: typing.Sequence[Article], form: str) -> typing.List[RawJSON]:
+    """
+    Renders Articles in one of the forms and stores them in one query.
+    """
+    fresh = render(articles, form)
+    RenderedArticle.objects.bulk_create(
+        (RenderedArticle(article_id=article.pk, form=form, version=VERSION, json=json)
+         for article, json in zip(articles, fresh)),
+        ignore_conflicts=True
+    )
+    return fresh
+
+
+def rendered(articles: typing.Sequence[Article], form: str = RenderedArticle.LISTING) -> typing.List[RawJSON]:
+    """
+    The JSON of some Articles in one of the forms of RenderedArticle,
+    in the order they were given. It's looked up in one query and the
+    Articles that weren't rendered yet are rendered and stored in one more.
+    """
+    stored = dict(RenderedArticle.objects.filter(
+        article_id__in=[article.pk for article in articles], form=form, version=VERSION
+    ).values_list('article_id', 'json'))
+
+    missing = [article for article in articles if article.pk not in stored]
+    if missing:
+        stored.update(zip((article.pk for article in missing), store(missing, form)))
+
+    return [RawJSON(stored[article.pk]) for article in articles]
+
+
+def rendered_detail(queryset: QuerySet, slug: str) -> typing.Optional[RawJSON]:
+    """
+    The detail form of the Article of a QuerySet with a slug (or None
+    if there isn't one) - the stored JSON is looked up by slug without
+    loading the Article at all.
+    """
+    json = RenderedArticle.objects.filter(
+        article__in=queryset.filter(slug=slug).values('pk'), form=RenderedArticle.DETAIL, version=VERSION
+    ).values_list('json', flat=True).first()
+    if json is not None:
+        return RawJSON(json)
+
+    article = queryset.filter(slug=slug).first()
+    if article is None:
+        return None
+    return store([article], RenderedArticle.DETAIL)[0]
+
+
+class RenderedListMixin(object):
+    """
+    Mixed into a ListAPIView of Articles in place of its list - the
+    page is rendered from the pre-rendered list form of its Articles
+    instead of being serialized (the serializer_class is only ever used
+    for rendering the Articles that weren't rendered before).
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(rendered(list(queryset)))
+        return self.get_paginated_response(rendered(page))
@@ -0,0 +1,295 @@
+"""
+Background objectivity scoring for Article instances. Nothing in here
+should ever be called from inside of a request except for enqueue and
+cached lookups - Clarent is slow and gets slower the longer an Article is.
+
+Articles are scored paragraph by paragraph and every paragraph's score is
+memoized by a digest of its text, first in a small per-process LRU and
+then in the ObjectivityScore table, so the same paragraph is only ever
+analyzed once - editing an Article only rescores the paragraphs that changed.
+
+Paragraphs are broken down sentence by sentence along the way and their
+breakdowns are joined up into the ObjectivityBreakdown of the Article.
+"""
+import typing
+import hashlib
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from backend.utils import LRUCache
+from clarent.clarent import Clarent, Breakdown
+from article.cache import forget_articles
+from article.models import Article, ObjectivityJob, ObjectivityScore, ObjectivityBreakdown
+
+# (objectivity, weight, sentences) of a paragraph -
+# sentences being the bytes of its Breakdown.
+Score = typing.Tuple[float, int, bytes]
+
+
+# Maps paragraph digests to Scores.
+local_cache = LRUCache(size=4096)
+
+
+def digest(paragraph: str) -> str:
+    """
+    Cache key for a paragraph. Clarent's version and engine are part
+    of the key so that a new version never reuses stale scores.
+    """
+    return hashlib.sha256(f'{Clarent.VERSION}:{Clarent.engine}:{paragraph}'.encode()).hexdigest()
+
+
+def lookup(digests: typing.Iterable[str]) -> typing.Dict[str, Score]:
+    """
+    Returns the cached scores of whichever digests have one. Scores
+    found in the table have their last_used bumped to keep them from
+    being evicted and are kept in the local cache from then on.
+    """
+    found: typing.Dict[str, Score] = {}
+    missing: typing.List[str] = []
+
+    for key in set(digests):
+        value = local_cache.get(key)
+        if value is None:
+            missing.append(key)
+        else:
+            found[key] = value
+
+    if missing:
+        rows = {
+            key: (objectivity, weight, bytes(sentences)) for key, objectivity, weight, sentences in
+            ObjectivityScore.objects.filter(digest__in=missing).values_list(
+                'digest', 'objectivity', 'weight', 'sentences'
+            )
+        }
+
+        if rows:
+            ObjectivityScore.objects.filter(digest__in=rows).update(last_used=timezone.now())
+
+        for key, value in rows.items():
+            local_cache.set(key, value)
+        found.update(rows)
+
+    return found
+
+
+def remember(scores: typing.Mapping[str, Score]) -> None:
+    now = timezone.now()
+    ObjectivityScore.objects.bulk_create(
+        (ObjectivityScore(digest=key, objectivity=objectivity, weight=weight, sentences=sentences, last_used=now)
+         for key, (objectivity, weight, sentences) in scores.items()),
+        ignore_conflicts=True
+    )
+    for key, value in scores.items():
+        local_cache.set(key, value)
+
+
+def evict(max_entries: typing.Optional[int] = None) -> int:
+    """
+    Trims the ObjectivityScore table down to its max_entries most
+    recently used rows and returns the number of rows deleted.
+    """
+    if max_entries is None:
+        max_entries = settings.CLARENT_CACHE_SIZE
+
+    cutoff = ObjectivityScore.objects.order_by('-last_used', '-pk').values_list(
+        'last_used', 'pk'
+    )[max_entries:max_entries + 1]
+
+    if not cutoff:
+        return 0
+
+    last_used, pk = cutoff[0]
+    deleted, _ = ObjectivityScore.objects.filter(last_used__lte=last_used).exclude(
+        last_used=last_used, pk__gt=pk
+    ).delete()
+    return deleted
+
+
+def combine(scores: typing.Iterable[Score]) -> float:
+    """
+    Combines the scores of an Article's paragraphs
+    into the objectivity of the whole Article.
+    """
+    return 1 - Clarent.combine((1 - objectivity, weight) for objectivity, weight, _ in scores)
+
+
+def join(content: str, paragraphs: typing.Iterable[typing.Tuple[str, Score]]) -> Breakdown:
+    """
+    Joins up the sentence breakdowns of the (paragraph, score)s of some
+    content into the breakdown of the content as a whole - with the
+    offsets of the sentences moved to where their paragraph starts.
+    """
+    breakdown, offset = Breakdown(), 0
+    for paragraph, (_, _, sentences) in paragraphs:
+        offset = content.find(paragraph, offset)
+        breakdown.extend(Breakdown.from_bytes(sentences), offset)
+        offset += len(paragraph)
+    return breakdown
+
+
+def cached_objectivity(content: str) -> typing.Optional[float]:
+    """
+    Returns the objectivity of some content if all of its paragraphs
+    have been scored before - and None if any of them hasn't.
+    """
+    keys = [digest(paragraph) for paragraph in Clarent.paragraphs(content)]
+    scores = lookup(keys)
+    if len(scores) < len(set(keys)):
+        return None
+    return combine(scores[key] for key in keys)
+
+
+def cached_objectivities(contents: typing.Sequence[str]) -> typing.List[typing.Optional[typing.Tuple[float, Breakdown]]]:
+    """
+    cached_objectivity for a batch of contents, with one lookup for all
+    of them - returns the objectivity and the sentence Breakdown of every
+    content whose paragraphs have all been scored before and None for
+    every other one.
+    """
+    keys = [
+        [(digest(paragraph), paragraph) for paragraph in Clarent.paragraphs(content)]
+        for content in contents
+    ]
+    scores = lookup(key for paragraphs in keys for key, _ in paragraphs)
+
+    return [
+        None if any(key not in scores for key, _ in paragraphs) else (
+            combine(scores[key] for key, _ in paragraphs),
+            join(content, ((paragraph, scores[key]) for key, paragraph in paragraphs))
+        )
+        for content, paragraphs in zip(contents, keys)
+    ]
+
+
+def objectivities(contents: typing.Sequence[str],
+                   processes: typing.Optional[int] = None) -> typing.List[typing.Tuple[float, Breakdown]]:
+    """
+    Scores a batch of contents, only running Clarent over the paragraphs
+    that haven't been scored before (and only once per distinct paragraph).
+    Returns the objectivity and the sentence Breakdown of every content.
+    Read Clarent.assess_many for the processes argument.
+    """
+    keys = [
+        [(digest(paragraph), paragraph) for paragraph in Clarent.paragraphs(content)]
+        for content in contents
+    ]
+    scores = lookup(key for paragraphs in keys for key, _ in paragraphs)
+
+    misses = {
+        key: paragraph for paragraphs in keys
+        for key, paragraph in paragraphs if key not in scores
+    }
+    if misses:
+        subjectivities, weights, breakdowns = Clarent.breakdown_many(misses.values(), processes)
+        computed = {
+            key: (1 - subjectivity, weight, breakdown.to_bytes())
+            for key, subjectivity, weight, breakdown in zip(misses, subjectivities, weights, breakdowns)
+        }
+        remember(computed)
+        scores.update(computed)
+
+    return [
+        (combine(scores[key] for key, _ in paragraphs),
+         join(content, ((paragraph, scores[key]) for key, paragraph in paragraphs)))
+        for content, paragraphs in zip(contents, keys)
+    ]
+
+
+def save_breakdowns(breakdowns: typing.Iterable[typing.Tuple[int, Breakdown]]) -> None:
+    """
+    Replaces the ObjectivityBreakdowns of the Articles
+    with the given (article_id, Breakdown)s.
+    """
+    breakdowns = [
+        ObjectivityBreakdown(article_id=article_id, sentences=breakdown.to_bytes())
+        for article_id, breakdown in breakdowns
+    ]
+    with transaction.atomic():
+        ObjectivityBreakdown.objects.filter(
+            article_id__in=[breakdown.article_id for breakdown in breakdowns]
+        ).delete()
+        ObjectivityBreakdown.objects.bulk_create(breakdowns)
+
+
+def save_cached_breakdown(article: Article) -> None:
+    """
+    Saves the breakdown of an Article whose paragraphs have
+    all been scored before straight from the cache.
+    """
+    paragraphs = [(digest(paragraph), paragraph) for paragraph in Clarent.paragraphs(article.content)]
+    scores = lookup(key for key, _ in paragraphs)
+
+    # Scores might have been evicted since the Article
+    # was saved - the worker takes care of it then.
+    if any(key not in scores for key, _ in paragraphs):
+        enqueue(article.pk)
+        return
+
+    save_breakdowns([(article.pk, join(
+        article.content, ((paragraph, scores[key]) for key, paragraph in paragraphs)
+    ))])
+
+
+def enqueue(article_id: int) -> None:
+    """
+    Queues an Article for scoring. Queueing an Article that's already
+    waiting in the queue only bumps its place in line.
+    """
+    ObjectivityJob.objects.update_or_create(
+        article_id=article_id, defaults={'queued_on': timezone.now()}
+    )
+
+
+def enqueue_many(article_ids: typing.Iterable[int]) -> None:
+    """
+    Queues a batch of Articles at once - Articles that are already
+    waiting in the queue are left where they are.
+    """
+    now = timezone.now()
+    ObjectivityJob.objects.bulk_create(
+        (ObjectivityJob(article_id=article_id, queued_on=now) for article_id in article_ids),
+        ignore_conflicts=True
+    )
+
+
+def drain(batch_size: int = 50) -> int:
+    """
+    Scores (at most) batch_size of the oldest queued Articles, writes
+    their objectivity back and removes their jobs. Returns the number
+    of jobs that were processed - 0 means the queue is empty.
+
+    Jobs are locked with SKIP LOCKED so any number of workers can drain
+    the queue at the same time without scoring an Article twice.
+    """
+    with transaction.atomic():
+        jobs: typing.List[typing.Tuple[int, int]] = list(
+            ObjectivityJob.objects.select_for_update(skip_locked=True)
+            .values_list('pk', 'article_id')[:batch_size]
+        )
+
+        if not jobs:
+            return 0
+
+        contents = list(Article.objects.filter(
+            pk__in=[article_id for _, article_id in jobs]
+        ).values_list('pk', 'content'))
+
+        scores = objectivities([content for _, content in contents])
+
+        # changed_on is touched too so that the ETags of the
+        # lists the Articles are in change - updated_on isn't
+        # since a score isn't an edit.
+        now = timezone.now()
+        for (pk, _), (objectivity, _) in zip(contents, scores):
+            Article.objects.filter(pk=pk).update(objectivity=objectivity, changed_on=now)
+
+        save_breakdowns((pk, breakdown) for (pk, _), (_, breakdown) in zip(contents, scores))
+        forget_articles(pk__in=[pk for pk, _ in contents])
+
+        ObjectivityJob.objects.filter(pk__in=[pk for pk, _ in jobs]).delete()
+
+    evict()
+
+    return len(jobs)
@@ -1,4 +1,5 @@
 from article.serializers.serializers import (
     ArticleListSerializer,
+    FastArticleListSerializer,
     ArticleDetailSerializer
 )
@@ -1,7 +1,12 @@
+import typing
+import collections
+
+from backend.fast import FastSerializer, Row, date, thumbnail
 from article.models import Article
 from article.serializers.fields import TagListField
 from author.serializers import AuthorDetailSerializer
 
+from taggit.models import TaggedItem
 from rest_framework import serializers
 
 
@@ -9,22 +14,60 @@ class ArticleListSerializer(serializers.ModelSerializer):
     tags = TagListField()
     topic = serializers.StringRelatedField()
     author = serializers.StringRelatedField()
-    thumbnail = serializers.URLField(source='get_thumbnail')
+    thumbnail = serializers.URLField(source='resolved_thumbnail')
     timestamp = serializers.DateTimeField(format='%b. %d, %Y')
-    content = serializers.StringRelatedField(source='get_truncated_content')
+    content = serializers.CharField(source='excerpt')
 
     class Meta:
         model = Article
-        exclude = ('updated_on', 'created_on', 'thumbnail_url', 'draft')
+        exclude = ('updated_on', 'changed_on', 'created_on', 'thumbnail_url', 'resolved_thumbnail', 'draft', 'excerpt')
+
+
+class FastArticleListSerializer(FastSerializer):
+    """
+    ArticleListSerializer from values() - the tags of a whole page
+    are fetched in one query the same way prefetch_related does it.
+    """
+
+    fields = (
+        'id', 'topic__name', 'author__username', 'resolved_thumbnail', 'updated_on',
+        'created_on', 'excerpt', 'word_count', 'reading_time', 'title', 'slug', 'objectivity',
+    )
+
+    def prepare(self, rows: typing.List[Row]) -> None:
+        self.tags: typing.Dict[int, typing.List[str]] = collections.defaultdict(list)
+        if not rows:
+            return
+        relation = TaggedItem.tag_relname()
+        for object_id, name in TaggedItem.tags_for(
+            Article, **{f'{relation}__object_id__in': {row['id'] for row in rows}}
+        ).values_list(f'{relation}__object_id', 'name'):
+            self.tags[object_id].append(name)
+
+    def represent(self, row: Row) -> typing.Dict[str, typing.Any]:
+        return {
+            'id': row['id'],
+            'tags': self.tags.get(row['id'], []),
+            'topic': row['topic__name'],
+            'author': row['author__username'],
+            'thumbnail': thumbnail(row),
+            'timestamp': date(row['updated_on'] or row['created_on']),
+            'content': row['excerpt'],
+            'word_count': row['word_count'],
+            'reading_time': row['reading_time'],
+            'title': row['title'],
+            'slug': row['slug'],
+            'objectivity': row['objectivity'],
+        }
 
 
 class ArticleDetailSerializer(serializers.ModelSerializer):
     tags = TagListField()
     author = AuthorDetailSerializer()
     topic = serializers.StringRelatedField()
-    thumbnail = serializers.URLField(source='get_thumbnail')
+    thumbnail = serializers.URLField(source='resolved_thumbnail')
     timestamp = serializers.DateTimeField(format='%b. %d, %Y')
 
     class Meta:
         model = Article
-        exclude = ('created_on', 'updated_on', 'thumbnail_url', 'draft')
+        exclude = ('created_on', 'updated_on', 'changed_on', 'thumbnail_url', 'resolved_thumbnail', 'draft', 'excerpt')
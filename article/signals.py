@@ -1,13 +1,217 @@
+import typing
+
+from topic.models import Topic
 from article.models import Article
-from clarent.clarent import Clarent
+from article.cache import forget, forget_articles
+from article.recent import push
+from article import related
+from article.tagging import tag_ids
+from article.tag_index import tag_index
+from article.scoring import enqueue, cached_objectivity, save_cached_breakdown
 
-from django.dispatch import receiver
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.dispatch import receiver, Signal
 from django.utils.text import slugify
-from django.db.models.signals import pre_save
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+
+from taggit.models import Tag
+
+# Sent with the Articles that were created in bulk (read
+# article.bulk) since bulk_create doesn't send post_save -
+# and with their tag_names since tagging them didn't send
+# m2m_changed either.
+articles_created = Signal()
 
 
 # noinspection PyUnusedLocal
 @receiver(pre_save, sender=Article)
-def generate_article_slug(sender, instance: Article, **kwargs):
+def generate_article_slug(sender, instance: Article, update_fields=None, **kwargs):
     instance.slug = slugify(instance.title)
-    instance.objectivity = Clarent(instance.content).objectivity
+
+    # Scoring is done by the score_articles worker - all
+    # that happens here is reusing the score of content
+    # that was scored before or marking the objectivity
+    # as pending (None) when there's new content to score.
+    if update_fields is None or 'content' in update_fields:
+        if instance.has_changed('content'):
+            instance.summarize()
+            instance.objectivity = cached_objectivity(instance.content)
+
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=Article)
+def queue_article_scoring(sender, instance: Article, update_fields=None, **kwargs):
+    if instance.pending:
+        enqueue(instance.pk)
+
+    # New content that was scored before has its
+    # breakdown put together from the cache as well.
+    elif update_fields is None or 'content' in update_fields:
+        if instance.has_changed('content'):
+            save_cached_breakdown(instance)
+
+
+def index_article_tags(article: Article) -> None:
+    if article.draft:
+        tag_index.update(article.pk)
+    else:
+        tag_index.update(article.pk, article.tags.names())
+
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=Article)
+def update_tag_index(sender, instance: Article, **kwargs):
+    # Tags are only ever added after an Article is
+    # created - that's taken care of by index_tags.
+    if tag_index.built and instance.has_changed('draft'):
+        index_article_tags(instance)
+
+
+# noinspection PyUnusedLocal
+@receiver(m2m_changed, sender=Article.tags.through)
+def index_tags(sender, instance, action: str, **kwargs):
+    if tag_index.built and isinstance(instance, Article) and action.startswith('post_'):
+        index_article_tags(instance)
+
+
+# noinspection PyUnusedLocal
+@receiver(articles_created, sender=Article)
+def index_created_articles(sender, articles: typing.List[Article], **kwargs):
+    if tag_index.built:
+        for article in articles:
+            if not article.draft:
+                tag_index.update(article.pk, article.tag_names)
+
+
+# noinspection PyUnusedLocal
+@receiver(post_delete, sender=Article)
+def remove_from_tag_index(sender, instance: Article, **kwargs):
+    tag_index.update(instance.pk)
+
+
+# noinspection PyUnusedLocal
+@receiver(post_delete, sender=Tag)
+def forget_tag_ids(sender, instance: Tag, **kwargs):
+    tag_ids.clear()
+
+
+# Cached Articles (article.cache) are forgotten whenever
+# anything they're serialized from changes.
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def forget_article(sender, instance: Article, **kwargs):
+    # Titles (and with them slugs) can change too.
+    forget([instance.slug, getattr(instance, '_loaded_values', {}).get('slug')])
+
+
+# Published Articles are pushed into the buffer of recent Articles
+# (read article.recent) once they're committed - after (and only if)
+# forget_article had its go at it.
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=Article)
+def push_recent_article(sender, instance: Article, **kwargs):
+    if not instance.draft and instance.has_changed('draft'):
+        transaction.on_commit(lambda: push([instance.pk]))
+
+
+# noinspection PyUnusedLocal
+@receiver(articles_created, sender=Article)
+def push_recent_articles(sender, articles: typing.List[Article], **kwargs):
+    transaction.on_commit(lambda: push([article.pk for article in articles if not article.draft]))
+
+
+# Articles are queued to be related again (read article.related)
+# whenever whatever they're similar by - being published, tags and
+# Topic - changes. The queue is drained outside of requests.
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=Article)
+def relate_article(sender, instance: Article, **kwargs):
+    if instance.has_changed('draft') or instance.has_changed('topic_id'):
+        related.enqueue([instance.pk])
+
+
+# noinspection PyUnusedLocal
+@receiver(m2m_changed, sender=Article.tags.through)
+def relate_tagged_article(sender, instance, action: str, pk_set=None, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if isinstance(instance, Article):
+        related.enqueue([instance.pk])
+    elif pk_set:
+        related.enqueue(pk_set)
+
+
+# noinspection PyUnusedLocal
+@receiver(articles_created, sender=Article)
+def relate_articles(sender, articles: typing.List[Article], **kwargs):
+    related.enqueue(article.pk for article in articles)
+
+
+# noinspection PyUnusedLocal
+@receiver(m2m_changed, sender=Article.tags.through)
+def forget_tagged_article(sender, instance, action: str, pk_set=None, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if isinstance(instance, Article):
+        forget([instance.slug])
+    elif pk_set:
+        forget_articles(pk__in=pk_set)
+
+
+# Tags aren't a column of the Article table - the changed_on of
+# tagged Articles is touched so that the ETags of the lists they're
+# in change (read ArticleQuerySet.versions) but updated_on isn't
+# since that's the date Articles are published with.
+
+def touch(**filters) -> None:
+    Article.objects.filter(**filters).update(changed_on=timezone.now())
+
+
+# noinspection PyUnusedLocal
+@receiver(m2m_changed, sender=Article.tags.through)
+def touch_tagged_article(sender, instance, action: str, pk_set=None, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if isinstance(instance, Article):
+        touch(pk=instance.pk)
+    elif pk_set:
+        touch(pk__in=pk_set)
+
+
+# Deletes cascade (or set Articles' foreign keys to NULL)
+# without signals - the Articles are looked up beforehand.
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=Tag)
+def touch_tag_articles(sender, instance: Tag, created: bool = False, **kwargs):
+    # A renamed tag changes every Article it's on.
+    if not created:
+        forget_articles(tags__in=[instance])
+        touch(tags__in=[instance])
+
+
+# noinspection PyUnusedLocal
+@receiver(pre_delete, sender=Tag)
+def forget_tag_articles(sender, instance: Tag, **kwargs):
+    forget_articles(tags__in=[instance])
+    touch(tags__in=[instance])
+
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=Topic)
+@receiver(pre_delete, sender=Topic)
+def forget_topic_articles(sender, instance: Topic, **kwargs):
+    forget_articles(topic_id=instance.pk)
+
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def forget_author_articles(sender, instance, **kwargs):
+    forget_articles(author_id=instance.pk)
@@ -0,0 +1,189 @@
+"""
+A per-process inverted index of the tags of published Articles - it maps
+every (lowercased) tag name to a sorted array of the ids of the Articles
+tagged with it so that tag queries are answered by intersecting (or
+merging) a few arrays in memory instead of joining through taggit's
+generic TaggedItem table.
+
+The index is built by the first query that needs it with a scan of
+TaggedItem in batches and is kept current by the signals in
+article/signals.py. Those only fire for the process that made the change
+though, so once it's older than settings.TAG_INDEX_TTL seconds it's
+rebuilt in a background thread to pick up the changes of other processes
+- queries go on being answered by the old postings in the meantime. Only
+one build ever runs at a time: queries that find the index missing wait
+for the build in progress instead of starting one of their own.
+"""
+import time
+import typing
+import threading
+
+import numpy as np
+
+from django.db import connection
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+
+from taggit.models import TaggedItem
+
+from article.models import Article, TAG_MATCHES
+
+EMPTY = np.empty(0, dtype=np.int64)
+
+
+class TagIndex(object):
+
+    # TaggedItem rows read per query while building.
+    BATCH_SIZE = 5000
+
+    def __init__(self):
+        # Guards the postings and the tags of every Article while
+        # they're updated - builds are serialized by _building.
+        self._lock = threading.Lock()
+        self._building = threading.Lock()
+        self._refreshing = False
+
+        self._postings: typing.Optional[typing.Dict[str, np.ndarray]] = None
+        self._tags: typing.Dict[int, typing.FrozenSet[str]] = {}
+        self._built_on = 0.0
+
+    @staticmethod
+    def normalize(tag: str) -> str:
+        return tag.strip().lower()
+
+    @property
+    def built(self) -> bool:
+        return self._postings is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings = None
+            self._tags = {}
+
+    def build(self) -> None:
+        """
+        Scans the tags of every published Article - walking TaggedItem by
+        primary key, one batch at a time, since MySQL can't stream a result
+        set - and swaps the new postings in once they're all sorted.
+        """
+        ids: typing.Dict[str, typing.List[int]] = {}
+        tags: typing.Dict[int, typing.Set[str]] = {}
+        items = TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Article),
+            object_id__in=Article.objects.filter(draft=False).values('pk'),
+        ).order_by('pk')
+
+        last_pk = 0
+        while True:
+            rows = list(items.filter(pk__gt=last_pk).values_list('pk', 'tag__name', 'object_id')[:self.BATCH_SIZE])
+            if not rows:
+                break
+            for _, name, article_id in rows:
+                name = self.normalize(name)
+                ids.setdefault(name, []).append(article_id)
+                tags.setdefault(article_id, set()).add(name)
+            last_pk = rows[-1][0]
+
+        postings = {name: np.unique(np.array(article_ids, dtype=np.int64)) for name, article_ids in ids.items()}
+
+        with self._lock:
+            self._postings = postings
+            self._tags = {article_id: frozenset(names) for article_id, names in tags.items()}
+            self._built_on = time.monotonic()
+
+    def refresh(self) -> None:
+        """
+        Builds the index - unless it was built by somebody else while
+        waiting for their build to finish, so that any number of threads
+        that find it missing (or stale) at once only build it once.
+        """
+        built_on = self._built_on
+        with self._building:
+            if not self.built or self._built_on == built_on:
+                self.build()
+
+    def refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self.background_refresh, daemon=True).start()
+
+    def background_refresh(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            self._refreshing = False
+            # Every thread has a connection of its own.
+            connection.close()
+
+    def postings(self) -> typing.Dict[str, np.ndarray]:
+        if not self.built:
+            self.refresh()
+        elif time.monotonic() - self._built_on > settings.TAG_INDEX_TTL:
+            self.refresh_in_background()
+        return self._postings
+
+    def search(self, tags: typing.Iterable[str], match: str = 'all') -> np.ndarray:
+        """
+        Returns the sorted ids of the published Articles tagged with all
+        (or with any, for match='any') of the given tag names.
+        """
+        if match not in TAG_MATCHES:
+            raise ValueError(f"Unknown tag match '{match}'.")
+
+        postings = self.postings()
+        arrays = [postings.get(name, EMPTY) for name in {self.normalize(tag) for tag in tags}]
+        if not arrays:
+            return EMPTY
+
+        if match == 'any':
+            return np.unique(np.concatenate(arrays))
+
+        # Smallest first - every intersection can
+        # only be as large as the smallest array.
+        arrays.sort(key=len)
+        ids = arrays[0]
+        for array in arrays[1:]:
+            if not len(ids):
+                break
+            ids = np.intersect1d(ids, array, assume_unique=True)
+        return ids
+
+    def update(self, article_id: int, tags: typing.Iterable[str] = ()) -> None:
+        """
+        Replaces the tags an Article is indexed under - pass no tags to
+        take it out of the index (drafts and deleted Articles). Only the
+        postings of the tags that were added or removed are touched.
+        """
+        if not self.built:
+            return
+
+        tags = frozenset(self.normalize(tag) for tag in tags)
+        with self._lock:
+            previous = self._tags.get(article_id, frozenset())
+
+            # Postings are never changed in place - queries
+            # might be reading them - they're replaced.
+            for name in previous - tags:
+                ids = self._postings.get(name, EMPTY)
+                position = np.searchsorted(ids, article_id)
+                if position < len(ids) and ids[position] == article_id:
+                    ids = np.delete(ids, position)
+                    if len(ids):
+                        self._postings[name] = ids
+                    else:
+                        del self._postings[name]
+            for name in tags - previous:
+                ids = self._postings.get(name, EMPTY)
+                position = np.searchsorted(ids, article_id)
+                if position == len(ids) or ids[position] != article_id:
+                    self._postings[name] = np.insert(ids, position, article_id)
+
+            if tags:
+                self._tags[article_id] = tags
+            else:
+                self._tags.pop(article_id, None)
+
+
+tag_index = TagIndex()
@@ -0,0 +1,145 @@
+"""
+Bulk tagging of Articles. Taggit's manager.add looks every tag up on its
+own (once per tag when TAGGIT_CASE_INSENSITIVE is set) and inserts the
+tagged items one tag at a time - this module tags any number of Articles
+with any number of tags in a constant number of queries instead:
+
+    1. names are looked up in a small per-process cache of tag ids,
+    2. the ones that weren't are looked up in a single query,
+    3. tags that don't exist yet are created with one bulk insert and
+    4. all the TaggedItems are inserted with one more.
+
+The m2m_changed signals taggit would have sent are sent all the same so
+receivers (like the tag index's) can't tell the difference - except for
+Articles that were just created in bulk (read article.bulk), whose
+receivers' work is done for the whole batch at once instead.
+"""
+import typing
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.functions import Lower
+from django.db.models.signals import m2m_changed
+from django.contrib.contenttypes.models import ContentType
+
+from backend.utils import LRUCache, replace
+
+from taggit.models import Tag, TaggedItem
+
+# Maps (normalized) tag names to tag ids. Tags
+# are hardly ever deleted - when they are the
+# whole cache is cleared by article.signals.
+tag_ids = LRUCache(size=4096)
+
+
+def normalize(name: str) -> str:
+    return name.lower() if getattr(settings, 'TAGGIT_CASE_INSENSITIVE', False) else name
+
+
+def parse_tags(tags: str) -> typing.List[str]:
+    """
+    Splits a comma separated string of tags into its distinct tag names
+    - without spaces or quotes and in the order they were first given.
+    """
+    names: typing.Dict[str, str] = {}
+    for name in replace(tags, ' "\'').split(','):
+        if name:
+            names.setdefault(normalize(name), name)
+    return list(names.values())
+
+
+def fetch(names: typing.Collection[str]) -> typing.Dict[str, int]:
+    if getattr(settings, 'TAGGIT_CASE_INSENSITIVE', False):
+        tags = Tag.objects.annotate(lowered=Lower('name')).filter(lowered__in=names)
+    else:
+        tags = Tag.objects.filter(name__in=names)
+    return {normalize(name): pk for pk, name in tags.values_list('pk', 'name')}
+
+
+def resolve(names: typing.Iterable[str]) -> typing.Dict[str, int]:
+    """
+    Maps the normalized form of every tag name to the id of its
+    tag - creating the tags that don't exist yet along the way.
+    """
+    ids: typing.Dict[str, int] = {}
+    missing: typing.Dict[str, str] = {}
+
+    for name in names:
+        key = normalize(name)
+        pk = tag_ids.get(key)
+        if pk is None:
+            missing.setdefault(key, name)
+        else:
+            ids[key] = pk
+
+    if not missing:
+        return ids
+
+    found = fetch(missing)
+    new = [name for key, name in missing.items() if key not in found]
+    if new:
+        tags = [Tag(name=name) for name in new]
+        for tag in tags:
+            tag.slug = tag.slugify(tag.name)
+
+        # Tags created by someone else in the meantime are
+        # simply looked up again - and so are the rare ones
+        # whose slug clashed with another tag's, which get
+        # created the slow way with a numbered slug.
+        Tag.objects.bulk_create(tags, ignore_conflicts=True)
+        found.update(fetch([normalize(name) for name in new]))
+        for name in new:
+            if normalize(name) not in found:
+                found[normalize(name)] = Tag.objects.create(name=name).pk
+
+    # Ids are only cached once they're committed - a rolled
+    # back transaction would leave the cache pointing at
+    # tags that never existed.
+    transaction.on_commit(lambda: remember(found))
+    ids.update(found)
+
+    return ids
+
+
+def remember(ids: typing.Mapping[str, int]) -> None:
+    for key, pk in ids.items():
+        tag_ids.set(key, pk)
+
+
+def add_tags(tags: typing.Iterable[typing.Tuple[Model, typing.Iterable[str]]], signals: bool = True) -> None:
+    """
+    Adds tags to any number of (instance, tag names) - tags an
+    instance already has are left alone. With signals=False no
+    m2m_changed signals are sent at all.
+    """
+    tags = [(instance, list(names)) for instance, names in tags]
+    ids = resolve(name for _, names in tags for name in names)
+
+    sets = [
+        (instance, {ids[normalize(name)] for name in names})
+        for instance, names in tags if names
+    ]
+
+    items = [
+        TaggedItem(content_type=ContentType.objects.get_for_model(instance), object_id=instance.pk, tag_id=pk)
+        for instance, pk_set in sets for pk in pk_set
+    ]
+
+    with transaction.atomic():
+        if signals:
+            for instance, pk_set in sets:
+                send(instance, 'pre_add', pk_set)
+
+        TaggedItem.objects.bulk_create(items, ignore_conflicts=True)
+
+        if signals:
+            for instance, pk_set in sets:
+                send(instance, 'post_add', pk_set)
+
+
+def send(instance: Model, action: str, pk_set: typing.Set[int]) -> None:
+    m2m_changed.send(
+        sender=TaggedItem, instance=instance, action=action,
+        reverse=False, model=Tag, pk_set=pk_set, using=instance._state.db
+    )
@@ -1 +1,23 @@
-from article.tests.views import ArticleRetrievalTest, ArticleCreationTest
+from article.tests.views import (
+    ArticleRetrievalTest,
+    ArticleCreationTest,
+    ArticleBulkCreationTest,
+    ArticleDetailCacheTest,
+    RenderedArticleTest,
+    RendererTest,
+    RecentArticleBufferTest,
+    RelatedArticleTest,
+    ResolvedThumbnailTest,
+    ConditionalGetTest,
+    ArticleTimelinePaginationTest,
+)
+from article.tests.scoring import (
+    ClarentBatchTest,
+    ClarentBenchmarkTest,
+    ClarentEngineTest,
+    ClarentStreamTest,
+    RescoreArticlesTest,
+    ObjectivityBreakdownTest,
+    ObjectivityQueueTest,
+)
+from article.tests.tags import TagIndexTest, BulkTaggingTest
@@ -0,0 +1,394 @@
+import io
+import os
+import array
+import random
+import tempfile
+import itertools
+import tracemalloc
+
+from unittest import mock
+
+from django.test import TestCase, SimpleTestCase
+from django.utils import lorem_ipsum
+from django.shortcuts import reverse
+from django.core.management import call_command, CommandError
+
+from faker import Faker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from backend import utils as u
+
+from clarent import lexicon, benchmark
+from clarent.clarent import Clarent, Breakdown
+from article import scoring
+from article.models import Article, ObjectivityJob, ObjectivityScore, ObjectivityBreakdown
+from topic.tests.generators import create_topic
+from author.tests.generators import create_author
+from article.tests.generators import create_article
+
+
+class ObjectivityQueueTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.articles = [
+            create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+            for _ in range(3)
+        ]
+
+    def setUp(self) -> None:
+        scoring.local_cache.clear()
+
+    def test_new_articles_are_queued(self):
+        """
+        Saving an Article shouldn't score it - it should just
+        leave it pending with a job waiting in the queue.
+        """
+        for article in self.articles:
+            article.refresh_from_db()
+            self.assertIsNone(article.objectivity)
+            self.assertFalse(article.objective)
+            self.assertTrue(ObjectivityJob.objects.filter(article=article).exists())
+
+    def test_worker_drains_queue(self):
+        call_command('score_articles', once=True, stdout=io.StringIO())
+
+        self.assertFalse(ObjectivityJob.objects.exists())
+        for article in self.articles:
+            article.refresh_from_db()
+            self.assertAlmostEqual(article.objectivity, Clarent(article.content).objectivity)
+
+    def test_unchanged_content_is_not_queued(self):
+        call_command('score_articles', once=True, stdout=io.StringIO())
+
+        article = Article.objects.get(pk=random.choice(self.articles).pk)
+        article.draft = True
+        article.save()
+
+        self.assertIsNotNone(article.objectivity)
+        self.assertFalse(ObjectivityJob.objects.exists())
+
+        article.content += '\n\nThis is a wonderful, terrible addition.'
+        article.save()
+
+        self.assertIsNone(Article.objects.get(pk=article.pk).objectivity)
+        self.assertTrue(ObjectivityJob.objects.filter(article=article).exists())
+
+    def test_identical_content_is_scored_once(self):
+        """
+        Once some content has been scored, every other Article with the
+        same content gets its score straight from the cache.
+        """
+        call_command('score_articles', once=True, stdout=io.StringIO())
+        original = Article.objects.get(pk=random.choice(self.articles).pk)
+
+        for local in (True, False):
+            if not local:
+                scoring.local_cache.clear()
+            duplicate = Article.objects.create(
+                title=f'{original.title} {local}',
+                content=original.content,
+                topic_id=self.topic.id,
+                author_id=self.author.id,
+            )
+            self.assertEqual(duplicate.objectivity, original.objectivity)
+            self.assertFalse(ObjectivityJob.objects.filter(article=duplicate).exists())
+
+    def test_edits_only_rescore_changed_paragraphs(self):
+        call_command('score_articles', once=True, stdout=io.StringIO())
+
+        article = Article.objects.get(pk=random.choice(self.articles).pk)
+        paragraphs = Clarent.paragraphs(article.content)
+        paragraphs[1] = 'This is a wonderful, terrible paragraph.'
+        article.content = '\n\n'.join(paragraphs)
+        article.save()
+
+        with mock.patch.object(Clarent, 'breakdown_many', wraps=Clarent.breakdown_many) as breakdown_many:
+            call_command('score_articles', once=True, stdout=io.StringIO())
+
+        breakdown_many.assert_called_once()
+        self.assertEqual(list(breakdown_many.call_args[0][0]), [paragraphs[1]])
+
+        article.refresh_from_db()
+        self.assertAlmostEqual(article.objectivity, Clarent(article.content).objectivity)
+
+    def test_cache_eviction(self):
+        call_command('score_articles', once=True, stdout=io.StringIO())
+        paragraphs = {
+            paragraph for article in self.articles
+            for paragraph in Clarent.paragraphs(article.content)
+        }
+        self.assertEqual(ObjectivityScore.objects.count(), len(paragraphs))
+
+        newest = ObjectivityScore.objects.order_by('-last_used', '-pk').first()
+        self.assertEqual(scoring.evict(1), len(paragraphs) - 1)
+        self.assertEqual(list(ObjectivityScore.objects.all()), [newest])
+        self.assertEqual(scoring.evict(1), 0)
+
+
+class ObjectivityBreakdownTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.article = create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+
+    def setUp(self) -> None:
+        scoring.local_cache.clear()
+
+    def get_breakdown(self, slug: str):
+        response = self.client.get(reverse('article:objectivity', kwargs={'slug': slug}))
+        return response.status_code, u.get_json(response)
+
+    def assertBreakdown(self, article: Article, data: dict) -> None:
+        sentences = [
+            sentence for paragraph in Clarent.paragraphs(article.content)
+            for sentence in (paragraph[offset:offset + length] for offset, length in Clarent.sentences(paragraph))
+        ]
+
+        self.assertEqual(data['objectivity'], article.objectivity)
+        self.assertEqual(len(data['offsets']), len(sentences))
+        for offset, length, objectivity, sentence in zip(
+                data['offsets'], data['lengths'], data['objectivities'], sentences):
+            self.assertEqual(article.content[offset:offset + length], sentence)
+            self.assertAlmostEqual(objectivity, 1 - Clarent.get_subjectivity(sentence), places=4)
+
+    def test_pending_article_has_no_breakdown(self):
+        status_code, data = self.get_breakdown(self.article.slug)
+
+        self.assertEqual(status_code, status.HTTP_200_OK)
+        self.assertEqual(data, {'objectivity': None, 'offsets': [], 'lengths': [], 'objectivities': []})
+
+    def test_breakdown_is_served(self):
+        call_command('score_articles', once=True, stdout=io.StringIO())
+
+        status_code, data = self.get_breakdown(self.article.slug)
+
+        self.assertEqual(status_code, status.HTTP_200_OK)
+        self.assertBreakdown(Article.objects.get(pk=self.article.pk), data)
+
+    def test_breakdown_of_cached_content(self):
+        """
+        Content that was scored before gets its breakdown put
+        together from the cache without going through the queue.
+        """
+        call_command('score_articles', once=True, stdout=io.StringIO())
+
+        duplicate = Article.objects.create(
+            title=f'{self.article.title} again',
+            content=f'Some new\n\n\n{self.article.content}',
+            topic_id=self.topic.id,
+            author_id=self.author.id,
+        )
+        self.assertTrue(duplicate.pending)
+        call_command('score_articles', once=True, stdout=io.StringIO())
+
+        duplicate.content = self.article.content + '\n\n  Some new'
+        with mock.patch.object(Clarent, 'breakdown_many') as breakdown_many:
+            duplicate.save()
+        breakdown_many.assert_not_called()
+
+        self.assertFalse(duplicate.pending)
+        status_code, data = self.get_breakdown(duplicate.slug)
+        self.assertBreakdown(duplicate, data)
+
+    def test_breakdown_round_trip(self):
+        breakdown = Breakdown()
+        for offset in range(10):
+            breakdown.append(offset * 5, 4, offset / 10)
+
+        self.assertEqual(list(Breakdown.from_bytes(breakdown.to_bytes())), list(breakdown))
+        self.assertEqual(len(breakdown.to_bytes()), 12 * len(breakdown))
+
+    def test_breakdown_of_missing_article(self):
+        status_code, data = self.get_breakdown('missing')
+
+        self.assertEqual(status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(data, {'detail': 'Article not found.'})
+        self.assertFalse(ObjectivityBreakdown.objects.filter(article__slug='missing').exists())
+
+
+class RescoreArticlesTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.articles = [
+            create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+            for _ in range(5)
+        ]
+
+    def test_rescore_every_article(self):
+        call_command('rescore_articles', batch_size=2, stdout=io.StringIO())
+
+        for article in Article.objects.filter(pk__in=[a.pk for a in self.articles]):
+            self.assertAlmostEqual(article.objectivity, Clarent(article.content).objectivity)
+            self.assertTrue(ObjectivityBreakdown.objects.filter(article=article).exists())
+
+    def test_rescore_resumes_from_checkpoint(self):
+        pks = sorted(article.pk for article in self.articles)
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, 'checkpoint')
+            with open(checkpoint, 'w') as f:
+                f.write(str(pks[2]))
+
+            call_command('rescore_articles', checkpoint=checkpoint, stdout=io.StringIO())
+
+            with open(checkpoint) as f:
+                self.assertEqual(int(f.read()), pks[-1])
+
+        scored = Article.objects.filter(objectivity__isnull=False).values_list('pk', flat=True)
+        self.assertEqual(sorted(scored), pks[3:])
+
+
+class ClarentBatchTest(SimpleTestCase):
+
+    def test_score_many_matches_single_scores(self):
+        texts = [lorem_ipsum.paragraph() for _ in range(Clarent.POOL_THRESHOLD + 5)]
+        expected = [Clarent(text).objectivity for text in texts]
+
+        for processes in (1, 2):
+            scores = Clarent.score_many(texts, processes=processes, chunksize=7)
+            self.assertIsInstance(scores, array.array)
+            self.assertEqual(list(scores), expected)
+
+        self.assertEqual(len(Clarent.score_many([])), 0)
+
+
+class ClarentEngineTest(SimpleTestCase):
+
+    def setUp(self) -> None:
+        self.addCleanup(Clarent.use, Clarent.engine)
+
+    def test_lexicon_engine_matches_pattern(self):
+        fake = Faker()
+        fake.seed_instance(6)
+        texts = [fake.sentence(170) for _ in range(10)] + [
+            "I don't think it's a very good idea. Really not bad... Truly!",
+            'Not a very nice, not really terrible movie.',
+            'A good key/value store, and/or a very bad one - not great/terrible either.',
+            "Mr. Smith DON'T (e.g. really not good), wait...very nice `.__main__`.",
+        ]
+
+        Clarent.use('pattern')
+        expected = [Clarent.assess(text) for text in texts]
+
+        Clarent.use('lexicon')
+        for text, (subjectivity, _) in zip(texts, expected):
+            self.assertAlmostEqual(Clarent.get_subjectivity(text), subjectivity, places=9)
+
+        scores = Clarent.score_many(texts, processes=1)
+        self.assertEqual(list(scores), [Clarent(text).objectivity for text in texts])
+
+    def test_lexicon_engine_ignores_emoticons(self):
+        text = 'A good idea, a very bad one'
+        for extra in (' :(', ' : (', ' returns: (str,str)', ' (!)'):
+            Clarent.use('pattern')
+            self.assertNotAlmostEqual(Clarent.get_subjectivity(text + extra), Clarent.get_subjectivity(text))
+            expected = Clarent.get_subjectivity(text)
+
+            Clarent.use('lexicon')
+            self.assertAlmostEqual(Clarent.get_subjectivity(text + extra), expected, places=9)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            Clarent.use('gpt')
+
+
+class ClarentStreamTest(SimpleTestCase):
+
+    def setUp(self) -> None:
+        self.addCleanup(Clarent.use, Clarent.engine)
+
+    @staticmethod
+    def cut(text: str, pieces: int):
+        cuts = sorted(random.sample(range(len(text) + 1), pieces))
+        return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+    def test_stream_matches_one_shot(self):
+        fake = Faker()
+        text = '\n\n \n'.join(fake.sentence(120) for _ in range(4)) + \
+            '\n\nReally not\n very good.\n\n\n'
+
+        Clarent.use('lexicon')
+        expected = Clarent(text).objectivity
+
+        # Streams score with the lexicon engine
+        # whichever engine Clarent is set to use.
+        for engine in ('pattern', 'lexicon'):
+            Clarent.use(engine)
+            for pieces in (0, 10, 100):
+                stream = Clarent.stream(self.cut(text, pieces))
+                self.assertAlmostEqual(stream.objectivity, expected, places=12)
+
+    def test_stream_memory_is_bounded(self):
+        # A single 8MB paragraph - no blank lines to cut it at.
+        chunk = 'It is a very good and really not bad idea. ' * 1500
+        chunks = 8 * 1024 * 1024 // len(chunk)
+
+        Clarent.use('pattern')
+        tracemalloc.start()
+        stream = Clarent.stream(itertools.repeat(chunk, chunks))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertLess(peak, 4 * 1024 * 1024)
+        Clarent.use('lexicon')
+        self.assertAlmostEqual(stream.objectivity, Clarent(chunk).objectivity, places=9)
+
+    def test_empty_stream(self):
+        self.assertEqual(Clarent.stream(['', ' \n\n ']).objectivity, Clarent('').objectivity)
+
+    def test_lexicon_chunks_match_one_shot(self):
+        fake = Faker()
+        engine = lexicon.LexiconEngine()
+        text = ' '.join(fake.sentence(50) for _ in range(20))
+
+        accumulator = engine.accumulator()
+        for chunk in self.cut(text, 200):
+            accumulator.feed(chunk)
+
+        subjectivity, weight = accumulator.result()
+        expected_subjectivity, expected_weight = engine.assess(text)
+        self.assertEqual(weight, expected_weight)
+        self.assertAlmostEqual(subjectivity, expected_subjectivity, places=12)
+
+
+class ClarentBenchmarkTest(SimpleTestCase):
+
+    def test_corpus_is_reproducible(self):
+        corpus = benchmark.generate_corpus(benchmark.KB, 4 * benchmark.KB, seed=7)
+        self.assertEqual(corpus, benchmark.generate_corpus(benchmark.KB, 4 * benchmark.KB, seed=7))
+        self.assertEqual(len(corpus), 4)
+        self.assertTrue(all(len(content) == benchmark.KB for content in corpus))
+
+    def test_regressions_past_threshold(self):
+        results = benchmark.benchmark(
+            ['lexicon'], [benchmark.KB], [1], budget=3 * benchmark.KB, processes=1, out=io.StringIO()
+        )
+        name, = results
+        baseline = {name: dict(results[name], docs_per_sec=results[name]['docs_per_sec'] * 1.5)}
+
+        self.assertEqual(len(benchmark.regressions(results, baseline, threshold=10)), 1)
+        self.assertEqual(benchmark.regressions(results, baseline, threshold=50), [])
+
+    def test_command(self):
+        options = {'engine': ['lexicon'], 'size': [benchmark.KB], 'batch_size': [1], 'budget': 3 * benchmark.KB}
+
+        with self.assertRaises(CommandError):
+            call_command('benchmark_clarent', save_baseline=True, stdout=io.StringIO(), **options)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            stdout = io.StringIO()
+            call_command('benchmark_clarent', baseline=path, save_baseline=True, stdout=stdout, **options)
+            self.assertIn('lexicon/1KB/batch=1', stdout.getvalue())
+            self.assertTrue(os.path.exists(path))
+
+            call_command('benchmark_clarent', baseline=path, threshold=100, stdout=io.StringIO(), **options)
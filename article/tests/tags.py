@@ -0,0 +1,252 @@
+import time
+import typing
+import itertools
+import threading
+from unittest import mock
+
+from django.db import connection
+from django.shortcuts import reverse
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from taggit.models import Tag
+
+from rest_framework.test import APITestCase
+
+from backend import utils as u
+from article.models import Article
+from article.tag_index import tag_index
+from article.tagging import add_tags, parse_tags, tag_ids
+from topic.tests.generators import create_topic
+from author.tests.generators import create_author
+from article.tests.generators import create_article, TAGS
+
+
+class TagIndexTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.articles = [
+            create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+            for _ in range(15)
+        ]
+        for article in cls.articles:
+            article.tags.add('Shared')
+
+    def setUp(self) -> None:
+        tag_index.clear()
+        self.addCleanup(tag_index.clear)
+
+    def assertIndexed(self, article: Article, tag: str, indexed: bool = True) -> None:
+        self.assertEqual(article.pk in tag_index.search([tag]), indexed)
+
+    def test_search_matches_database(self):
+        tags = list(Article.tags.all().values_list('name', flat=True)[:6])
+
+        for count in (1, 2, 3):
+            for combination in itertools.combinations(tags, count):
+                for match in ('all', 'any'):
+                    expected = sorted(
+                        Article.objects.filter(draft=False).tagged(combination, match).values_list('pk', flat=True)
+                    )
+                    self.assertEqual(list(tag_index.search(combination, match)), expected)
+
+        self.assertEqual(len(tag_index.search(['shared', 'SHARED '])), len(self.articles))
+        self.assertEqual(len(tag_index.search(['missing'])), 0)
+        self.assertEqual(len(tag_index.search([])), 0)
+
+    def test_signals_keep_index_current(self):
+        tag_index.build()
+        article = Article.objects.get(pk=self.articles[0].pk)
+
+        article.tags.add('fresh')
+        self.assertIndexed(article, 'fresh')
+
+        article.tags.remove('fresh')
+        self.assertIndexed(article, 'fresh', False)
+
+        article.draft = True
+        article.save()
+        self.assertIndexed(article, 'shared', False)
+
+        article.draft = False
+        article.save()
+        self.assertIndexed(article, 'shared')
+
+        article.delete()
+        self.assertIndexed(article, 'shared', False)
+
+    @override_settings(TAG_INDEX_TTL=0)
+    def test_index_expires(self):
+        tag_index.build()
+        Article.objects.filter(pk=self.articles[0].pk).update(draft=True)
+
+        # Stale postings keep being served while a single
+        # thread rebuilds them in the background.
+        with mock.patch('article.tag_index.threading') as threading_:
+            self.assertIndexed(self.articles[0], 'shared')
+            self.assertIndexed(self.articles[0], 'shared')
+            threading_.Thread.assert_called_once()
+
+            # The thread's connection is the test's here.
+            with mock.patch('article.tag_index.connection'):
+                threading_.Thread.call_args.kwargs['target']()
+            self.assertIndexed(self.articles[0], 'shared', False)
+
+    def test_missing_index_is_built_once(self):
+        builds = []
+
+        def build():
+            time.sleep(0.05)
+            builds.append(threading.get_ident())
+            tag_index._postings, tag_index._built_on = {}, time.monotonic()
+
+        with mock.patch.object(tag_index, 'build', build):
+            threads = [threading.Thread(target=tag_index.postings) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(builds), 1)
+
+    def test_updates_touch_their_tags_only(self):
+        tag_index.build()
+        article = self.articles[0]
+        others = {name: ids for name, ids in tag_index.postings().items() if name != 'fresh'}
+
+        tag_index.update(article.pk, [*article.tags.names(), 'Fresh'])
+        self.assertIndexed(article, 'fresh')
+        for name, ids in others.items():
+            self.assertIs(tag_index.postings()[name], ids)
+
+        tag_index.update(article.pk)
+        self.assertNotIn('fresh', tag_index.postings())
+        for name in article.tags.names():
+            self.assertIndexed(article, name, False)
+
+    def test_tag_view_pages(self):
+        tag_index.build()
+
+        url = f"{reverse('article:tags')}?tags=shared"
+        slugs = []
+        while url:
+            with self.assertNumQueries(4):
+                data = u.get_json(self.client.get(url))
+            slugs += [article['slug'] for article in data['results']]
+            url = data['next']
+
+        self.assertEqual(slugs, [article.slug for article in reversed(self.articles)])
+
+    @override_settings(TAG_INDEX=False)
+    def test_tag_view_without_index(self):
+        Article.objects.filter(pk=self.articles[3].pk).update(draft=True)
+        self.articles[4].tags.add('other')
+
+        for query, articles in (
+            ('tags=shared', [article for article in self.articles if article != self.articles[3]]),
+            ('tags=shared,other', [self.articles[4]]),
+            ('tags=missing,other&match=any', [self.articles[4]]),
+        ):
+            url = f"{reverse('article:tags')}?{query}"
+            slugs = []
+            while url:
+                data = u.get_json(self.client.get(url))
+                slugs += [article['slug'] for article in data['results']]
+                url = data['next']
+
+            self.assertEqual(slugs, [article.slug for article in reversed(articles)])
+
+        self.assertFalse(tag_index.built)
+
+    def test_tag_view_leaves_out_drafts(self):
+        tag_index.build()
+
+        # Drafted by another process - the index
+        # of this one doesn't know about it yet.
+        drafted = {article.pk for article in self.articles[:5] + self.articles[10:11]}
+        Article.objects.filter(pk__in=drafted).update(draft=True)
+
+        url = f"{reverse('article:tags')}?tags=shared"
+        pages = []
+        while url:
+            data = u.get_json(self.client.get(url))
+            pages.append([article['slug'] for article in data['results']])
+            url = data['next']
+
+        # The second page is left without any Articles at all.
+        self.assertEqual(pages[1], [])
+        self.assertEqual(
+            [slug for page in pages for slug in page],
+            [article.slug for article in reversed(self.articles) if article.pk not in drafted]
+        )
+
+
+class BulkTaggingTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.articles = [
+            create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+            for _ in range(3)
+        ]
+        Tag.objects.create(name='Existing')
+
+    def setUp(self) -> None:
+        tag_ids.clear()
+        self.addCleanup(tag_ids.clear)
+
+    def test_parse_tags(self):
+        self.assertEqual(parse_tags(' "Foo", bar,,FOO , \'baz\','), ['Foo', 'bar', 'baz'])
+        self.assertEqual(parse_tags(''), [])
+
+    def test_tags_are_added_in_constant_queries(self):
+        def tag(names: typing.List[str]) -> int:
+            tag_ids.clear()
+            with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+                add_tags([(article, names) for article in self.articles])
+            return len(queries)
+
+        few = tag(['existing', 'one', 'two'])
+        many = tag([f'tag{number}' for number in range(20)] + ['EXISTING'])
+        self.assertEqual(few, many)
+
+        # Cached tag ids save the lookups (and inserts) of tags.
+        self.assertLess(tag(['existing']), few)
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            add_tags([(self.articles[0], ['existing', 'one'])])
+        self.assertLess(len(queries), few)
+
+        self.assertEqual(Tag.objects.filter(name__iexact='existing').count(), 1)
+        for article in self.articles:
+            self.assertEqual(
+                set(article.tags.names()) - set(TAGS),
+                {'Existing', 'one', 'two', *(f'tag{number}' for number in range(20))}
+            )
+
+    def test_slug_clashes(self):
+        Tag.objects.create(name='Clash!', slug='clash')
+        add_tags([(self.articles[0], ['clash'])])
+        self.assertEqual(Tag.objects.get(name='clash').slug, 'clash_1')
+        self.assertIn('clash', self.articles[0].tags.names())
+
+    def test_deleted_tags_are_forgotten(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            add_tags([(self.articles[0], ['ephemeral'])])
+        self.assertIsNotNone(tag_ids.get('ephemeral'))
+        Tag.objects.get(name='ephemeral').delete()
+
+        self.assertIsNone(tag_ids.get('ephemeral'))
+        add_tags([(self.articles[1], ['ephemeral'])])
+        self.assertEqual(list(self.articles[1].tags.filter(name='ephemeral').values_list('name', flat=True)), ['ephemeral'])
+
+    def test_tag_index_follows(self):
+        tag_index.build()
+        self.addCleanup(tag_index.clear)
+
+        add_tags([(self.articles[0], ['indexed'])])
+        self.assertIn(self.articles[0].pk, tag_index.search(['indexed']))
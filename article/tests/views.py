@@ -1,14 +1,36 @@
+import io
+import uuid
 import random
 import typing
+import decimal
+import datetime
+import unittest
 import itertools
+from unittest import mock
 
 from backend import utils as u
+from backend import renderers
+from backend.renderers import RawJSON, JSONRenderer, ORJSONRenderer
 
-from django.utils import lorem_ipsum
+from django.db import connection
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import lorem_ipsum, timezone
+from django.utils.translation import gettext_lazy
 from django.shortcuts import reverse
+from django.utils.text import Truncator
+from django.test.utils import CaptureQueriesContext
 
 from topic.models import Topic
-from article.models import Article
+from article.bulk import MAX_BATCH_SIZE
+from article.scoring import drain
+from article.cache import detail_key
+from article.models import (
+    Article, ObjectivityJob, ObjectivityBreakdown, RenderedArticle, RelatedArticle, RelatedArticleJob
+)
+from article import recent, related
+from article.tagging import tag_ids
+from article.tag_index import tag_index
 from author.tests.generators import create_author
 from article.tests.generators import create_article
 from topic.tests.generators import (
@@ -17,12 +39,15 @@ from topic.tests.generators import (
 )
 from article.serializers import (
     ArticleListSerializer,
-    ArticleDetailSerializer
+    ArticleDetailSerializer,
+    FastArticleListSerializer,
 )
+from topic.serializers import TopicListSerializer, TopicDetailSerializer, FastTopicListSerializer
 
 from taggit.models import Tag
 from rest_framework import status
 from rest_framework.test import APITestCase
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
 
 
 class ArticleRetrievalTest(APITestCase):
@@ -45,6 +70,10 @@ class ArticleRetrievalTest(APITestCase):
             draft=True
         )
 
+    def setUp(self) -> None:
+        cache.clear()
+        tag_index.clear()
+
     def test_recent_article_retrieval(self):
         response = self.client.get(reverse('article:recent'))
         data = u.get_json(response)
@@ -58,6 +87,53 @@ class ArticleRetrievalTest(APITestCase):
         self.assertEqual(data['count'], Article.objects.filter(draft=False).count())
         self.assertEqual(data['results'], serialized_data)
 
+    def test_recent_articles_never_load_content(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('article:recent'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for query in context.captured_queries:
+            self.assertNotIn('"article_article"."content"', query['sql'])
+
+    def test_list_query_counts(self):
+        """
+        Lists take the same number of queries no matter how many
+        Articles (and tags, topics and authors of them) are listed.
+        """
+        tags = ','.join(Tag.objects.values_list('name', flat=True)[:1])
+        tag_index.build()
+
+        for iteration in range(2):
+            # Building the buffer of recent Articles (read article.recent)
+            # takes 4 queries and new Articles are pushed into it from then
+            # on - rendered, so the tag view only looks them up.
+            with self.assertNumQueries(4 if iteration == 0 else 0):
+                data = u.get_json(self.client.get(reverse('article:recent')))
+            self.assertEqual(data['count'], Article.objects.filter(draft=False).count())
+            with self.assertNumQueries(3):
+                self.client.get(f"{reverse('article:tags')}?tags={tags}")
+
+            # Tag ids are cached once they're committed too.
+            self.addCleanup(tag_ids.clear)
+            with self.captureOnCommitCallbacks(execute=True):
+                for _ in range(5):
+                    create_article(draft=False, author_id=create_author().id, topic_id=create_topic(self.author.pk).id)
+
+    def test_article_summary(self):
+        article = Article.objects.get(pk=random.choice(self.articles).pk)
+        words = article.content.split()
+
+        self.assertEqual(article.excerpt, Truncator(article.content).words(20, truncate=' …'))
+        self.assertEqual(article.word_count, len(words))
+        self.assertEqual(article.reading_time, -(-len(words) // Article.WORDS_PER_MINUTE))
+
+        article.content = ' '.join(words[:3])
+        article.save()
+        article.refresh_from_db()
+
+        self.assertEqual(article.excerpt, article.content)
+        self.assertEqual((article.word_count, article.reading_time), (3, 1))
+
     def test_limit_exceeding_recent_article(self):
         n = random.randint(21, 100)
         response = self.client.get(f"{reverse('article:recent')}?n={n}")
@@ -89,6 +165,52 @@ class ArticleRetrievalTest(APITestCase):
         ).data
         self.assertEqual(data, serialized_data)
 
+    def test_articles_matching_any_tag(self):
+        tags: typing.List[str] = list(Tag.objects.values_list('name', flat=True)[:3])
+
+        response = self.client.get(f'{reverse("article:tags")}?tags={",".join(tags)}&match=any')
+        data = u.get_json(response)
+
+        articles = Article.objects.filter(draft=False, tags__name__in=tags).distinct()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(data['results'], ArticleListSerializer(articles[:10], many=True).data)
+
+    def test_invalid_tag_match(self):
+        response = self.client.get(f'{reverse("article:tags")}?tags=a&match=most')
+        data = u.get_json(response)
+
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.assertEqual(data['detail'], 'Invalid value for match provided.')
+
+    def test_tag_benchmark(self):
+        out = io.StringIO()
+        call_command('benchmark_tags', max_tags=3, repeat=1, stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0].split(), ['tags', 'chained', 'ms', 'all', 'ms', 'any', 'ms'])
+        self.assertEqual([line.split()[0] for line in lines[1:]], ['1', '2', '3'])
+
+    def test_fast_list_serializer(self):
+        articles = Article.objects.filter(draft=False).for_listing()
+        serializer = FastArticleListSerializer()
+        self.assertEqual(
+            JSONRenderer().render(serializer.data(serializer.values(articles))),
+            JSONRenderer().render(ArticleListSerializer(articles, many=True).data)
+        )
+
+    def test_serializer_benchmark(self):
+        out = io.StringIO()
+        call_command('benchmark_serializers', rows=5, repeat=1, stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0].split(), ['benchmark', 'rows', 'rows/s', 'peak', 'MB', 'speedup'])
+        self.assertEqual([line.split()[0] for line in lines[1:]], [
+            f'{name}/{path}' for name in ('articles', 'topics', 'authors') for path in ('serializer', 'fast')
+        ])
+
+        # The generated rows are rolled back.
+        self.assertFalse(Article.objects.filter(slug__startswith='benchmark-article-').exists())
+
     def test_article_sorted_by_tags_retrieval(self):
         """
         Makes a combination of half of the tags in the test database and
@@ -124,6 +246,66 @@ class ArticleRetrievalTest(APITestCase):
         self.assertEqual(data['results'], [])
 
 
+class ArticleTimelinePaginationTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        articles = [
+            create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+            for _ in range(23)
+        ]
+
+        # Articles created at the same time are told apart by their id.
+        Article.objects.filter(pk__in=[article.pk for article in articles[5:15]]).update(
+            created_on=articles[5].created_on
+        )
+
+        cls.expected = list(
+            Article.objects.filter(topic=cls.topic).order_by('-created_on', '-pk').values_list('slug', flat=True)
+        )
+
+    def walk(self, url: str, direction: str) -> typing.List[typing.List[str]]:
+        pages = []
+        while url:
+            data = u.get_json(self.client.get(url))
+            pages.append([article['slug'] for article in data['results']])
+            url = data[direction]
+        return pages
+
+    def test_walk_forwards_and_backwards(self):
+        pages = self.walk(reverse('topic:articles', kwargs={'slug': self.topic.slug}), 'next')
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 3])
+        self.assertEqual(sum(pages, []), self.expected)
+
+        last = u.get_json(self.client.get(
+            reverse('topic:articles', kwargs={'slug': self.topic.slug})
+        ))
+        last = u.get_json(self.client.get(last['next']))
+        last = u.get_json(self.client.get(last['next']))
+        self.assertIsNone(last['next'])
+
+        backwards = self.walk(last['previous'], 'previous')
+        self.assertEqual(list(reversed(backwards)), pages[:-1])
+
+    def test_pages_cost_the_same(self):
+        url = reverse('topic:articles', kwargs={'slug': self.topic.slug})
+        while url:
+            # 2 of them compute the ETag (read backend.conditional)
+            # and 2 look up and store the rendered Articles.
+            with self.assertNumQueries(7):
+                url = u.get_json(self.client.get(url))['next']
+
+    def test_invalid_cursor(self):
+        url = reverse('topic:articles', kwargs={'slug': self.topic.slug})
+        for cursor in ('abc', 'W1sxXV0=', 'WzAsWyJub3QgYSBkYXRlIiwxXV0='):
+            response = self.client.get(f'{url}?cursor={cursor}')
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            self.assertEqual(u.get_json(response), {'detail': 'Invalid cursor.'})
+
+
 class ArticleCreationTest(APITestCase):
 
     @classmethod
@@ -235,3 +417,733 @@ class ArticleCreationTest(APITestCase):
         self.assertEqual(data, {
             'detail': 'Topic not found.'
         })
+
+
+class ArticleBulkCreationTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.author.verify()
+        cls.topic = create_topic(cls.author.pk)
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION=u.auth_header(self.author.get_key()))
+
+    def item(self, number: int, **kwargs) -> typing.Dict[str, typing.Any]:
+        return {
+            'title': f'Bulk Article {number}',
+            'tags': 'bulk,Number',
+            'content': f'Article number {number}.\n\n{lorem_ipsum.paragraphs(1)[0]}',
+            'topic_id': self.topic.id,
+            'thumbnail_url': f'https://picsum.photos/id/{THUMBNAIL_URL_IDs[0]}/1900/1080/',
+            **kwargs
+        }
+
+    def post(self, items) -> typing.Dict[str, typing.Any]:
+        response = self.client.post(reverse('article:bulk'), data=items, format='json')
+        data = u.get_json(response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, msg=data)
+        return data['results']
+
+    def test_per_item_statuses(self):
+        Article.objects.create(title='Taken', content='', topic=self.topic)
+
+        items = [
+            self.item(0),
+            self.item(1, draft=True, tags=['listed', 'TAGS']),
+            self.item(2, title='Taken'),
+            self.item(3, topic_id=Topic.objects.order_by('-pk').first().id + 10),
+            self.item(4, title=''),
+            self.item(5, topic_id='five'),
+            self.item(0),
+            'not an article',
+        ]
+
+        results = self.post(items)
+
+        self.assertEqual(results, [
+            {'status': 201, 'slug': 'bulk-article-0'},
+            {'status': 201, 'slug': 'bulk-article-1'},
+            {'status': 409, 'detail': "Article with title 'Taken' exists."},
+            {'status': 404, 'detail': 'Topic not found.'},
+            {'status': 422, 'detail': "Field 'title' not provided."},
+            {'status': 422, 'detail': 'Invalid value for topic_id provided.'},
+            {'status': 409, 'detail': "Article with title 'Bulk Article 0' exists."},
+            {'status': 422, 'detail': 'Expected an object.'},
+        ])
+
+        first, second = Article.objects.get(slug='bulk-article-0'), Article.objects.get(slug='bulk-article-1')
+        self.assertEqual(first.author_id, self.author.id)
+        self.assertTrue(first.excerpt.startswith('Article number 0.'))
+        self.assertEqual(first.word_count, len(first.content.split()))
+        self.assertEqual(set(first.tags.names()), {'bulk', 'Number'})
+        self.assertEqual(set(second.tags.names()), {'listed', 'TAGS'})
+        self.assertTrue(second.draft)
+
+        # Pending Articles are queued for scoring like any other.
+        self.assertTrue(first.pending)
+        self.assertTrue(ObjectivityJob.objects.filter(article=first).exists())
+
+        self.assertEqual(
+            [article['slug'] for article in u.get_json(self.client.get(reverse('search:search') + '?q=number'))['results']],
+            ['bulk-article-0']
+        )
+
+    def test_scored_content_is_not_queued(self):
+        article = Article.objects.create(title='Scored', content=self.item(0)['content'], topic=self.topic)
+        drain()
+
+        self.post([self.item(0)])
+
+        created = Article.objects.get(slug='bulk-article-0')
+        self.assertEqual(created.objectivity, Article.objects.get(pk=article.pk).objectivity)
+        self.assertFalse(ObjectivityJob.objects.filter(article=created).exists())
+        self.assertTrue(ObjectivityBreakdown.objects.filter(article=created).exists())
+
+    def test_constant_queries(self):
+        def create(items) -> int:
+            with CaptureQueriesContext(connection) as queries:
+                self.post(items)
+            # Search postings are inserted a thousand at a time.
+            return len([query for query in queries if 'INSERT INTO "search_posting"' not in query['sql']])
+
+        # Creates the tags - that's a couple more queries.
+        create([self.item(100)])
+        self.assertEqual(
+            create([self.item(number) for number in range(3)]),
+            create([self.item(number) for number in range(3, 15)])
+        )
+        self.assertEqual(Article.objects.filter(slug__startswith='bulk-article-').count(), 16)
+
+        # The tag index is kept current without a query per Article.
+        tag_index.build()
+        self.addCleanup(tag_index.clear)
+        self.assertEqual(
+            create([self.item(number) for number in range(15, 18)]),
+            create([self.item(number, draft=number % 2) for number in range(18, 30)])
+        )
+        self.assertEqual(
+            list(tag_index.search(['bulk', 'number'])),
+            sorted(Article.objects.filter(draft=False, tags__name='bulk').values_list('pk', flat=True))
+        )
+
+    def test_invalid_requests(self):
+        response = self.client.post(reverse('article:bulk'), data={'title': 'Not a list'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        response = self.client.post(reverse('article:bulk'), data=[{}] * (MAX_BATCH_SIZE + 1), format='json')
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        self.client.credentials()
+        response = self.client.post(reverse('article:bulk'), data=[self.item(0)], format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ArticleDetailCacheTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.article = create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def get(self, slug: str) -> typing.Dict[str, typing.Any]:
+        return u.get_json(self.client.get(reverse('article:detail', kwargs={'slug': slug})))
+
+    def assertFresh(self, article: Article) -> None:
+        self.assertEqual(self.get(article.slug), ArticleDetailSerializer(Article.objects.get(pk=article.pk)).data)
+
+    def test_cached_articles_skip_the_database(self):
+        # Looking up the rendered Article, loading the
+        # Article and its tags and storing it rendered.
+        with self.assertNumQueries(4):
+            self.get(self.article.slug)
+        with self.assertNumQueries(0):
+            data = self.get(self.article.slug)
+        self.assertEqual(data, ArticleDetailSerializer(self.article).data)
+
+        # The rendered Article outlives the cache.
+        cache.clear()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get(self.article.slug), data)
+
+    def test_article_changes(self):
+        article = Article.objects.get(pk=self.article.pk)
+        old_slug = article.slug
+        self.get(old_slug)
+
+        article.title = 'A Whole New Title'
+        article.save()
+        self.assertIsNone(cache.get(detail_key(old_slug)))
+        self.assertEqual(self.get(old_slug), {'detail': 'Not found.'})
+        self.assertFresh(article)
+
+        article.tags.add('freshly-added')
+        self.assertIn('freshly-added', self.get(article.slug)['tags'])
+
+        article.draft = True
+        article.save()
+        self.assertEqual(self.get(article.slug), {'detail': 'Not found.'})
+
+    def test_related_changes(self):
+        self.get(self.article.slug)
+        self.author.bio = 'A brand new bio.'
+        self.author.save()
+        self.assertEqual(self.get(self.article.slug)['author']['bio'], 'A brand new bio.')
+
+        self.topic.name = 'Renamed Topic'
+        self.topic.save()
+        self.assertEqual(self.get(self.article.slug)['topic'], 'Renamed Topic')
+
+        tag = self.article.tags.first()
+        tag.name = 'renamed-tag'
+        tag.save()
+        self.assertIn('renamed-tag', self.get(self.article.slug)['tags'])
+
+        tag.delete()
+        self.assertNotIn('renamed-tag', self.get(self.article.slug)['tags'])
+
+    def test_scoring_forgets(self):
+        self.assertIsNone(self.get(self.article.slug)['objectivity'])
+        drain()
+        self.assertIsNotNone(self.get(self.article.slug)['objectivity'])
+
+
+class RenderedArticleTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.articles = [
+            create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+            for _ in range(3)
+        ]
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def url(self) -> str:
+        return reverse('topic:articles', kwargs={'slug': self.topic.slug})
+
+    def rendered(self, form: str = RenderedArticle.LISTING) -> typing.Set[int]:
+        return set(RenderedArticle.objects.filter(form=form).values_list('article_id', flat=True))
+
+    def test_rendered_lists(self):
+        response = self.client.get(self.url())
+        self.assertEqual(self.rendered(), {article.pk for article in self.articles})
+
+        # Stored Articles are spliced in as they are - the
+        # bytes are the same as if they were serialized.
+        with mock.patch.object(ArticleListSerializer, 'to_representation') as serialize:
+            self.assertEqual(self.client.get(self.url()).content, response.content)
+        serialize.assert_not_called()
+
+        data = u.get_json(response)
+        self.assertEqual(response.content, JSONRenderer().render(data))
+        self.assertEqual(data['results'], ArticleListSerializer(
+            Article.objects.filter(topic=self.topic).order_by('-created_on', '-pk'), many=True
+        ).data)
+
+    def test_changes_render_again(self):
+        article = Article.objects.get(pk=self.articles[0].pk)
+        slug = article.slug
+
+        def fresh() -> typing.Dict[str, typing.Any]:
+            self.client.get(self.url())
+            self.client.get(reverse('article:detail', kwargs={'slug': slug}))
+            results = {item['slug']: item for item in u.get_json(self.client.get(self.url()))['results']}
+            return results[slug]
+
+        fresh()
+        article.content = 'Brand new content.'
+        article.save()
+        self.assertNotIn(article.pk, self.rendered(RenderedArticle.DETAIL))
+        self.assertEqual(fresh()['content'], 'Brand new content.')
+
+        article.tags.add('rendered-again')
+        self.assertIn('rendered-again', fresh()['tags'])
+
+        self.author.first_name = 'Renamed'
+        self.author.save()
+        self.assertNotIn(article.pk, self.rendered())
+        self.assertEqual(fresh()['author'], str(self.author))
+
+        self.topic.name = 'Renamed Topic'
+        self.topic.save()
+        self.assertEqual(fresh()['topic'], 'Renamed Topic')
+
+        Tag.objects.filter(name='rendered-again').update(name='renamed-tag')
+        Tag.objects.get(name='renamed-tag').save()
+        self.assertIn('renamed-tag', fresh()['tags'])
+
+    def test_raw_json(self):
+        renderer = JSONRenderer()
+        data = {'results': [RawJSON('{"a":[1,2]}'), 'not raw'], 'next': None}
+        self.assertEqual(renderer.render(data), b'{"results":[{"a":[1,2]},"not raw"],"next":null}')
+        self.assertEqual(renderer.render(RawJSON('[]')), b'[]')
+
+
+class RendererTest(APITestCase):
+
+    data = ReturnDict({
+        'created_on': datetime.datetime(2026, 10, 17, 12, 30, 5, 123456, tzinfo=timezone.utc),
+        'day': datetime.date(2026, 10, 17),
+        'timestamp': 'Oct. 17, 2026',
+        'key': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'price': decimal.Decimal('1.50'),
+        'label': gettext_lazy('Not found.'),
+        'text': 'Ünïcode \u2028 and \u2029 separators',
+        'numbers': (1, 2.5, None, True),
+        1: 'integer key',
+        'results': ReturnList([{'nested': {'deep': [RawJSON('"not spliced this deep"')]}}, RawJSON('{"a":1}')],
+                              serializer=None),
+    }, serializer=None)
+
+    def test_orjson_renders_the_same_json(self):
+        expected = JSONRenderer().render(self.data)
+        self.assertEqual(ORJSONRenderer().render(self.data), expected)
+        self.assertEqual(ORJSONRenderer().render(RawJSON('[1]')), b'[1]')
+
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(ORJSONRenderer().render(self.data), expected)
+
+        indented = 'application/json; indent=4'
+        self.assertEqual(
+            ORJSONRenderer().render(self.data, indented), JSONRenderer().render(self.data, indented)
+        )
+
+    @unittest.skipIf(renderers.msgpack is None, 'msgpack is not installed.')
+    def test_message_pack(self):
+        url = reverse('article:recent')
+        expected = u.get_json(self.client.get(url))
+        response = self.client.get(url, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(renderers.msgpack.unpackb(response.content), expected)
+
+
+class RecentArticleBufferTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.articles = [
+            create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+            for _ in range(3)
+        ]
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.addCleanup(tag_ids.clear)
+
+    def get(self, n: int = recent.SIZE) -> typing.List[str]:
+        data = u.get_json(self.client.get(f"{reverse('article:recent')}?n={n}"))
+        return [article['slug'] for article in data['results'] + self.next(data)]
+
+    def next(self, data: typing.Dict[str, typing.Any]) -> typing.List[typing.Dict[str, typing.Any]]:
+        return u.get_json(self.client.get(data['next']))['results'] if data['next'] else []
+
+    def expected(self, n: int = recent.SIZE) -> typing.List[str]:
+        return list(Article.objects.filter(draft=False).values_list('slug', flat=True)[:n])
+
+    def publish(self, **kwargs) -> Article:
+        with self.captureOnCommitCallbacks(execute=True):
+            return create_article(author_id=self.author.id, topic_id=self.topic.id, **kwargs)
+
+    def test_articles_are_pushed(self):
+        self.assertEqual(self.get(), self.expected())
+
+        article = self.publish(draft=False)
+        expected = self.expected(2)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(2), expected)
+        self.assertEqual(self.get()[0], article.slug)
+
+        draft = self.publish(draft=True)
+        self.assertNotIn(draft.slug, self.get())
+
+        draft.draft = False
+        with self.captureOnCommitCallbacks(execute=True):
+            draft.save()
+        self.assertEqual(self.get(), self.expected())
+
+    def test_articles_are_taken_out(self):
+        self.get()
+
+        article = Article.objects.get(pk=self.articles[0].pk)
+        article.title = 'Renamed In The Buffer'
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save()
+        self.assertIn('renamed-in-the-buffer', self.get())
+
+        article.draft = True
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save()
+        self.assertEqual(self.get(), self.expected())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Article.objects.get(pk=self.articles[1].pk).delete()
+        expected = self.expected()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(), expected)
+
+    def test_full_buffer(self):
+        for _ in range(recent.SIZE):
+            self.publish(draft=False)
+        self.assertEqual(self.get(), self.expected())
+
+        # The oldest Article falls off the end.
+        self.publish(draft=False)
+        self.assertEqual(self.get(), self.expected())
+
+        # Another one has to take the place of a
+        # removed one - it's looked up again.
+        with self.captureOnCommitCallbacks(execute=True):
+            Article.objects.filter(draft=False).first().delete()
+        self.assertIsNone(cache.get(recent.KEY))
+        self.assertEqual(self.get(), self.expected())
+
+    def test_invalid_n(self):
+        for n in ('abc', -1, recent.SIZE + 1):
+            response = self.client.get(f"{reverse('article:recent')}?n={n}")
+            self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+
+
+class RelatedArticleTest(APITestCase):
+
+    # (topic, tags) of every Article - 0 and 1
+    # share everything, 3 only shares a Topic.
+    ARTICLES = (
+        (0, 'related-x,related-y,related-z'),
+        (0, 'related-x,related-y,related-z'),
+        (1, 'related-x'),
+        (1, 'related-w'),
+        (0, 'related-y,related-w'),
+        (2, 'related-v'),
+    )
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topics = [create_topic(cls.author.pk) for _ in range(3)]
+        cls.articles = [cls.create(topic, tags) for topic, tags in cls.ARTICLES]
+        related.build()
+
+    @classmethod
+    def create(cls, topic: int, tags: str, draft: bool = False) -> Article:
+        article = create_article(draft=draft, author_id=cls.author.id, topic_id=cls.topics[topic].id)
+        article.tags.clear()
+        article.set_tags_from_string(tags)
+        return article
+
+    def setUp(self) -> None:
+        self.addCleanup(tag_ids.clear)
+
+    @staticmethod
+    def stored() -> typing.Set[typing.Tuple[int, int, int, float]]:
+        return {
+            (article_id, neighbour_id, rank, round(score, 6)) for article_id, neighbour_id, rank, score
+            in RelatedArticle.objects.values_list('article_id', 'neighbour_id', 'rank', 'score')
+        }
+
+    def get(self, slug: str) -> typing.List[str]:
+        return [article['slug'] for article in u.get_json(self.client.get(reverse('article:related', args=[slug])))]
+
+    def test_similarities(self):
+        features = {
+            article.pk: {*article.tags.names(), f'topic-{article.topic_id}'}
+            for article in Article.objects.filter(draft=False).prefetch_related('tags')
+        }
+        for pk, mine in features.items():
+            scores = sorted(
+                ((len(mine & theirs) / (len(mine) * len(theirs)) ** 0.5, other)
+                 for other, theirs in features.items() if other != pk and mine & theirs),
+                key=lambda entry: (-entry[0], -entry[1])
+            )
+            self.assertEqual(
+                list(RelatedArticle.objects.filter(article_id=pk).values_list('neighbour_id', flat=True)),
+                [other for _, other in scores]
+            )
+            self.assertEqual(
+                [round(score, 6) for score in RelatedArticle.objects.filter(article_id=pk).values_list('score', flat=True)],
+                [round(score, 6) for score, _ in scores]
+            )
+
+        first, second = self.articles[:2]
+        self.assertEqual(self.get(first.slug)[0], second.slug)
+        self.assertEqual(RelatedArticle.objects.get(article=first, rank=0).score, 1.0)
+        self.assertEqual(self.get(self.articles[5].slug), [])
+
+    def test_single_query(self):
+        slug = self.articles[0].slug
+        self.assertEqual(len(self.get(slug)), 3)
+        with self.assertNumQueries(1):
+            self.assertEqual(len(self.get(slug)), 3)
+
+        response = self.client.get(reverse('article:related', args=['no-such-article']))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_incremental_updates(self):
+        article = self.create(1, 'related-x,related-w')
+        draft = self.create(0, 'related-x,related-y,related-z', draft=True)
+
+        # Nothing is related until the queue is drained.
+        self.assertNotIn(article.slug, self.get(self.articles[3].slug))
+        self.assertEqual(related.drain(), 2)
+        self.assertEqual(related.drain(), 0)
+
+        self.assertFalse(RelatedArticle.objects.filter(article=draft).exists())
+        self.assertIn(article.slug, self.get(self.articles[3].slug))
+
+        self.articles[5].set_tags_from_string('related-x')
+        related.drain()
+        self.assertIn(self.articles[5].slug, self.get(self.articles[2].slug))
+
+        # Relating Articles one at a time ends up
+        # with the same lists a build would have.
+        stored = self.stored()
+        related.build()
+        self.assertEqual(self.stored(), stored)
+
+        article.draft = True
+        article.save()
+        related.drain()
+        self.assertNotIn(article.slug, self.get(self.articles[3].slug))
+        response = self.client.get(reverse('article:related', args=[article.slug]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_queue(self):
+        self.assertFalse(RelatedArticleJob.objects.exists())
+
+        # Tagging an Article twice queues it once.
+        for article in self.articles:
+            article.tags.add('related-u')
+            article.tags.add('related-t')
+        self.assertEqual(RelatedArticleJob.objects.count(), len(self.articles))
+
+        stdout = io.StringIO()
+        call_command('relate_articles', '--queue', '--once', '--batch-size', '4', stdout=stdout)
+        self.assertEqual(
+            stdout.getvalue().splitlines(), ['Related 4 queued article(s).', 'Related 2 queued article(s).']
+        )
+        self.assertFalse(RelatedArticleJob.objects.exists())
+
+        stored = self.stored()
+        related.build()
+        self.assertEqual(self.stored(), stored)
+
+    def test_bounded_postings(self):
+        article = self.articles[3]
+        self.assertEqual(set(article.related.values_list('neighbour_id', flat=True)),
+                         {self.articles[2].pk, self.articles[4].pk})
+
+        # Only the newest Article of every feature is compared
+        # against - its Topic's newest Article is itself.
+        with mock.patch.object(related, 'MAX_POSTING', 1):
+            related.build()
+        self.assertEqual(set(article.related.values_list('neighbour_id', flat=True)), {self.articles[4].pk})
+
+    def test_relate_articles_command(self):
+        RelatedArticle.objects.all().delete()
+        stdout = io.StringIO()
+        call_command('relate_articles', '--batch-size', '2', stdout=stdout)
+        self.assertIn(f'Related {len(self.articles)} article(s) in', stdout.getvalue())
+        self.assertTrue(RelatedArticle.objects.filter(article=self.articles[0]).exists())
+
+
+class ResolvedThumbnailTest(APITestCase):
+
+    THUMBNAIL = 'image/upload/v1/sample.jpg'
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.article = create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def upload(self) -> typing.Tuple[Article, Topic]:
+        # As if the thumbnails were uploaded to Cloudinary.
+        Article.objects.filter(pk=self.article.pk).update(thumbnail=self.THUMBNAIL)
+        Topic.objects.filter(pk=self.topic.pk).update(thumbnail=self.THUMBNAIL)
+        article, topic = Article.objects.get(pk=self.article.pk), Topic.objects.get(pk=self.topic.pk)
+        article.save()
+        topic.save()
+        return article, topic
+
+    def test_resolved_on_save(self):
+        article = Article.objects.get(pk=self.article.pk)
+        self.assertEqual(article.get_thumbnail(), article.thumbnail_url)
+        self.assertEqual(Topic.objects.get(pk=self.topic.pk).get_thumbnail(), self.topic.thumbnail_url)
+
+        url = f'https://picsum.photos/id/{THUMBNAIL_URL_IDs[1]}/1900/1080/'
+        article.thumbnail_url = url
+        article.save(update_fields=['thumbnail_url'])
+        self.assertEqual(Article.objects.get(pk=article.pk).resolved_thumbnail, url)
+
+        article, topic = self.upload()
+        self.assertTrue(article.resolved_thumbnail.endswith(self.THUMBNAIL))
+        self.assertEqual(article.resolved_thumbnail, article.thumbnail.url)
+        self.assertEqual(topic.resolved_thumbnail, topic.thumbnail.url)
+
+    def test_serializers_read_stored_thumbnails(self):
+        article, topic = self.upload()
+        articles = Article.objects.filter(pk=article.pk).for_listing()
+        topics = Topic.objects.filter(pk=topic.pk)
+
+        with mock.patch('cloudinary.CloudinaryResource.build_url', side_effect=AssertionError):
+            self.assertEqual(ArticleListSerializer(articles, many=True).data[0]['thumbnail'], article.resolved_thumbnail)
+            self.assertEqual(ArticleDetailSerializer(article).data['thumbnail'], article.resolved_thumbnail)
+            self.assertEqual(TopicListSerializer(topics, many=True).data[0]['thumbnail'], topic.resolved_thumbnail)
+            self.assertEqual(TopicDetailSerializer(topic).data['thumbnail'], topic.resolved_thumbnail)
+
+            fast = FastArticleListSerializer()
+            self.assertEqual(fast.data(fast.values(articles))[0]['thumbnail'], article.resolved_thumbnail)
+            fast = FastTopicListSerializer()
+            self.assertEqual(fast.data(fast.values(topics))[0]['thumbnail'], topic.resolved_thumbnail)
+
+    def test_resolve_thumbnails_command(self):
+        url = reverse('article:detail', args=[self.article.slug])
+        self.client.get(url)
+
+        # Updates don't resolve anything.
+        Article.objects.filter(pk=self.article.pk).update(thumbnail=self.THUMBNAIL)
+        self.assertNotEqual(u.get_json(self.client.get(url))['thumbnail'], Article.objects.get(pk=self.article.pk).thumbnail.url)
+
+        timeline = reverse('topic:articles', kwargs={'slug': self.topic.slug})
+        etag = self.client.get(timeline)['ETag']
+
+        stdout = io.StringIO()
+        call_command('resolve_thumbnails', stdout=stdout)
+        self.assertIn('Resolved 1 articles again.', stdout.getvalue())
+        self.assertIn('Resolved 0 topics again.', stdout.getvalue())
+        self.assertEqual(u.get_json(self.client.get(url))['thumbnail'], Article.objects.get(pk=self.article.pk).thumbnail.url)
+
+        # The list changes but the Article keeps its date.
+        self.assertEqual(self.client.get(timeline, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+        self.assertEqual(Article.objects.get(pk=self.article.pk).updated_on, self.article.updated_on)
+
+        stdout = io.StringIO()
+        call_command('resolve_thumbnails', '--batch-size', '1', stdout=stdout)
+        self.assertIn('Resolved 0 articles again.', stdout.getvalue())
+
+
+class ConditionalGetTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.article = create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def revalidate(self, url: str, etag: str, status_code: int) -> None:
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status_code)
+
+    def test_article_detail(self):
+        url = reverse('article:detail', kwargs={'slug': self.article.slug})
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+        # Rebuilding the cache gives the same ETag back.
+        cache.clear()
+        self.revalidate(url, etag, status.HTTP_304_NOT_MODIFIED)
+
+        self.article.tags.add('revalidated')
+        self.revalidate(url, etag, status.HTTP_200_OK)
+
+        # Another format is another representation.
+        response = self.client.get(url + '?format=api', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_article_lists(self):
+        for url in (reverse('article:recent'), reverse('topic:articles', kwargs={'slug': self.topic.slug})):
+            response = self.client.get(url)
+            etag = response['ETag']
+            self.assertIn('Last-Modified', response)
+
+            with self.assertNumQueries(2 if 'topics' in url else 0):
+                with mock.patch.object(ArticleListSerializer, 'to_representation') as serialize:
+                    self.revalidate(url, etag, status.HTTP_304_NOT_MODIFIED)
+            serialize.assert_not_called()
+
+            self.revalidate(url, '"something-else"', status.HTTP_200_OK)
+
+        article = create_article(draft=False, author_id=self.author.id, topic_id=self.topic.id)
+        url = reverse('topic:articles', kwargs={'slug': self.topic.slug})
+        etag = self.client.get(url)['ETag']
+
+        # Tags, Topics and Authors all show in the list.
+        article.tags.add('revalidated')
+        self.revalidate(url, etag, status.HTTP_200_OK)
+        etag = self.client.get(url)['ETag']
+
+        self.author.first_name = 'Renamed'
+        self.author.save()
+        self.revalidate(url, etag, status.HTTP_200_OK)
+        etag = self.client.get(url)['ETag']
+
+        Tag.objects.filter(name='revalidated').get().delete()
+        self.revalidate(url, etag, status.HTTP_200_OK)
+        etag = self.client.get(url)['ETag']
+
+        article.delete()
+        self.revalidate(url, etag, status.HTTP_200_OK)
+
+    def test_scoring_changes_lists(self):
+        article = create_article(draft=False, author_id=self.author.id, topic_id=self.topic.id)
+        self.assertTrue(Article.objects.get(pk=article.pk).pending)
+
+        # Scores are written with update and bulk_update -
+        # the ETags of the lists change all the same.
+        urls = (reverse('topic:articles', kwargs={'slug': self.topic.slug}),
+                reverse('author:articles', kwargs={'username': self.author.username}))
+        for score in (drain, lambda: call_command('rescore_articles', stdout=io.StringIO())):
+            etags = [self.client.get(url)['ETag'] for url in urls]
+            score()
+            for url, etag in zip(urls, etags):
+                self.revalidate(url, etag, status.HTTP_200_OK)
+
+        # Scores aren't edits - Articles keep their date.
+        self.assertEqual(Article.objects.get(pk=article.pk).updated_on, article.updated_on)
+        data = u.get_json(self.client.get(urls[0]))
+        self.assertEqual(
+            [result['timestamp'] for result in data['results'] if result['slug'] == article.slug],
+            [article.timestamp.strftime('%b. %d, %Y')]
+        )
+
+    def test_later_pages(self):
+        articles = [
+            create_article(draft=False, author_id=self.author.id, topic_id=self.topic.id) for _ in range(12)
+        ]
+        url = reverse('topic:articles', kwargs={'slug': self.topic.slug})
+        url = u.get_json(self.client.get(url))['next']
+        etag = self.client.get(url)['ETag']
+
+        # Only what's on the page (or right after it) matters.
+        articles[-1].tags.add('first-page')
+        self.revalidate(url, etag, status.HTTP_304_NOT_MODIFIED)
+
+        articles[0].tags.add('second-page')
+        self.revalidate(url, etag, status.HTTP_200_OK)
+
+    def test_missing_articles(self):
+        url = reverse('article:detail', kwargs={'slug': 'missing'})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn('ETag', response)
@@ -2,8 +2,11 @@ from django.urls import path
 
 from article.views import (
     ArticleDetailAPIView,
+    ArticleBulkCreateAPIView,
     ArticleCreateAPIView,
+    ArticleObjectivityAPIView,
     RecentArticleListAPIView,
+    RelatedArticleListAPIView,
     ArticlesSortedByTagsAPIView
 )
 
@@ -11,7 +14,10 @@ app_name = 'article'
 
 urlpatterns = (
     path('create/', ArticleCreateAPIView.as_view(), name='create'),
+    path('bulk/', ArticleBulkCreateAPIView.as_view(), name='bulk'),
     path('tags/', ArticlesSortedByTagsAPIView.as_view(), name='tags'),
     path('recent/', RecentArticleListAPIView.as_view(), name='recent'),
     path('detail/<slug:slug>/', ArticleDetailAPIView.as_view(), name='detail'),
+    path('detail/<slug:slug>/related/', RelatedArticleListAPIView.as_view(), name='related'),
+    path('detail/<slug:slug>/objectivity/', ArticleObjectivityAPIView.as_view(), name='objectivity'),
 )
@@ -1,51 +1,141 @@
+import typing
+
 from topic.models import Topic
 from backend.utils import replace
-from article.models import Article
+from backend.renderers import RawJSON
+from backend.conditional import ConditionalGetMixin
+from clarent.clarent import Breakdown
+from article.models import Article, TAG_MATCHES
+from article.bulk import MAX_BATCH_SIZE, create_articles
+from article import recent
+from article.cache import cached_detail, cache_detail
+from article.recent import recent_articles
+from article.related import related_articles
+from article.rendering import RenderedListMixin, rendered_detail
 from article.permissions import IsVerified
-from article.paginators import RecentArticleListAPIPaginator
+from article.tag_index import tag_index
+from article.paginators import RecentArticleListAPIPaginator, ArticleIdPaginator
 from article.serializers import ArticleListSerializer, ArticleDetailSerializer
 
+from django.conf import settings
+from django.http import Http404
 from django.db.models import QuerySet
 from django.utils.text import slugify
 from django.core.exceptions import ObjectDoesNotExist
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.exceptions import NotAcceptable
+from rest_framework.exceptions import NotAcceptable, NotFound
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 
 
-class RecentArticleListAPIView(ListAPIView):
+class RecentArticleListAPIView(ConditionalGetMixin, ListAPIView):
     """
     Gets the last N number of articles to display in a list. Used
-    for getting recently written Articles that aren't drafts.
+    for getting recently written Articles that aren't drafts - they're
+    sliced out of the cached buffer of recent Articles (read article.recent)
+    and its version is the ETag, so the homepage takes no queries at all.
     """
 
     serializer_class = ArticleListSerializer
     pagination_class = RecentArticleListAPIPaginator
 
-    def get_queryset(self) -> QuerySet:
+    def get_etag(self) -> str:
+        self.recent = recent_articles()
+        self.last_modified = self.recent.last_modified
+        return self.recent.version
+
+    def get_queryset(self) -> typing.List[RawJSON]:
         n = self.request.GET.get('n', 12)
         try:
             n = int(n)
         except ValueError:
             raise NotAcceptable('Invalid value for n provided.')
-        if n >= 20:
+        if n < 0:
+            raise NotAcceptable('Invalid value for n provided.')
+        if n > recent.SIZE:
             raise NotAcceptable("Can't retrieve more than 20 articles.")
-        articles = Article.objects.filter(draft=False)[:n]
-        return articles
+        return recent.page(self.recent, n)
+
+    def list(self, request, *args, **kwargs):
+        return self.get_paginated_response(self.paginate_queryset(self.get_queryset()))
 
 
-class ArticleDetailAPIView(RetrieveAPIView):
+class ArticleDetailAPIView(ConditionalGetMixin, RetrieveAPIView):
     """
     Simply queries the database for a matching slug with the slug
-    provided in the url and returns Serializer data as response.
+    provided in the url and returns the rendered Article as response - which
+    is cached until the Article (or anything it's rendered from) changes.
     """
 
     lookup_field = 'slug'
     lookup_url_kwarg = 'slug'
     serializer_class = ArticleDetailSerializer
-    queryset = Article.objects.filter(draft=False)
+    queryset = Article.objects.filter(draft=False).select_related('topic', 'author').prefetch_related('tags')
+
+    def get_etag(self) -> str:
+        """
+        Serves the rendered Article from the cache (read article.cache)
+        and only looks it up (read article.rendering) when it isn't cached
+        yet - its ETag is the version of the cached JSON so hot Articles are
+        served (and revalidated) without a single query.
+        """
+        slug = self.kwargs[self.lookup_url_kwarg]
+        self.cached = cached_detail(slug)
+        if self.cached is None:
+            json = rendered_detail(self.get_queryset(), slug)
+            if json is None:
+                raise Http404
+            self.cached = cache_detail(slug, json)
+        return self.cached[0]
+
+    def retrieve(self, request, *args, **kwargs):
+        return Response(RawJSON(self.cached[1]))
+
+
+class RelatedArticleListAPIView(APIView):
+    """
+    "More like this" - the published Articles most similar to an
+    Article by their tags and Topic, most similar first. They're
+    precomputed (read article.related) so it's a single lookup of
+    the stored list along with the pre-rendered Articles in it.
+    """
+
+    @staticmethod
+    def get(request, slug: str):
+        articles = related_articles(slug)
+        if articles is None:
+            raise NotFound('Article not found.')
+        return Response(articles)
+
+
+class ArticleObjectivityAPIView(APIView):
+    """
+    Serves the sentence by sentence breakdown of an Article's objectivity
+    for highlighting its subjective sentences - the offsets and lengths
+    of its sentences (in characters of the content) and the objectivity
+    of each one of them as three arrays. It's stored by the scoring worker
+    so nothing is ever computed here - Articles that are still waiting to
+    be scored have a null objectivity and no sentences.
+    """
+
+    @staticmethod
+    def get(request, slug: str):
+        try:
+            objectivity, sentences = Article.objects.filter(draft=False, slug=slug).values_list(
+                'objectivity', 'objectivity_breakdown__sentences'
+            ).get()
+        except Article.DoesNotExist:
+            raise NotFound('Article not found.')
+
+        breakdown = Breakdown() if objectivity is None or sentences is None else Breakdown.from_bytes(sentences)
+
+        return Response({
+            'objectivity': objectivity,
+            'offsets': breakdown.offsets.tolist(),
+            'lengths': breakdown.lengths.tolist(),
+            'objectivities': [round(1 - subjectivity, 4) for subjectivity in breakdown.subjectivities],
+        })
 
 
 class ArticleCreateAPIView(APIView):
@@ -111,20 +201,53 @@ class ArticleCreateAPIView(APIView):
             )
 
 
-class ArticlesSortedByTagsAPIView(ListAPIView):
+class ArticleBulkCreateAPIView(APIView):
     """
-    Sorts articles based on the tags provided in list.
+    Creates a JSON array of Articles (with the same fields the create
+    view takes - thumbnails have to be urls) in a constant number of
+    queries. Every item gets the status the create view would have
+    responded with - the ones that fail don't stop the others.
     """
 
-    serializer_class = ArticleListSerializer
+    permission_classes = (IsVerified,)
 
-    def get_queryset(self) -> QuerySet:
+    @staticmethod
+    def post(request):
+        items = request.data
+        if not isinstance(items, list):
+            return Response({'detail': 'Expected a list of articles.'}, status=422)
+        if len(items) > MAX_BATCH_SIZE:
+            return Response(
+                {'detail': f"Can't create more than {MAX_BATCH_SIZE} articles at once."}, status=422
+            )
+
+        return Response({'results': create_articles(items, request.user.id)})
+
+
+class ArticlesSortedByTagsAPIView(RenderedListMixin, ListAPIView):
+    """
+    Sorts articles based on the tags provided in list. Articles
+    have to be tagged with all of them - or with any of them
+    if the "match" GET argument is "any".
+    """
+
+    serializer_class = ArticleListSerializer
+    pagination_class = ArticleIdPaginator
+
+    def get_queryset(self) -> typing.Union[typing.Sequence[int], QuerySet]:
+        """
+        Returns the sorted ids of the matching Articles straight from the
+        in-memory tag index - ArticleIdPaginator fetches the page of them.
+        With settings.TAG_INDEX turned off it's the QuerySet of them.
+        """
         tags_str: str = self.request.GET.get('tags', None)
+        match: str = self.request.GET.get('match', 'all')
+        if match not in TAG_MATCHES:
+            raise NotAcceptable('Invalid value for match provided.')
         if tags_str:
             tags = replace(tags_str, ' "\'').split(',')
-            articles: QuerySet = Article.objects.filter(draft=False)
-            for tag in tags:
-                articles: QuerySet = articles.filter(tags__name__in=[tag]).distinct()
-            return articles
+            if not settings.TAG_INDEX:
+                return Article.objects.filter(draft=False).tagged(tags, match).for_listing()
+            return tag_index.search(tags, match)
         else:
-            return Article.objects.none()
+            return []
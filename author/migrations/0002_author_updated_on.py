@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-17 00:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('author', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='author',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -39,6 +39,11 @@ class Author(AbstractUser):
     # defined by author/signals.py.
     secret_key = models.UUIDField(null=True, blank=True, unique=True)
 
+    # Last time the Author was saved - the ETags
+    # of views that serialize it are built from it
+    # (read backend/conditional.py).
+    updated_on = models.DateTimeField(auto_now=True)
+
     def __str__(self) -> str:
         return self.username
 
@@ -1,7 +1,10 @@
 """
 Generic serializers for Author model.
 """
+import typing
+
 from author.models import Author
+from backend.fast import FastSerializer, Row
 
 from rest_framework import serializers
 
@@ -20,6 +23,17 @@ class AuthorListSerializer(serializers.ModelSerializer):
         fields = ('pk', 'username', 'first_name')
 
 
+class FastAuthorListSerializer(FastSerializer):
+    """
+    AuthorListSerializer from values() - the rows already are its data.
+    """
+
+    fields = ('pk', 'username', 'first_name')
+
+    def represent(self, row: Row) -> typing.Dict[str, typing.Any]:
+        return row
+
+
 class AuthorDetailSerializer(serializers.ModelSerializer):
     """
     User for serializing all fields of Author model instance except
@@ -1,11 +1,13 @@
 import uuid
 import random
 import typing
+from unittest import mock
 
 import faker
 
 from author import utils as u
 from author.models import Author
+from author.views import AuthorListAPIView
 from topic.tests.generators import create_topic
 from author.tests.generators import create_author
 from topic.serializers import TopicListSerializer
@@ -79,6 +81,15 @@ class AuthorRetrieveAPIViewTest(APITestCase):
         self.assertEqual(data, self.serialized_data, msg=data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_author_list_fast_path(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION=u.auth_header(
+            self.super_author.get_key()
+        ))
+
+        fast = self.client.get(self.url).content
+        with mock.patch.object(AuthorListAPIView, 'fast_serializer_class', None):
+            self.assertEqual(self.client.get(self.url).content, fast)
+
     def test_author_list_equality_with_invalid_authentication(self) -> None:
         """
         Similar to the previous test except the request sent to /api/authors/
@@ -459,7 +470,20 @@ class AuthorSortedDataTest(APITestCase):
             data = u.get_json(response)
 
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(data['count'], len(instances_data))
+            self.assertEqual(len(data['results']), len(instances_data))
+
+    def test_author_sorted_articles_query_count(self):
+        url = reverse('author:articles', kwargs={'username': self.author_1.username})
+
+        for _ in range(2):
+            # 2 of them compute the ETag (read backend.conditional)
+            # and 2 look up and store the rendered Articles.
+            with self.assertNumQueries(7):
+                self.client.get(url)
+            for _ in range(5):
+                create_article(
+                    author_id=self.author_1.id, topic_id=create_topic(self.author_2.id).id, draft=False
+                )
 
     def test_author_sorted_topics(self):
         """
@@ -475,3 +499,22 @@ class AuthorSortedDataTest(APITestCase):
         """
 
         self.make_test('articles', ArticleListSerializer, 'author:articles')
+
+    def test_author_conditional_get(self):
+        urls = [
+            reverse(name, kwargs={'username': self.author_1.username})
+            for name in ('author:detail', 'author:topics', 'author:articles')
+        ]
+        etags = [self.client.get(url)['ETag'] for url in urls]
+
+        for url, etag in zip(urls, etags):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Every one of them shows the Author's name.
+        self.author_1.first_name = 'Renamed'
+        self.author_1.save()
+        for url, etag in zip(urls, etags):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('author:detail', kwargs={'username': 'missing'}), HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -15,12 +15,20 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.shortcuts import redirect, get_object_or_404
 
 from author import utils as u
+from topic.models import Topic
 from author.models import Author
-from topic.serializers import TopicListSerializer
+from article.models import Article
+from topic.views import topic_fingerprints
+from topic.serializers import TopicListSerializer, FastTopicListSerializer
 from article.serializers import ArticleListSerializer
+from article.paginators import ArticleTimelinePaginator
+from article.rendering import RenderedListMixin
+from backend.fast import FastListMixin
+from backend.conditional import ConditionalGetMixin, Fingerprint, fingerprint
 from author.serializers import (
     AuthorListSerializer,
     AuthorDetailSerializer,
+    FastAuthorListSerializer,
 )
 
 from rest_framework.views import APIView
@@ -35,7 +43,7 @@ from rest_framework.generics import (
 )
 
 
-class AuthorListAPIView(ListAPIView):
+class AuthorListAPIView(FastListMixin, ListAPIView):
     """
     This view should never be accessible to the common public - only to Staff
     members (permissions defined in custom IsStaffUser). It's only used for
@@ -45,14 +53,19 @@ class AuthorListAPIView(ListAPIView):
     queryset = Author.objects.all()
     permission_classes = (IsAdminUser,)
     serializer_class = AuthorListSerializer
+    fast_serializer_class = FastAuthorListSerializer
 
 
-class AuthorDetailAPIView(RetrieveAPIView):
+class AuthorDetailAPIView(ConditionalGetMixin, RetrieveAPIView):
     lookup_field = 'username'
     lookup_url_kwarg = 'username'
     queryset = Author.objects.all()
     serializer_class = AuthorDetailSerializer
 
+    def get_validators(self) -> typing.Optional[typing.List[Fingerprint]]:
+        author = fingerprint(Author.objects.filter(username=self.kwargs['username']), 'updated_on')
+        return [author] if author[0] else None
+
 
 class AuthorCreateAPIView(APIView):
     """
@@ -251,7 +264,7 @@ class AuthorRetrieveTokenView(APIView):
             }, status=401)
 
 
-class AuthorSortedArticleListAPIView(ListAPIView):
+class AuthorSortedArticleListAPIView(ConditionalGetMixin, RenderedListMixin, ListAPIView):
     """
     Articles sorted by author - queried by username provided inside
     of the url as a parameter. It doesn't query by an Article manager,
@@ -259,17 +272,30 @@ class AuthorSortedArticleListAPIView(ListAPIView):
     fat models, thin views convention.
     """
     serializer_class = ArticleListSerializer
+    pagination_class = ArticleTimelinePaginator
+
+    def get_validators(self) -> typing.Optional[typing.List[Fingerprint]]:
+        if not Author.objects.filter(username__iexact=self.kwargs['username']).exists():
+            return None
+        articles = Article.objects.filter(author__username__iexact=self.kwargs['username'], draft=False)
+        return self.paginator.window(articles, self.request).versions()
 
     def get_queryset(self) -> QuerySet:
         author = get_object_or_404(Author, username__iexact=self.kwargs['username'])
-        return author.get_articles()
+        return author.get_articles().for_listing()
 
 
-class AuthorSortedTopicListAPIView(ListAPIView):
+class AuthorSortedTopicListAPIView(ConditionalGetMixin, FastListMixin, ListAPIView):
     """
     Similar to AuthorSortedArticleListAPIView, but for the Topic model.
     """
     serializer_class = TopicListSerializer
+    fast_serializer_class = FastTopicListSerializer
+
+    def get_validators(self) -> typing.Optional[typing.List[Fingerprint]]:
+        if not Author.objects.filter(username__iexact=self.kwargs['username']).exists():
+            return None
+        return topic_fingerprints(Topic.objects.filter(author__username__iexact=self.kwargs['username']))
 
     def get_queryset(self) -> QuerySet:
         author = get_object_or_404(Author, username__iexact=self.kwargs['username'])
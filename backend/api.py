@@ -3,6 +3,7 @@ from django.urls import path, include
 urlpatterns = (
     path('topics/', include('topic.urls')),
     path('authors/', include('author.urls')),
+    path('articles/search/', include('search.urls')),
     path('articles/', include('article.urls')),
     path('bookmark/', include('bookmark.urls')),
 )
@@ -0,0 +1,80 @@
+"""
+Conditional GETs for read-only views. A view says what its response is
+built from as a few cheap aggregates - row counts, the highest primary
+key and the latest updated_on of every table the serializer reads from -
+and the ETag is a digest of those. Clients (and the CDN) that send the
+ETag back in If-None-Match get a 304 Not Modified without the view ever
+loading or serializing anything.
+
+Counts and primary keys catch rows that were added or deleted - which
+timestamps alone can't - so only If-None-Match is answered and
+Last-Modified is only there for the client's information.
+
+Aggregates cost as much as the rows they're over though, so paginated
+views validate the rows of the page they serve instead - their ids and
+timestamps as they are (read ArticleQuerySet.versions) - and every page
+costs as much to validate as the first one.
+"""
+import typing
+import hashlib
+import datetime
+
+from django.db.models import Count, Max, QuerySet
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+Fingerprint = typing.Tuple[typing.Any, ...]
+
+
+def fingerprint(queryset: QuerySet, *timestamps: str) -> Fingerprint:
+    """
+    The number of rows of a QuerySet, its highest primary key and the
+    latest value of each of the timestamps (which can span relations
+    like author__updated_on) - all in a single query.
+    """
+    aggregates = {f'timestamp{index}': Max(field) for index, field in enumerate(timestamps)}
+    values = queryset.order_by().aggregate(count=Count('pk'), last=Max('pk'), **aggregates)
+    return tuple(values.values())
+
+
+class ConditionalGetMixin(object):
+    """
+    Mixed into a (generic) view in front of it - the view implements
+    get_validators, returning the fingerprints of whatever it reads or
+    None when there's nothing to read (and a 404 is about to be raised).
+    Views with a cheaper way of telling versions apart override get_etag.
+    """
+
+    last_modified: typing.Optional[datetime.datetime] = None
+
+    def get_validators(self) -> typing.Optional[typing.List[Fingerprint]]:
+        raise NotImplementedError
+
+    def get_etag(self) -> typing.Optional[str]:
+        validators = self.get_validators()
+        if validators is None:
+            return None
+
+        timestamps = [value for part in validators for value in part if isinstance(value, datetime.datetime)]
+        self.last_modified = max(timestamps, default=None)
+        return repr(validators)
+
+    def get(self, request, *args, **kwargs):
+        version = self.get_etag()
+        if version is None:
+            return super().get(request, *args, **kwargs)
+
+        # The same data looks different in every format.
+        version = f'{request.accepted_renderer.format}:{version}'
+        etag = quote_etag(hashlib.sha1(version.encode()).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            if self.last_modified is not None:
+                response['Last-Modified'] = http_date(self.last_modified.timestamp())
+
+        response['ETag'] = etag
+        return response
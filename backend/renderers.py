@@ -0,0 +1,148 @@
+"""
+Renderers for the API. Views can put JSON that was rendered beforehand
+(like the pre-rendered Articles of article.rendering) into their data as
+RawJSON and it's spliced into the response as it is - without it ever
+being parsed or encoded again.
+
+ORJSONRenderer is the default renderer - it renders the same JSON as
+DRF's JSONRenderer (dates and times included) with orjson, several times
+faster, and falls back to the standard library when orjson isn't
+installed. MessagePackRenderer answers "Accept: application/msgpack"
+for clients that would rather have smaller payloads - it's only
+registered (read backend/settings.py) when msgpack is installed.
+"""
+import json
+import uuid
+import typing
+
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# DRF's way of encoding everything JSON has no type for - datetimes
+# (as opposed to the dates serializers already formatted as strings,
+# like '%b. %d, %Y'), UUIDs, Decimals, lazy translations and so on.
+ENCODER = JSONEncoder()
+
+
+class RawJSON(str):
+    """
+    A string of JSON (as rendered by JSONRenderer) that's
+    put into the response as a value instead of a string.
+    """
+
+
+# How deep into the data RawJSON is looked for - as
+# deep as the results of a paginated response go.
+DEPTH = 2
+
+
+def splice(data, render: typing.Callable[[typing.Any], bytes]) -> bytes:
+    """
+    Renders data with a render function with RawJSON in it (at most
+    DEPTH levels deep) spliced into the output byte for byte. The rest of
+    the data is rendered with a unique placeholder in place of every RawJSON.
+    """
+    raw: typing.List[RawJSON] = []
+    placeholder = uuid.uuid4().hex
+
+    def strip(value, depth: int = 0):
+        if isinstance(value, RawJSON):
+            raw.append(value)
+            return placeholder
+        if depth == DEPTH:
+            return value
+        if isinstance(value, dict):
+            return {key: strip(item, depth + 1) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [strip(item, depth + 1) for item in value]
+        return value
+
+    rendered = render(strip(data))
+    if not raw:
+        return rendered
+
+    parts = rendered.split(f'"{placeholder}"'.encode())
+    spliced = [parts[0]]
+    for value, part in zip(raw, parts[1:]):
+        spliced.append(value.encode())
+        spliced.append(part)
+    return b''.join(spliced)
+
+
+def parse(data, depth: int = 0):
+    """
+    Data with the RawJSON in it (as deep as splice looks
+    for it) parsed - for renderers of anything but JSON.
+    """
+    if isinstance(data, RawJSON):
+        return json.loads(data)
+    if depth == DEPTH:
+        return data
+    if isinstance(data, dict):
+        return {key: parse(value, depth + 1) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [parse(value, depth + 1) for value in data]
+    return data
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    DRF's JSONRenderer - except that RawJSON
+    in the data is spliced into the output.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        return splice(data, lambda value: super(JSONRenderer, self).render(
+            value, accepted_media_type, renderer_context
+        ))
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer on top of orjson. Its output is the same as the one of
+    DRF's JSONRenderer - compact, not ASCII-escaped, line and paragraph
+    separators escaped and everything orjson has no type for (and every
+    datetime, which orjson would format differently) encoded by DRF's
+    JSONEncoder. Indented JSON (the "indent" media type parameter) and
+    missing orjson fall back to JSONRenderer.
+    """
+
+    OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        rendered = splice(data, lambda value: orjson.dumps(value, default=ENCODER.default, option=self.OPTIONS))
+        return rendered.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    Renders MessagePack - RawJSON is parsed first and everything
+    MessagePack has no type for is encoded like in JSON.
+    """
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b''
+        return msgpack.packb(parse(data), default=ENCODER.default, use_bin_type=True)
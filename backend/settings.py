@@ -2,6 +2,7 @@ import os
 import cloudinary
 from decouple import config
 from typing import List, Dict, Any
+from importlib.util import find_spec
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -25,6 +26,7 @@ INSTALLED_APPS: List[str] = [
     'author.apps.AuthorConfig',
     'article.apps.ArticleConfig',
     'bookmark.apps.BookmarkConfig',
+    'search.apps.SearchConfig',
     # third party
     'taggit',
     'cloudinary',
@@ -75,6 +77,24 @@ DATABASES: Dict[str, Any] = {
     }
 }
 
+# Redis (through django-redis) whenever REDIS_URL is set - it
+# should be in production - and a per-process in-memory cache
+# otherwise, which is what tests and local development use.
+REDIS_URL = config('REDIS_URL', default='')
+
+CACHES: Dict[str, Any] = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': REDIS_URL,
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        }
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'medialist',
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS: List[Dict[str, str]] = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -126,6 +146,12 @@ EMAIL_USE_TLS = True
 REST_FRAMEWORK: Dict[str, Any] = {
     'PAGE_SIZE': 10,
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_RENDERER_CLASSES': (
+        'backend.renderers.ORJSONRenderer',
+        # MessagePack is optional - read backend/renderers.py.
+        *(('backend.renderers.MessagePackRenderer',) if find_spec('msgpack') else ()),
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework.authentication.TokenAuthentication',
         'rest_framework.authentication.BasicAuthentication',
@@ -142,3 +168,33 @@ cloudinary.config(**{
 CORS_ORIGIN_ALLOW_ALL = True
 
 TAGGIT_CASE_INSENSITIVE = True
+
+# Clarent
+
+# Engine that scores objectivity - either "pattern" (TextBlob)
+# or "lexicon" (the same analysis vectorized with NumPy).
+CLARENT_ENGINE = 'pattern'
+
+# Maximum number of rows kept in the persistent
+# objectivity score cache (article.ObjectivityScore).
+CLARENT_CACHE_SIZE = 100000
+
+# Tag index
+
+# Whether tag queries are answered by the in-memory index of
+# Article tags (article.tag_index) - turned off, every query
+# goes to the database instead (ArticleQuerySet.tagged), for
+# processes that can't spare the memory for the index.
+TAG_INDEX = True
+
+# Seconds before a process rebuilds its in-memory index
+# of Article tags (article.tag_index) to pick up the
+# changes that other processes made to tags.
+TAG_INDEX_TTL = 300
+
+# Article cache
+
+# Seconds a serialized Article is cached for (read article.cache).
+# Saves and deletes invalidate it long before that - this only
+# bounds how long an update that bypassed signals can go unseen.
+ARTICLE_CACHE_TTL = 60 * 60 * 24
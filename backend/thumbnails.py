@@ -0,0 +1,85 @@
+"""
+Resolved thumbnails of Articles and Topics. Both have a thumbnail uploaded
+to Cloudinary or a thumbnail_url to fall back on, and building the URL of
+a Cloudinary thumbnail (parsing the stored resource and going through the
+SDK's configuration) for every row of every list adds up - so the URL
+they resolve to is stored in a ThumbnailURLField whenever they're saved
+(after the upload, if there is one) and serializers read that instead.
+
+Anything that changes the thumbnails without saving (QuerySet.update) or
+changes what they resolve to (the Cloudinary configuration) has to be
+followed by the resolve_thumbnails command - read backfill.
+"""
+import typing
+
+from django.db import models
+
+# Rows read (and written back) per query while backfilling.
+BATCH_SIZE = 1000
+
+
+def resolve(thumbnail, thumbnail_url: typing.Optional[str]) -> typing.Optional[str]:
+    """
+    The URL of the Cloudinary thumbnail - or the
+    thumbnail_url if nothing was uploaded.
+    """
+    return thumbnail.url if thumbnail else thumbnail_url
+
+
+class ThumbnailURLField(models.URLField):
+    """
+    The resolved thumbnail of a model with a thumbnail and thumbnail_url
+    field - it's computed every time the model is saved, like auto_now.
+    It's declared after both of them so the thumbnail is already uploaded.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('max_length', 500)
+        kwargs.setdefault('null', True)
+        kwargs.setdefault('blank', True)
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def pre_save(self, model_instance: models.Model, add: bool) -> typing.Optional[str]:
+        value = resolve(model_instance.thumbnail, model_instance.thumbnail_url)
+        setattr(model_instance, self.attname, value)
+        return value
+
+
+def resolved_fields(update_fields: typing.Optional[typing.Iterable[str]]) -> typing.Optional[typing.Set[str]]:
+    """
+    The update_fields of a save - with the resolved thumbnail
+    in them too if they save either of the thumbnail fields.
+    """
+    if update_fields is None:
+        return None
+    update_fields = set(update_fields)
+    if update_fields & {'thumbnail', 'thumbnail_url'}:
+        update_fields.add('resolved_thumbnail')
+    return update_fields
+
+
+def backfill(model: typing.Type[models.Model], batch_size: int = BATCH_SIZE) -> typing.Iterator[typing.List[int]]:
+    """
+    Resolves the thumbnails of every row of a model again, walking
+    it by primary key a batch at a time, and writes back the ones that
+    changed in one query per batch - yielding their primary keys.
+    """
+    last_pk = 0
+    while True:
+        rows = list(
+            model.objects.filter(pk__gt=last_pk).order_by('pk')
+            .values_list('pk', 'thumbnail', 'thumbnail_url', 'resolved_thumbnail')[:batch_size]
+        )
+        if not rows:
+            break
+
+        changed = []
+        for pk, thumbnail, thumbnail_url, resolved in rows:
+            value = resolve(thumbnail, thumbnail_url)
+            if value != resolved:
+                changed.append(model(pk=pk, resolved_thumbnail=value))
+        model.objects.bulk_update(changed, ['resolved_thumbnail'])
+
+        last_pk = rows[-1][0]
+        yield [instance.pk for instance in changed]
@@ -3,6 +3,8 @@ Global helper utility functions.
 """
 import json
 import typing
+import threading
+import collections
 
 from rest_framework.response import Response
 
@@ -21,9 +23,34 @@ def replace(text: str, chars: typing.Iterable[str], value: str = '') -> str:
     Replaces all character in a string with
     provided value and returns new string.
     """
-    text  = list(text)
-    chars = set(chars)
-    for index in range(len(text)):
-        if text[index] in chars:
-            text[index] = value
-    return ''.join(text)
+    return text.translate(str.maketrans(dict.fromkeys(chars, value)))
+
+
+class LRUCache(object):
+    """
+    A tiny thread safe least-recently-used mapping for keeping the
+    hottest values of a process (like scores) in memory.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._lock = threading.Lock()
+        self._data: typing.MutableMapping[str, typing.Any] = collections.OrderedDict()
+
+    def get(self, key: str) -> typing.Any:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: typing.Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,10 @@
+from article.paginators import KeysetPaginator
+
+
+class BookmarkTimelinePaginator(KeysetPaginator):
+    """
+    Latest Bookmarks first - the index on author_id already
+    holds the primary key so there's no need for another one.
+    """
+
+    ordering = ('-pk',)
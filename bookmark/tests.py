@@ -123,6 +123,18 @@ class BookmarkRelatedRetrievalViewsTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data['results'], serialized_data)
 
+    def test_bookmarked_articles_query_count(self):
+        self.client.credentials(HTTP_AUTHORIZATION=u.auth_header(self.author.get_key()))
+
+        for _ in range(2):
+            for _ in range(5):
+                article = create_article(
+                    topic_id=create_topic(create_author().pk).id, author_id=create_author().id, draft=False
+                )
+                Bookmark.objects.create(article=article, author=self.author)
+            with self.assertNumQueries(4):
+                self.client.get(reverse('bookmark:list'))
+
     def test_get_articles_ids_author_bookmarked_test(self):
         self.client.credentials(HTTP_AUTHORIZATION=u.auth_header(self.author.get_key()))
         response = self.client.get(reverse('bookmark:pk-list'))
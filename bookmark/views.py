@@ -1,8 +1,9 @@
 from article.models import Article
 from bookmark.models import Bookmark
+from bookmark.paginators import BookmarkTimelinePaginator
 from bookmark.serializers import BookmarkSerializer
 
-from django.db.models import QuerySet
+from django.db.models import QuerySet, Prefetch
 from django.core.exceptions import ObjectDoesNotExist
 
 from rest_framework.views import APIView
@@ -69,10 +70,13 @@ class ArticleSortedByBookmarksAPIView(ListAPIView):
 
     serializer_class = BookmarkSerializer
     permission_classes = (IsAuthenticated,)
+    pagination_class = BookmarkTimelinePaginator
 
     def get_queryset(self) -> QuerySet:
         author = self.request.user
-        return Bookmark.objects.filter(author=author)
+        return Bookmark.objects.filter(author=author).prefetch_related(
+            Prefetch('article', queryset=Article.objects.for_listing())
+        )
 
 
 class ArticleIDsSortedByAuthorBookmarkAPIView(APIView):
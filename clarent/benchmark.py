@@ -0,0 +1,126 @@
+"""
+Benchmarks for Clarent. Builds reproducible synthetic corpora of Articles
+from 1 KB to 1 MB (the same way article/tests/generators.py writes fake
+Articles) and reports docs/sec, MB/sec, p50/p99 latency and peak memory
+for every engine and batch size. They're run like every other benchmark
+of the project - as a management command (read
+article/management/commands/benchmark_clarent.py).
+"""
+import sys
+import time
+import typing
+import tracemalloc
+
+import faker
+
+from clarent.clarent import Clarent, ENGINES
+
+KB = 1024
+MB = 1024 * KB
+
+SIZES = (KB, 10 * KB, 100 * KB, MB)
+BATCH_SIZES = (1, 16)
+
+Result = typing.Dict[str, typing.Any]
+
+
+def generate_content(fake: faker.Faker, size: int) -> str:
+    """
+    Writes a fake Article body of (about) size bytes - paragraphs of
+    170 word sentences separated by blank lines.
+    """
+    paragraphs, length = [], 0
+    while length < size:
+        paragraph = fake.sentence(170)
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return '\n\n'.join(paragraphs)[:size]
+
+
+def generate_corpus(size: int, budget: int, seed: int = 0) -> typing.List[str]:
+    """
+    Generates enough documents of a size to add up to budget bytes
+    (but at least 3 of them). The same seed gives the same corpus.
+    """
+    fake = faker.Faker()
+    fake.seed_instance(seed + size)
+    return [generate_content(fake, size) for _ in range(max(3, budget // size))]
+
+
+def percentile(values: typing.Sequence[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))]
+
+
+def run(corpus: typing.List[str], batch_size: int, processes: int) -> Result:
+    batches = [corpus[start:start + batch_size] for start in range(0, len(corpus), batch_size)]
+
+    # Warm up - loads the engine's lexicon.
+    Clarent.score_many(corpus[:1], processes=1)
+
+    latencies = []
+    started = time.perf_counter()
+    for batch in batches:
+        batch_started = time.perf_counter()
+        Clarent.score_many(batch, processes=processes)
+        latencies.append(time.perf_counter() - batch_started)
+    elapsed = time.perf_counter() - started
+
+    # Memory is measured in a run of its own
+    # since tracing slows everything down.
+    tracemalloc.start()
+    Clarent.score_many(batches[0], processes=1)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    size = sum(map(len, corpus))
+    return {
+        'docs_per_sec': len(corpus) / elapsed,
+        'mb_per_sec': size / MB / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'peak_mb': peak / MB,
+    }
+
+
+def benchmark(engines: typing.Iterable[str], sizes: typing.Iterable[int],
+              batch_sizes: typing.Iterable[int], budget: int, processes: int,
+              seed: int = 0, out: typing.TextIO = sys.stdout) -> typing.Dict[str, Result]:
+    results: typing.Dict[str, Result] = {}
+    previous_engine = Clarent.engine
+
+    out.write(f'{"benchmark":<28} {"docs/s":>10} {"MB/s":>8} {"p50 ms":>10} {"p99 ms":>10} {"peak MB":>8}\n')
+    try:
+        for size in sizes:
+            corpus = generate_corpus(size, budget, seed)
+            for engine in engines:
+                Clarent.use(engine)
+                for batch_size in batch_sizes:
+                    name = f'{engine}/{size // KB}KB/batch={batch_size}'
+                    result = results[name] = run(corpus, batch_size, processes)
+                    out.write(
+                        f'{name:<28} {result["docs_per_sec"]:>10.2f} {result["mb_per_sec"]:>8.3f} '
+                        f'{result["p50_ms"]:>10.2f} {result["p99_ms"]:>10.2f} {result["peak_mb"]:>8.2f}\n'
+                    )
+    finally:
+        Clarent.use(previous_engine)
+
+    return results
+
+
+def regressions(results: typing.Dict[str, Result], baseline: typing.Dict[str, Result],
+                threshold: float) -> typing.List[str]:
+    """
+    Lists the benchmarks whose throughput dropped more than threshold
+    percent below the baseline's. Benchmarks missing from either are skipped.
+    """
+    failures = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]['docs_per_sec']
+        change = (result['docs_per_sec'] - expected) / expected * 100
+        if change < -threshold:
+            failures.append(f'{name}: {result["docs_per_sec"]:.2f} docs/s is {-change:.1f}% '
+                            f'slower than the baseline ({expected:.2f} docs/s).')
+    return failures
@@ -0,0 +1,275 @@
+"""
+A vectorized re-implementation of the subjectivity half of pattern's
+sentiment analysis (the one behind TextBlob's PatternAnalyzer) on top of
+NumPy. The lexicon is loaded once into arrays, text is tokenized with one
+compiled regex and every lookup, intensifier and negation rule is applied
+to whole arrays of tokens at once instead of word by word.
+
+It follows pattern's tokenizer and its rules for intensifiers ("very
+good"), negations ("not very good") and the words in between them, so
+its subjectivity is the same as PatternAnalyzer's up to rounding - except
+for emoticons and "(!)". Pattern scores those as fully subjective and the
+lexicon engine ignores them, which adds up in code samples: pattern finds
+":(" in "returns: (str,str)" and "8)" in "(utf-8)". Out of 4000 docstrings
+of the installed packages 151 had one of them and 141 of those were off
+by more than 0.02 (up to 1.0) - all the others scored exactly the same.
+"""
+import re
+import typing
+
+import numpy as np
+
+from textblob import _text
+from textblob.en import sentiment
+
+# Pattern splits quotes off everywhere, the rest of its punctuation
+# (except periods) only off the start and end of whitespace separated
+# words, so "key/value", "a,b" and "wait...what" are single tokens but
+# "(good)." isn't. Periods are split off the end too unless what's left
+# is an abbreviation ("e.g.", "Mr.") - then it keeps its period.
+QUOTES = '\'"\u2018\u2019\u201c\u201d'
+PUNCTUATION = ''.join(char for char in _text.PUNCTUATION if char not in QUOTES + '.')
+ABBREVIATIONS = sorted((word for word in _text.ABBREVIATIONS if word.endswith('.')), key=len, reverse=True)
+
+TOKEN = re.compile(
+    r"(?:(?:[A-Za-z]\.)+|[A-Z][bcdfghjklmnpqrstvwxz|]+\.|{abbreviations})(?=[.{p}]*(?:[\s{q}]|\Z))"
+    r"|\.+[^\s{q}]*[^\s{q}{p}.]|[^\s{q}{p}.](?:[^\s{q}]*[^\s{q}{p}.])?"
+    r"|\.{{3,}}|\S".format(
+        abbreviations='|'.join(map(re.escape, ABBREVIATIONS)),
+        p=re.escape(PUNCTUATION),
+        q=re.escape(QUOTES),
+    )
+)
+
+
+def tokenize(text: str) -> typing.List[str]:
+    """
+    Pattern's tokens of a text - not lowercased yet since its
+    abbreviations are case sensitive. Like pattern it splits "n't"
+    off first so "don't" is "do n ' t" (but "DON'T" is "DON ' T").
+    """
+    return TOKEN.findall(text.replace("n't", " n't"))
+
+
+NEGATIONS = frozenset(('no', 'not', 'never'))
+
+
+class Lexicon(object):
+    """
+    Pattern's sentiment lexicon as arrays indexed by word id.
+    """
+
+    def __init__(self):
+        # len() forces the lazy lexicon to load.
+        len(sentiment)
+        words = sorted(dict.keys(sentiment))
+
+        self.ids: typing.Dict[str, int] = {word: index for index, word in enumerate(words)}
+        self.subjectivity = np.array([sentiment[word][None][1] for word in words], dtype=np.float64)
+        self.intensity = np.array([sentiment[word][None][2] for word in words], dtype=np.float64)
+        self.modifier = np.array(['RB' in sentiment[word] for word in words], dtype=bool)
+        self.ly = np.array([word.endswith('ly') for word in words], dtype=bool)
+
+
+class LexiconEngine(object):
+
+    name = 'lexicon'
+
+    # Texts are tokenized and scored this many
+    # characters at a time so that the token
+    # arrays of a huge text never pile up.
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self):
+        self.lexicon = Lexicon()
+
+    def features(self, tokens: typing.Sequence[str]) -> typing.Tuple[np.ndarray, ...]:
+        """
+        Looks every token up once per distinct token and returns the
+        per-token arrays of lexicon ids (-1 for unknown words), negation
+        flags and the two length flags pattern's rules depend on.
+        """
+        unique, inverse = np.unique(np.char.lower(np.array(tokens, dtype=str)), return_inverse=True)
+        get = self.lexicon.ids.get
+        ids = np.fromiter((get(token, -1) for token in unique), dtype=np.intp, count=len(unique))
+        negation = np.fromiter((token in NEGATIONS for token in unique), dtype=bool, count=len(unique))
+        lengths = np.char.str_len(unique)
+        stripped = np.char.str_len(np.char.strip(unique, "'"))
+        return ids[inverse], negation[inverse], (lengths > 2)[inverse], (stripped > 1)[inverse]
+
+    def accumulator(self) -> 'LexiconAccumulator':
+        return LexiconAccumulator(self)
+
+    def assess(self, text: str) -> typing.Tuple[float, int]:
+        accumulator = self.accumulator()
+        for start in range(0, len(text), self.CHUNK_SIZE):
+            end = start + self.CHUNK_SIZE
+            accumulator.feed(text[start:end], final=end >= len(text))
+        return accumulator.result()
+
+
+# Stands in for "some long unknown word" when the
+# context of one chunk is carried over to the next -
+# tokens never contain whitespace so it can't clash
+# with a real one (and unlike NUL characters NumPy
+# doesn't strip trailing spaces off of strings).
+BREAK = ' ' * 3
+
+# Whitespace followed by a (possibly partial) last word.
+TAIL = re.compile(r'\s\S*\Z')
+
+
+class LexiconAccumulator(object):
+    """
+    Scores a text fed to it in chunks of any size while only ever holding
+    on to the running totals, the context of the last known word and the
+    last (possibly partial) word of the latest chunk - the score is the same
+    as the one of the whole text no matter where the chunks were cut.
+
+    Each chunk is scored as a whole array of tokens with the carried over
+    context prepended to it as tokens: the last known word (preceded by a
+    negation if it was negated), a long unknown word if the intensifier
+    chain was broken off since then and the negation that's still pending.
+    """
+
+    # A text without any whitespace can't be cut
+    # between words - it's scored once it's this long.
+    MAX_TAIL = 1 << 16
+
+    def __init__(self, engine: LexiconEngine):
+        self.engine = engine
+        self.tail = ''
+
+        # Scores of finished assessments and the
+        # number of assessments, including the one
+        # that's still open (it could be continued
+        # by the first word of the next chunk).
+        self.total = 0.0
+        self.count = 0
+        self.open = 0.0
+
+        self.previous: typing.Optional[typing.Tuple[str, bool]] = None
+        self.broken = False
+        self.negation: typing.Optional[str] = None
+
+    def feed(self, text: str, final: bool = False) -> None:
+        """
+        Scores a chunk of the text except for its last word which might
+        go on in the next chunk - unless the chunk is the final one.
+        """
+        text = self.tail + text
+        if final:
+            self.tail = ''
+            self.process(tokenize(text))
+            return
+
+        match = TAIL.search(text)
+        if match is None and len(text) < self.MAX_TAIL:
+            self.tail = text
+            return
+        cut = match.start() if match else len(text)
+        self.tail = text[cut:]
+        self.process(tokenize(text[:cut]))
+
+    def result(self) -> typing.Tuple[float, int]:
+        if self.tail:
+            self.feed('', final=True)
+        if not self.count:
+            return 0.0, 0
+        return (self.total + self.open) / self.count, self.count
+
+    def process(self, tokens: typing.List[str]) -> None:
+        prefix = []
+        if self.previous is not None:
+            word, negated = self.previous
+            if negated:
+                prefix.append('not')
+            prefix.append(word)
+            if self.broken:
+                prefix.append(BREAK)
+        if self.negation is not None:
+            prefix.append(self.negation)
+
+        tokens = prefix + tokens
+        if not tokens:
+            return
+
+        lexicon = self.engine.lexicon
+        ids, negation, long_m, long_n = self.engine.features(tokens)
+
+        index = np.arange(len(tokens))
+        known = ids >= 0
+        unknown = ~known
+        positions = np.flatnonzero(known)
+
+        # Closest known word before every token.
+        last_known = np.maximum.accumulate(np.where(known, index, -1))
+        previous_known = np.concatenate(([-1], last_known[:-1]))
+        previous_ids = ids[np.maximum(previous_known, 0)]
+        has_previous = previous_known >= 0
+        previous_ly = has_previous & lexicon.modifier[previous_ids] & lexicon.ly[previous_ids]
+
+        # A long unknown word ends an intensifier ("very" in "very nice
+        # people") - except for a negation right after an adverb ending in
+        # -ly which is absorbed by it instead ("really not good").
+        m_break = unknown & long_m & (~negation | ~previous_ly)
+        last_m_break = np.maximum.accumulate(np.where(m_break, index, -1))
+        previous_m_break = np.concatenate(([-1], last_m_break[:-1]))
+
+        absorbed = unknown & negation & previous_ly & (previous_m_break < previous_known)
+        negations = unknown & negation & ~absorbed
+        n_break = unknown & ((~negation & long_n) | absorbed)
+        last_negation = np.maximum.accumulate(np.where(negations, index, -1))
+        last_n_break = np.maximum.accumulate(np.where(n_break, index, -1))
+
+        if not len(positions):
+            if last_negation[-1] > last_n_break[-1]:
+                self.negation = tokens[last_negation[-1]]
+            else:
+                self.negation = None
+            return
+
+        word_ids = ids[positions]
+        subjectivity = lexicon.subjectivity[word_ids]
+        intensity = lexicon.intensity[word_ids]
+
+        before = previous_known[positions]
+        previous_negation = np.concatenate(([-1], last_negation[:-1]))[positions]
+        previous_n_break = np.concatenate(([-1], last_n_break[:-1]))[positions]
+        negated = previous_negation > np.maximum(before, previous_n_break)
+        intensity = np.where(negated, 1.0 / np.where(intensity == 0, 1.0, intensity), intensity)
+
+        # A known word continues the assessment of the known word before
+        # it when that one is an intensifier that hasn't been broken off.
+        continues = np.zeros(len(positions), dtype=bool)
+        continues[1:] = lexicon.modifier[word_ids[:-1]] & (previous_m_break[positions[1:]] < before[1:])
+
+        values = subjectivity.copy()
+        values[1:] = np.where(
+            continues[1:], np.clip(subjectivity[1:] * intensity[:-1], -1.0, 1.0), subjectivity[1:]
+        )
+
+        # An assessment's score is the one of its last word.
+        last = np.ones(len(positions), dtype=bool)
+        last[:-1] = ~continues[1:]
+
+        starts = int(len(positions) - continues.sum())
+        if self.previous is not None:
+            # The first known word is the carried over one - its
+            # assessment was counted (and scored) by an earlier chunk.
+            starts -= 1
+            if last[0]:
+                values[0] = self.open
+
+        ends = values[last]
+        self.total += float(ends[:-1].sum())
+        self.count += starts
+        self.open = float(ends[-1])
+
+        end = positions[-1]
+        self.previous = (tokens[end], bool(negated[-1]))
+        self.broken = bool(last_m_break[-1] > end)
+        if last_negation[-1] > max(end, last_n_break[-1]):
+            self.negation = tokens[last_negation[-1]]
+        else:
+            self.negation = None
@@ -0,0 +1,112 @@
+"""
+Full text search over the titles and contents of published Articles,
+ranked with BM25 - https://en.wikipedia.org/wiki/Okapi_BM25. The inverted
+index lives in two tables of the database (read search/models.py) so
+there's no search service to run - it's kept current by the Article
+signals in search/signals.py and can be rebuilt from scratch with the
+index_articles management command.
+
+Terms are lowercased runs of letters and digits, nothing's stemmed and
+there are no stop words - BM25's idf makes common words count for little.
+"""
+import re
+import math
+import typing
+import collections
+
+from django.db import transaction
+from django.db.models import Avg, Case, Count, FloatField, QuerySet, Sum, Value, When
+from django.db.models.functions import Cast
+
+from article.models import Article
+from search.models import Posting, SearchDocument
+
+TERM = re.compile(r'\w+')
+
+MAX_TERM_LENGTH = 64
+
+# Every occurrence of a term in the title of an
+# Article counts as this many in its content.
+TITLE_WEIGHT = 3
+
+# BM25's parameters - K1 caps how much repeating a
+# term helps and B how much longer documents are
+# penalized. These are the usual defaults.
+K1 = 1.2
+B = 0.75
+
+
+def terms(text: str) -> typing.List[str]:
+    return [term for term in TERM.findall(str(text).lower()) if len(term) <= MAX_TERM_LENGTH]
+
+
+def frequencies(title: str, content: str) -> typing.Counter[str]:
+    counts = collections.Counter(terms(content))
+    for term in terms(title):
+        counts[term] += TITLE_WEIGHT
+    return counts
+
+
+def index(articles: typing.Iterable[Article]) -> None:
+    """
+    (Re)indexes a batch of Articles - published ones get their postings
+    replaced and drafts are taken out of the index altogether.
+    """
+    articles = list(articles)
+    published = [article for article in articles if not article.draft]
+
+    postings, documents = [], []
+    for article in published:
+        counts = frequencies(article.title, article.content)
+        postings.extend(
+            Posting(term=term, article_id=article.pk, frequency=frequency)
+            for term, frequency in counts.items()
+        )
+        documents.append(SearchDocument(article_id=article.pk, length=sum(counts.values())))
+
+    ids = [article.pk for article in articles]
+    with transaction.atomic():
+        Posting.objects.filter(article_id__in=ids).delete()
+        SearchDocument.objects.filter(article_id__in=ids).delete()
+        Posting.objects.bulk_create(postings, batch_size=1000)
+        SearchDocument.objects.bulk_create(documents, batch_size=1000)
+
+
+def scores(postings: QuerySet, score) -> QuerySet:
+    return postings.values('article_id').annotate(
+        score=Sum(score, output_field=FloatField())
+    ).order_by('-score', '-article_id')
+
+
+def search(query: str) -> QuerySet:
+    """
+    Returns the (article_id, score) values of the Articles that match any
+    of the terms of a query - best match first, ties broken by id.
+    """
+    query_terms = set(terms(query))
+    if not query_terms:
+        return scores(Posting.objects.none(), Value(0.0))
+
+    stats = SearchDocument.objects.aggregate(documents=Count('pk'), length=Avg('length'))
+    documents, average_length = stats['documents'], stats['length']
+    if not documents:
+        return scores(Posting.objects.none(), Value(0.0))
+
+    # Number of Articles every term appears in.
+    counts: typing.Dict[str, int] = dict(
+        Posting.objects.filter(term__in=query_terms).order_by().values('term')
+        .annotate(documents=Count('pk')).values_list('term', 'documents')
+    )
+    if not counts:
+        return scores(Posting.objects.none(), Value(0.0))
+
+    idf = Case(
+        *(When(term=term, then=Value(math.log(1 + (documents - count + 0.5) / (count + 0.5))))
+          for term, count in counts.items()),
+        output_field=FloatField(),
+    )
+    frequency = Cast('frequency', FloatField())
+    length = Cast('article__search_document__length', FloatField())
+    score = idf * frequency * (K1 + 1) / (frequency + K1 * (1 - B + B * length / average_length))
+
+    return scores(Posting.objects.filter(term__in=counts), score)
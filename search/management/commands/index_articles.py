@@ -0,0 +1,51 @@
+import time
+import typing
+
+from django.core.management.base import BaseCommand
+
+from article.models import Article
+from search.index import index
+
+
+class Command(BaseCommand):
+
+    help = 'Rebuilds the search index of every Article - run it whenever search.index changes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Number of Articles to index at a time.'
+        )
+
+    def handle(self, *args, **options):
+
+        batch_size = options['batch_size']
+
+        total = Article.objects.count()
+        self.stdout.write(f'Indexing {total} article(s).')
+
+        last_pk, done, started = 0, 0, time.monotonic()
+
+        while True:
+            # Walks the table by primary key, one batch at a time - read
+            # rescore_articles for why QuerySet.iterator() isn't used.
+            articles: typing.List[Article] = list(
+                Article.objects.filter(pk__gt=last_pk).order_by('pk').only(
+                    'pk', 'title', 'content', 'draft'
+                )[:batch_size]
+            )
+
+            if not articles:
+                break
+
+            index(articles)
+
+            last_pk = articles[-1].pk
+            done += len(articles)
+
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f'{done}/{total} article(s) indexed ({done / elapsed:.1f}/s) - last id {last_pk}.'
+            )
+
+        self.stdout.write(f'Done in {time.monotonic() - started:.1f}s.')
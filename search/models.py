@@ -0,0 +1,51 @@
+"""
+Tables of the full text search index of Articles - read search/index.py.
+"""
+from django.db import models
+
+from article.models import Article
+
+
+class SearchDocument(models.Model):
+    """
+    An Article that's in the search index. Only published Articles
+    ever are - drafts are taken out of the index as soon as they're
+    saved so no search can ever find them.
+    """
+
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, related_name='search_document'
+    )
+
+    # Number of (weighted) terms in the
+    # title and content of the Article -
+    # BM25 favours shorter documents.
+    length = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return str(self.article_id)
+
+
+class Posting(models.Model):
+    """
+    A term of the inverted index and the number of times it appears in
+    one Article - a term's postings list are all of its rows. Terms in
+    the title of an Article count search.index.TITLE_WEIGHT times.
+    """
+
+    term = models.CharField(max_length=64)
+
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='postings')
+
+    frequency = models.PositiveIntegerField(default=1)
+
+    def __str__(self) -> str:
+        return f'{self.term} {self.article_id}'
+
+    class Meta:
+        # Postings lists are read term by term and
+        # written (and deleted) Article by Article.
+        indexes = (
+            models.Index(fields=('term', 'article'), name='search_posting_term_idx'),
+        )
+        unique_together = ('article', 'term')
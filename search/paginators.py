@@ -0,0 +1,38 @@
+import typing
+
+from django.db.models import QuerySet
+
+from article.models import Article
+from article.paginators import KeysetPaginator
+
+
+class SearchPaginator(KeysetPaginator):
+    """
+    Keyset pagination over the (article_id, score) rows of a search
+    (read search.index.search) - best match first. The cursor holds the
+    score and id of the last Article of a page and only the Articles of
+    a page are ever fetched from the database, with their score on them.
+    """
+
+    ordering = ('-score', '-article_id')
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> typing.List[Article]:
+        rows = super().paginate_queryset(queryset, request, view)
+        articles = Article.objects.filter(
+            pk__in=[row['article_id'] for row in rows]
+        ).for_listing().order_by().in_bulk()
+
+        self.page = []
+        for row in rows:
+            article = articles.get(row['article_id'])
+            if article is not None:
+                article.score = row['score']
+                self.page.append(article)
+        return self.page
+
+    def position(self, instance: Article) -> typing.List[typing.Any]:
+        return [instance.score, instance.pk]
+
+    def parse_position(self, model, values: typing.Sequence[typing.Any]) -> typing.List[typing.Any]:
+        score, pk = values
+        return [float(score), int(pk)]
@@ -0,0 +1,21 @@
+from article.models import Article
+from article.signals import articles_created
+from search.index import index
+
+from django.dispatch import receiver
+from django.db.models.signals import post_save
+
+
+# noinspection PyUnusedLocal
+@receiver(post_save, sender=Article)
+def index_article(sender, instance: Article, update_fields=None, **kwargs):
+    # Deleting an Article cascades to its postings
+    # so saves are all the index ever has to follow.
+    if any(instance.has_changed(field) for field in ('title', 'content', 'draft')):
+        index([instance])
+
+
+# noinspection PyUnusedLocal
+@receiver(articles_created, sender=Article)
+def index_articles(sender, articles, **kwargs):
+    index(articles)
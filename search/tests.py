@@ -0,0 +1,141 @@
+import io
+import typing
+from unittest import mock
+
+from django.shortcuts import reverse
+from django.core.management import call_command
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from backend import utils as u
+from article.models import Article
+from search.index import search
+from search.models import Posting, SearchDocument
+from topic.tests.generators import create_topic
+from author.tests.generators import create_author
+from article.tests.generators import create_article
+
+
+class ArticleSearchTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = create_author()
+        cls.topic = create_topic(cls.author.pk)
+        cls.articles = [
+            create_article(draft=False, author_id=cls.author.id, topic_id=cls.topic.id)
+            for _ in range(23)
+        ]
+
+        # 3 Articles mention wombats three times, 10 of them (all
+        # with the same score) twice and the rest of them once.
+        for number, article in enumerate(cls.articles):
+            mentions = 3 if number < 3 else 2 if number < 13 else 1
+            article.title = f'Article {number}'
+            article.content = ' '.join(['Wombats dig burrows.'] * mentions + ['Lorem ipsum.'] * (3 - mentions))
+            article.save()
+
+    def get(self, query: str, cursor: typing.Optional[str] = None):
+        url = reverse('search:search') + f'?q={query}'
+        return u.get_json(self.client.get(cursor or url))
+
+    def slugs(self, query: str) -> typing.List[str]:
+        return [article['slug'] for article in self.get(query)['results']]
+
+    def test_ranking(self):
+        expected = {article.slug for article in self.articles[:3]}
+        self.assertEqual(set(self.slugs('wombats')[:3]), expected)
+
+        ranked = [row['article_id'] for row in search('WOMBATS burrows')]
+        self.assertEqual(set(ranked[:3]), {article.pk for article in self.articles[:3]})
+        self.assertEqual(len(ranked), len(self.articles))
+
+        # Words in the title count more than the same words in the content.
+        title = create_article(draft=False, author_id=self.author.id, topic_id=self.topic.id)
+        title.title, title.content = 'All About Wombats', 'Wombats dig burrows.'
+        title.save()
+        self.assertEqual(self.slugs('wombats')[0], title.slug)
+
+    def test_empty_queries_find_nothing(self):
+        for query in ('', '!?', 'platypus'):
+            data = self.get(query)
+            self.assertEqual(data['results'], [])
+            self.assertIsNone(data['next'])
+
+        response = self.client.get(reverse('search:search') + '?q=' + 'a' * 300)
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+
+    def test_drafts_are_never_found(self):
+        article = Article.objects.get(pk=self.articles[0].pk)
+        article.content = 'Echidnas lay eggs.'
+        article.save()
+        self.assertEqual(self.slugs('echidnas'), [article.slug])
+
+        article.draft = True
+        article.save()
+        self.assertEqual(self.slugs('echidnas'), [])
+        self.assertFalse(Posting.objects.filter(article=article).exists())
+        self.assertFalse(SearchDocument.objects.filter(article=article).exists())
+
+        article.draft = False
+        article.save()
+        self.assertEqual(self.slugs('echidnas'), [article.slug])
+
+    def test_edits_and_deletions_update_the_index(self):
+        article = Article.objects.get(pk=self.articles[-1].pk)
+        article.content = 'Quokkas smile.'
+        article.save()
+        self.assertEqual(self.slugs('quokkas'), [article.slug])
+        self.assertNotIn(article.slug, self.slugs('wombats'))
+
+        # Saves that don't touch the title, content or draft leave the index be.
+        with mock.patch('search.signals.index') as index:
+            article.save(update_fields=['thumbnail_url'])
+        index.assert_not_called()
+
+        article.delete()
+        self.assertEqual(self.slugs('quokkas'), [])
+        self.assertEqual(Posting.objects.filter(term='quokkas').count(), 0)
+
+    def test_walk_forwards_and_backwards(self):
+        expected = [Article.objects.get(pk=row['article_id']).slug for row in search('wombats')]
+
+        pages, data = [], self.get('wombats')
+        while True:
+            pages.append([article['slug'] for article in data['results']])
+            if not data['next']:
+                break
+            data = self.get('', data['next'])
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 3])
+        self.assertEqual(sum(pages, []), expected)
+
+        backwards = []
+        while data['previous']:
+            data = self.get('', data['previous'])
+            backwards.append([article['slug'] for article in data['results']])
+        self.assertEqual(list(reversed(backwards)), pages[:-1])
+
+    def test_pages_cost_the_same(self):
+        url = reverse('search:search') + '?q=wombats'
+        while url:
+            # Document statistics, term counts, the page of
+            # scores, the Articles and their tags and then
+            # looking up and storing the rendered Articles.
+            with self.assertNumQueries(7):
+                url = u.get_json(self.client.get(url))['next']
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('search:search') + '?q=wombats&cursor=WzAsWyJhIl1d')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_index_articles_command(self):
+        expected = list(search('wombats burrows'))
+
+        Posting.objects.all().delete()
+        SearchDocument.objects.all().delete()
+        self.assertEqual(list(search('wombats')), [])
+
+        call_command('index_articles', batch_size=7, stdout=io.StringIO())
+        self.assertEqual(list(search('wombats burrows')), expected)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from search.views import ArticleSearchAPIView
+
+app_name = 'search'
+
+urlpatterns = (
+    path('', ArticleSearchAPIView.as_view(), name='search'),
+)
@@ -0,0 +1,28 @@
+from search.index import search
+from search.paginators import SearchPaginator
+from article.rendering import RenderedListMixin
+from article.serializers import ArticleListSerializer
+
+from django.db.models import QuerySet
+
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.generics import ListAPIView
+
+MAX_QUERY_LENGTH = 256
+
+
+class ArticleSearchAPIView(RenderedListMixin, ListAPIView):
+    """
+    Searches the titles and contents of published Articles for the
+    words in the "q" GET argument - best matches first. An empty
+    query (or one without any words in it) finds nothing.
+    """
+
+    serializer_class = ArticleListSerializer
+    pagination_class = SearchPaginator
+
+    def get_queryset(self) -> QuerySet:
+        query: str = self.request.GET.get('q', '')
+        if len(query) > MAX_QUERY_LENGTH:
+            raise NotAcceptable(f"Can't search for more than {MAX_QUERY_LENGTH} characters.")
+        return search(query)
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-17 00:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topic', '0002_auto_20191117_0017'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='topic',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
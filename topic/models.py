@@ -2,6 +2,8 @@ from django.db import models
 from django.conf import settings
 from django.shortcuts import reverse
 
+from backend.thumbnails import ThumbnailURLField, resolved_fields
+
 from cloudinary.models import CloudinaryField
 
 
@@ -42,6 +44,11 @@ class Topic(models.Model):
     # Read above.
     created_on = models.DateTimeField(auto_now_add=True)
 
+    # Last time the Topic was saved - the ETags
+    # of views that serialize it are built from it
+    # (read backend/conditional.py).
+    updated_on = models.DateTimeField(auto_now=True)
+
     # Prepopulated on save (or update) by signals
     # living in topic/signals.py and initialized from
     # topic/apps.py when loaded into the settings.
@@ -61,17 +68,22 @@ class Topic(models.Model):
     # file him/her-self to the Cloudinary server.
     thumbnail_url = models.URLField(default='https://picsum.photos/1900/1080')
 
+    # The thumbnail resolved from the two fields
+    # above whenever the Topic is saved - read
+    # backend/thumbnails.py.
+    resolved_thumbnail = ThumbnailURLField()
+
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = resolved_fields(kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
+
     def get_thumbnail(self):
         """
-        Checks for existence of thumbnail fields - either as a Cloudinary
-        field or the thumbnail_url if the Author entered a URL instead of
-        a thumbnail file.
+        The thumbnail - either the Cloudinary field's URL or the
+        thumbnail_url if the Author entered a URL instead of a thumbnail
+        file - as it was resolved when the Topic was last saved.
         """
-        if self.thumbnail:
-            # noinspection PyUnresolvedReferences
-            return self.thumbnail.url
-        else:
-            return self.thumbnail_url
+        return self.resolved_thumbnail
 
     def get_articles(self):
         return self.articles.filter(draft=False)
@@ -4,6 +4,7 @@ with proper authentication and validation are written here.
 """
 import random
 import typing
+from unittest import mock
 
 from faker import Faker
 
@@ -16,6 +17,7 @@ from rest_framework.response import Response
 
 from backend import utils as u
 from topic.models import Topic
+from topic.views import TopicListAPIView
 from author.models import Author
 from author.utils import auth_header
 from topic.tests.generators import create_topic
@@ -77,6 +79,19 @@ class TopicRetrieveAPIViewTest(APITestCase):
             self.assertEqual(results, serialized_current_page_topics)
             page += 1
 
+    def test_topic_list_fast_path(self) -> None:
+        """
+        FastTopicListSerializer renders the very same bytes as
+        TopicListSerializer in a constant number of queries.
+        """
+        for page in (1, 2, 3):
+            url = f'{reverse("topic:list")}?page={page}'
+            # 2 of them compute the ETag (read backend.conditional).
+            with self.assertNumQueries(4):
+                fast = self.client.get(url).content
+            with mock.patch.object(TopicListAPIView, 'fast_serializer_class', None):
+                self.assertEqual(self.client.get(url).content, fast)
+
     def test_topic_detail_view(self) -> None:
         """
         Simply makes requests to all reverse urls for topic details
@@ -111,6 +126,32 @@ class TopicRetrieveAPIViewTest(APITestCase):
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(data.get('results'), articles_serialized_data)
 
+    def test_topic_sorted_articles_query_count(self) -> None:
+        url = reverse('topic:articles', kwargs={'slug': self.topic_1.slug})
+
+        for _ in range(2):
+            # 2 of them compute the ETag (read backend.conditional)
+            # and 2 look up and store the rendered Articles.
+            with self.assertNumQueries(7):
+                self.client.get(url)
+            for _ in range(5):
+                create_article(topic_id=self.topic_1.id, author_id=create_author().id, draft=False)
+
+    def test_topic_conditional_get(self) -> None:
+        for url in (reverse('topic:list'), reverse('topic:detail', kwargs={'slug': self.topic_1.slug})):
+            etag = self.client.get(url)['ETag']
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+            # Topics list how many Articles they have.
+            article = create_article(topic_id=self.topic_1.id, author_id=self.author.id, draft=False)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+            etag = self.client.get(url)['ETag']
+
+            self.topic_1.description = 'A new description.'
+            self.topic_1.save()
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+            article.delete()
+
 
 class TopicCreationAPIViewTest(APITestCase):
     """
@@ -1,17 +1,27 @@
 """
 CRUD views for the Topic model.
 """
+import typing
+
 from author.models import Author
 
 from topic import utils as u
 from topic.models import Topic
 from topic.serializers import (
     TopicListSerializer,
-    TopicDetailSerializer
+    TopicDetailSerializer,
+    FastTopicListSerializer,
 )
 
+from article.models import Article
 from article.serializers import ArticleListSerializer
+from article.paginators import ArticleTimelinePaginator
+from article.rendering import RenderedListMixin
+
+from backend.fast import FastListMixin
+from backend.conditional import ConditionalGetMixin, Fingerprint, fingerprint
 
+from django.db.models import QuerySet
 from django.utils.text import slugify
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ObjectDoesNotExist
@@ -22,16 +32,31 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 
 
-class TopicListAPIView(ListAPIView):
+def topic_fingerprints(topics: QuerySet) -> typing.List[Fingerprint]:
+    """
+    Validators of TopicListSerializer's output for some Topics - which
+    includes the names of their Authors and how many Articles they have.
+    """
+    return [
+        fingerprint(topics, 'updated_on', 'author__updated_on'),
+        fingerprint(Article.objects.filter(topic__in=topics, draft=False), 'updated_on'),
+    ]
+
+
+class TopicListAPIView(ConditionalGetMixin, FastListMixin, ListAPIView):
     """
     Returns a paginated JSON response containing all Topic entries
     inside of the database. Clean, plain, and simple.
     """
     queryset = Topic.objects.all()
     serializer_class = TopicListSerializer
+    fast_serializer_class = FastTopicListSerializer
+
+    def get_validators(self) -> typing.List[Fingerprint]:
+        return topic_fingerprints(Topic.objects.all())
 
 
-class TopicDetailAPIView(RetrieveAPIView):
+class TopicDetailAPIView(ConditionalGetMixin, RetrieveAPIView):
     """
     Queries all Topic instances in database according to the slug
     provided in the url and returns serialized JSON object. Slug
@@ -43,6 +68,11 @@ class TopicDetailAPIView(RetrieveAPIView):
     queryset = Topic.objects.all()
     serializer_class = TopicDetailSerializer
 
+    def get_validators(self) -> typing.Optional[typing.List[Fingerprint]]:
+        topics = Topic.objects.filter(slug__iexact=self.kwargs['slug'])
+        fingerprints = topic_fingerprints(topics)
+        return fingerprints if fingerprints[0][0] else None
+
 
 class TopicDeleteAPIView(APIView):
 
@@ -133,12 +163,19 @@ class TopicCreateAPIView(APIView):
             return Response({'detail': str(e)}, status=500)
 
 
-class TopicSortedArticlesAPIView(ListAPIView):
+class TopicSortedArticlesAPIView(ConditionalGetMixin, RenderedListMixin, ListAPIView):
     serializer_class = ArticleListSerializer
+    pagination_class = ArticleTimelinePaginator
+
+    def get_validators(self) -> typing.Optional[typing.List[Fingerprint]]:
+        if not Topic.objects.filter(slug__iexact=self.kwargs.get('slug', '')).exists():
+            return None
+        articles = Article.objects.filter(topic__slug__iexact=self.kwargs['slug'], draft=False)
+        return self.paginator.window(articles, self.request).versions()
 
     def get_queryset(self):
         topic = get_object_or_404(Topic, slug__iexact=self.kwargs.get('slug', ''))
-        return topic.get_articles()
+        return topic.get_articles().for_listing()
 
 
 class TopicUpdateAPIView(APIView):